@@ -8,7 +8,7 @@ from src.streamlit_components.get_medals import create_medal_scoring
 from src.scoring import get_team_medals
 import pandas as pd
 from src.app_tools.json_loader import load_json_file
-from src.app_tools.streamlit_csv_loader import load_csv_with_error_handling
+from src.data_prep.player_store import load_player_stat_tensor
 from src.streamlit_components.page_configuration import (
     hide_streamlit_deploy_button,
     create_streamlit_header_with_logo,
@@ -28,8 +28,7 @@ training_meta = load_json_file(file_path)
 current_gameweek = training_meta["training_data_gameweek"]
 
 # Load player data
-file_path = f"data/vaastav-data/player_data_{current_season_year}.csv"
-player_data = load_csv_with_error_handling(file_path)
+player_data = load_player_stat_tensor(current_season_year=current_season_year)
 
 # Page config
 title = "FPL Manager Medals: Team"
@@ -1,11 +1,21 @@
-from src.data_prep.create_sample import get_all_data_sample
+from src.data_prep.create_sample import get_all_data_sample, get_data_sample_chunks
 from src.data_prep.load_data import (
     get_boostrap_data,
-    get_player_data,
+    update_player_data,
     get_current_season_year,
 )
+from src.data_prep.player_store import (
+    build_player_stat_tensor,
+    get_player_store_path,
+    get_player_tensor_path,
+    write_player_stat_tensor,
+    write_player_store,
+)
 from src.profiling.create_lookup_tables import (
     create_lookup_tables_aggregated,
+    create_lookup_tables_from_sketch,
+    merge_profile_sketches,
+    update_profile_sketch,
 )
 from src.app_tools.yaml_loader import load_yaml_file
 import pandas as pd
@@ -18,7 +28,9 @@ bootstrap_data = get_boostrap_data()
 
 # Get player data
 current_season_year = get_current_season_year(bootstrap_data=bootstrap_data)
-player_data, current_gameweek = get_player_data(current_season_year=current_season_year)
+player_data, current_gameweek = update_player_data(
+    current_season_year=current_season_year
+)
 
 ### Check if data updated:
 # Load metadata for scoring
@@ -41,22 +53,11 @@ with open(file_path, "w") as file:
 
 # Store gameweek player data for scoring if season has started
 if isinstance(player_data, pd.DataFrame):  # i.e. season has started
-    file_path = f"data/vaastav-data/player_data_{current_season_year}.csv"
-    player_data.to_csv(file_path)
-
-
-# Get sample data
-sample_data = get_all_data_sample(
-    bootstrap_data=bootstrap_data,
-    current_gameweek=current_gameweek,
-    player_data=player_data,
-)
-
-df = pd.DataFrame(sample_data)
-
-# Save DataFrame as CSV
-file_path = f"data/sample/team_sample_data.csv"
-df.to_csv(file_path, index=False)
+    file_path = get_player_store_path(current_season_year=current_season_year)
+    write_player_store(player_data=player_data, file_path=file_path)
+    player_data = build_player_stat_tensor(player_data=player_data)
+    dir_path = get_player_tensor_path(current_season_year=current_season_year)
+    write_player_stat_tensor(player_stat_tensor=player_data, dir_path=dir_path)
 
 
 ### Profiling
@@ -65,10 +66,69 @@ df.to_csv(file_path, index=False)
 yaml_file_path = "conf/impute_nulls.yaml"
 impute_nulls = load_yaml_file(yaml_file_path)
 
+# Get profiling config
+yaml_file_path = "conf/parameters.yaml"
+config = load_yaml_file(yaml_file_path)
+profiling_config = config["profiling"]
+random_seed = config["random_seed"]
+
+sample_file_path = f"data/sample/team_sample_data.csv"
+
 # Create profile distribution tables
-lookup_table_numeric, lookup_table_categorical = create_lookup_tables_aggregated(
-    df=df, impute_nulls=impute_nulls
-)
+if profiling_config["method"] == "sketch":
+    # Stream the sample into bounded-size sketches, holding one chunk of teams at a time
+    profile_sketch = {}
+    sample_chunks = get_data_sample_chunks(
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+        chunk_size=profiling_config["sketch_chunk_size"],
+    )
+    for chunk_index, sample_chunk in enumerate(sample_chunks):
+        # Append the chunk to the sample CSV
+        pd.DataFrame(sample_chunk).to_csv(
+            sample_file_path,
+            mode="w" if chunk_index == 0 else "a",
+            header=chunk_index == 0,
+            index=False,
+        )
+
+        # Seed the sketches so the lookup tables are reproducible
+        chunk_sketch = {}
+        for team_data in sample_chunk:
+            update_profile_sketch(
+                profile_sketch=chunk_sketch,
+                team_data=team_data,
+                impute_nulls=impute_nulls,
+                k=profiling_config["sketch_k"],
+                seed=random_seed + chunk_index,
+            )
+        merge_profile_sketches(
+            profile_sketch=profile_sketch,
+            other_profile_sketch=chunk_sketch,
+            seed=random_seed,
+        )
+        del sample_chunk, chunk_sketch
+
+    lookup_table_numeric, lookup_table_categorical = create_lookup_tables_from_sketch(
+        profile_sketch=profile_sketch
+    )
+else:
+    # Get sample data
+    sample_data = get_all_data_sample(
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+    )
+
+    df = pd.DataFrame(sample_data)
+
+    # Save DataFrame as CSV
+    df.to_csv(sample_file_path, index=False)
+
+    lookup_table_numeric, lookup_table_categorical = create_lookup_tables_aggregated(
+        df=df, impute_nulls=impute_nulls
+    )
 
 # Save DataFrame as CSVs
 lookup_table_numeric.to_csv(
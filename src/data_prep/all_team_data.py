@@ -1,19 +1,62 @@
-from src.data_prep.team_summary_processing import get_team_summary
+from src.data_prep.team_summary_processing import (
+    get_team_summary,
+    get_team_summary_batch,
+)
 from src.data_prep.load_data import get_team_data
 from src.app_tools.yaml_loader import load_yaml_file
 from src.data_prep.load_data import (
     get_team_gw_data,
+    get_team_data_async,
+    get_team_gw_data_async,
     get_favourite_team,
 )
 from src.data_prep.team_gameweek_processing import (
     get_player_gameweek_totals,
+    get_player_gameweek_totals_batch,
     get_season_gameweek_overview,
+    get_season_gameweek_overview_batch,
 )
+from src.data_prep.compact_picks import stack_compact_team_gw_picks
+import pandas as pd
 
 # Get config
 yaml_file_path = "conf/rival_teams.yaml"
 rival_teams = load_yaml_file(yaml_file_path)
 
+# Errors raised by malformed data of a team (including unparseable kit strings), which
+# are isolated to that team in batch processing
+TEAM_DATA_ERRORS = (KeyError, TypeError, ValueError, SyntaxError)
+
+# Values used when a team has not appeared in previous gameweeks
+DEFAULT_PLAYER_GAMEWEEK_TOTALS = {
+    "assists": 0,
+    "bonus": 0,
+    "bps": 0,
+    "clean_sheets": 0,
+    "goals_conceded": 0,
+    "goals_scored": 0,
+    "own_goals": 0,
+    "penalties_missed": 0,
+    "penalties_saved": 0,
+    "red_cards": 0,
+    "yellow_cards": 0,
+    "saves": 0,
+    "rival_team_player": 0,
+    "total_players_starters": 0,
+    "total_players_all": 0,
+    "rival_team_player_categorical": "No historical GW Data",
+}
+DEFAULT_SEASON_OVERVIEW = {
+    "points_on_bench_total": 0,
+    "event_transfers_total": 0,
+    "event_transfers_cost_total": 0,
+    "bank_mean": 0,
+    "bank_latest": 0,
+    "value_latest": 0,
+    "total_points_latest": 0,
+    "points_on_bench_percentage": 0,
+}
+
 
 def get_all_team_data(team_id, bootstrap_data, current_gameweek, player_data):
     """
@@ -28,8 +71,8 @@ def get_all_team_data(team_id, bootstrap_data, current_gameweek, player_data):
         A dictionary containing general information needed to retrieve team-specific data.
     current_gameweek : int
         The current gameweek number for which data is being processed.
-    player_data : pd.DataFrame
-        A DataFrame containing player-specific data relevant to the current gameweek.
+    player_data : dict
+        The player stat tensor for the current season (see `build_player_stat_tensor`).
 
     Returns
     -------
@@ -40,16 +83,173 @@ def get_all_team_data(team_id, bootstrap_data, current_gameweek, player_data):
         combined with additional information like the favorite team.
     """
     # Load all team data
+    team_data, team_history_data, team_gw_picks = fetch_all_team_data(
+        team_id=team_id, current_gameweek=current_gameweek
+    )
+
+    return process_all_team_data(
+        team_data=team_data,
+        team_history_data=team_history_data,
+        team_gw_picks=team_gw_picks,
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+    )
+
+
+async def get_all_team_data_async(
+    team_id, bootstrap_data, current_gameweek, player_data
+):
+    """
+    Asynchronous equivalent of `get_all_team_data`. Only the fetching is asynchronous, the
+    processing of the fetched data is the same.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier of the team.
+    bootstrap_data : dict
+        A dictionary containing general information needed to retrieve team-specific data.
+    current_gameweek : int
+        The current gameweek number for which data is being processed.
+    player_data : dict
+        The player stat tensor for the current season (see `build_player_stat_tensor`).
+
+    Returns
+    -------
+    team_name : str
+        The name of the team.
+    all_team_data : dict
+        A dictionary containing the team's summary, gameweek performance, and season overview data.
+    """
+    team_data, team_history_data, team_gw_picks = await fetch_all_team_data_async(
+        team_id=team_id, current_gameweek=current_gameweek
+    )
+
+    return process_all_team_data(
+        team_data=team_data,
+        team_history_data=team_history_data,
+        team_gw_picks=team_gw_picks,
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+    )
+
+
+def fetch_all_team_data(team_id, current_gameweek, compact=False):
+    """
+    Fetches the team data, history and gameweek picks for a team.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier of the team.
+    current_gameweek : int
+        The current gameweek number for which data is being processed.
+    compact : bool, optional
+        Whether to return the picks as compact arrays (see `build_compact_team_gw_picks`). Default is False.
+
+    Returns
+    -------
+    team_data : dict
+        A dictionary containing the team data from the Fantasy Premier League API.
+    team_history_data : dict
+        A dictionary containing the team's history data.
+    team_gw_picks : pd.DataFrame, dict, str or None
+        A DataFrame or the compact arrays containing the gameweek picks for the team, "Season Not Started",
+        or None if the picks could not be fetched.
+    """
     team_data, team_history_data = get_team_data(team_id=team_id)
+    try:
+        team_gw_picks = get_team_gw_data(
+            team_id=team_id,
+            team_history_data=team_history_data,
+            current_gameweek=current_gameweek,
+            compact=compact,
+        )
+    except TEAM_DATA_ERRORS as e:
+        # The team is processed with the default gameweek values
+        print(f"Error fetching picks for team {team_id}: {e}")
+        team_gw_picks = None
+    return team_data, team_history_data, team_gw_picks
+
+
+async def fetch_all_team_data_async(team_id, current_gameweek, compact=False):
+    """
+    Asynchronous equivalent of `fetch_all_team_data`.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier of the team.
+    current_gameweek : int
+        The current gameweek number for which data is being processed.
+    compact : bool, optional
+        Whether to return the picks as compact arrays (see `build_compact_team_gw_picks`). Default is False.
+
+    Returns
+    -------
+    team_data : dict
+        A dictionary containing the team data from the Fantasy Premier League API.
+    team_history_data : dict
+        A dictionary containing the team's history data.
+    team_gw_picks : pd.DataFrame, dict, str or None
+        A DataFrame or the compact arrays containing the gameweek picks for the team, "Season Not Started",
+        or None if the picks could not be fetched.
+    """
+    team_data, team_history_data = await get_team_data_async(team_id=team_id)
+    try:
+        team_gw_picks = await get_team_gw_data_async(
+            team_id=team_id,
+            team_history_data=team_history_data,
+            current_gameweek=current_gameweek,
+            compact=compact,
+        )
+    except TEAM_DATA_ERRORS as e:
+        # The team is processed with the default gameweek values
+        print(f"Error fetching picks for team {team_id}: {e}")
+        team_gw_picks = None
+    return team_data, team_history_data, team_gw_picks
+
+
+def process_all_team_data(
+    team_data,
+    team_history_data,
+    team_gw_picks,
+    bootstrap_data,
+    current_gameweek,
+    player_data,
+):
+    """
+    Processes the fetched data for a team into the summary, gameweek performance and season overview data.
+
+    Parameters
+    ----------
+    team_data : dict
+        A dictionary containing the team data from the Fantasy Premier League API.
+    team_history_data : dict
+        A dictionary containing the team's history data.
+    team_gw_picks : pd.DataFrame
+        A DataFrame containing the gameweek picks for the team.
+    bootstrap_data : dict
+        A dictionary containing general information needed to retrieve team-specific data.
+    current_gameweek : int
+        The current gameweek number for which data is being processed.
+    player_data : dict
+        The player stat tensor for the current season (see `build_player_stat_tensor`).
+
+    Returns
+    -------
+    team_name : str
+        The name of the team.
+    all_team_data : dict
+        A dictionary containing the team's summary, gameweek performance, and season overview data,
+        combined with additional information like the favorite team.
+    """
     team_name = team_data["name"]
     favourite_team = get_favourite_team(
         bootstrap_data=bootstrap_data, team_data=team_data
     )
-    team_gw_picks = get_team_gw_data(
-        team_id=team_id,
-        team_history_data=team_history_data,
-        current_gameweek=current_gameweek,
-    )
 
     # Get team summary
     team_summary_data = get_team_summary(
@@ -70,34 +270,8 @@ def get_all_team_data(team_id, bootstrap_data, current_gameweek, player_data):
             team_history_data=team_history_data, current_gameweek=current_gameweek
         )
     except:  # team has not appeared in previous gameweeks
-        player_gameweek_totals = {
-            "assists": 0,
-            "bonus": 0,
-            "bps": 0,
-            "clean_sheets": 0,
-            "goals_conceded": 0,
-            "goals_scored": 0,
-            "own_goals": 0,
-            "penalties_missed": 0,
-            "penalties_saved": 0,
-            "red_cards": 0,
-            "yellow_cards": 0,
-            "saves": 0,
-            "rival_team_player": 0,
-            "total_players_starters": 0,
-            "total_players_all": 0,
-            "rival_team_player_categorical": "No historical GW Data",
-        }
-        current_season_overview_output = {
-            "points_on_bench_total": 0,
-            "event_transfers_total": 0,
-            "event_transfers_cost_total": 0,
-            "bank_mean": 0,
-            "bank_latest": 0,
-            "value_latest": 0,
-            "total_points_latest": 0,
-            "points_on_bench_percentage": 0,
-        }
+        player_gameweek_totals = DEFAULT_PLAYER_GAMEWEEK_TOTALS.copy()
+        current_season_overview_output = DEFAULT_SEASON_OVERVIEW.copy()
 
     # Combine data
     all_team_data = {
@@ -109,3 +283,200 @@ def get_all_team_data(team_id, bootstrap_data, current_gameweek, player_data):
     all_team_data["favourite_team"] = favourite_team
 
     return team_name, all_team_data
+
+
+def process_all_team_data_batch(
+    fetched_team_data, bootstrap_data, current_gameweek, player_data
+):
+    """
+    Batch version of `process_all_team_data`, processing the fetched data for many teams at once.
+
+    The team summaries, gameweek performance and season overview are calculated for all teams
+    together. Teams for which these cannot be calculated get the same
+    default values as in `process_all_team_data`.
+
+    Parameters
+    ----------
+    fetched_team_data : dict
+        A dictionary mapping each team ID to its (team_data, team_history_data, team_gw_picks), as
+        returned by `fetch_all_team_data` with compact picks.
+    bootstrap_data : dict
+        A dictionary containing general information needed to retrieve team-specific data.
+    current_gameweek : int
+        The current gameweek number for which data is being processed.
+    player_data : dict
+        The player stat tensor for the current season (see `build_player_stat_tensor`).
+
+    Returns
+    -------
+    all_team_data : dict
+        A dictionary mapping each team ID to its team name and combined data. Teams whose data could
+        not be processed are logged and left out.
+    """
+    team_ids = []
+    team_names = []
+    team_data_list = []
+    team_history_data_list = []
+    favourite_teams = []
+    team_compact_picks = []
+    team_history_records = []
+    team_history_index = []
+    teams_with_picks = set()
+    for team_id, fetched_data in fetched_team_data.items():
+        team_data, team_history_data, team_gw_picks = fetched_data
+        try:
+            team_name = team_data["name"]
+            favourite_team = get_favourite_team(
+                bootstrap_data=bootstrap_data, team_data=team_data
+            )
+
+            # Teams without history data cannot be summarised
+            team_history_data["past"]
+        except TypeError as e:
+            print(f"Error processing team {team_id}: {e}")
+            continue
+
+        team_index = len(team_ids)
+        team_ids.append(team_id)
+        team_names.append(team_name)
+        team_data_list.append(team_data)
+        team_history_data_list.append(team_history_data)
+        favourite_teams.append(favourite_team)
+        if isinstance(team_gw_picks, dict):
+            team_compact_picks.append(team_gw_picks)
+            teams_with_picks.add(team_index)
+        else:
+            team_compact_picks.append(None)
+        try:
+            current_season_history = list(team_history_data["current"])
+        except TEAM_DATA_ERRORS:
+            current_season_history = []
+        team_history_records.extend(current_season_history)
+        team_history_index.extend([team_index] * len(current_season_history))
+
+    all_team_indices = list(range(len(team_ids)))
+
+    def get_team_summaries(team_indices):
+        team_summaries = get_team_summary_batch(
+            team_data_list=[team_data_list[i] for i in team_indices],
+            team_history_data_list=[team_history_data_list[i] for i in team_indices],
+        )
+        return dict(zip(team_indices, team_summaries))
+
+    def get_player_gameweek_totals_for_teams(team_indices):
+        player_gameweek_totals = get_player_gameweek_totals_batch(
+            player_data=player_data,
+            team_gw_picks=stack_compact_team_gw_picks(
+                [team_compact_picks[i] for i in team_indices]
+            ),
+            favourite_teams=[favourite_teams[i] for i in team_indices],
+            rival_teams=rival_teams,
+        )
+        return {
+            team_indices[position]: totals
+            for position, totals in player_gameweek_totals.to_dict(
+                orient="index"
+            ).items()
+        }
+
+    def get_season_overviews(team_indices):
+        selected_teams = set(team_indices)
+        history_positions = [
+            i
+            for i, team_index in enumerate(team_history_index)
+            if team_index in selected_teams
+        ]
+        return get_season_gameweek_overview_batch(
+            team_history=pd.DataFrame(
+                [team_history_records[i] for i in history_positions]
+            ).assign(team_index=[team_history_index[i] for i in history_positions]),
+            current_gameweek=current_gameweek,
+        ).to_dict(orient="index")
+
+    # Get team summaries, teams whose summary fails are left out
+    team_summaries = process_teams_isolated(
+        process_teams=get_team_summaries,
+        team_indices=all_team_indices,
+        team_ids=team_ids,
+    )
+
+    # Teams missing from these results have not appeared in previous gameweeks
+    player_gameweek_totals = process_teams_isolated(
+        process_teams=get_player_gameweek_totals_for_teams,
+        team_indices=[i for i in all_team_indices if i in teams_with_picks],
+        team_ids=team_ids,
+    )
+    teams_with_history = set(team_history_index)
+    current_season_overview_output = process_teams_isolated(
+        process_teams=get_season_overviews,
+        team_indices=[i for i in all_team_indices if i in teams_with_history],
+        team_ids=team_ids,
+    )
+
+    all_team_data = {}
+    for team_index, team_id in enumerate(team_ids):
+        if team_index not in team_summaries:
+            continue
+
+        if (
+            team_index in teams_with_picks
+            and team_index in player_gameweek_totals
+            and team_index in current_season_overview_output
+        ):
+            team_player_gameweek_totals = player_gameweek_totals[team_index]
+            team_season_overview_output = current_season_overview_output[team_index]
+        else:
+            team_player_gameweek_totals = DEFAULT_PLAYER_GAMEWEEK_TOTALS
+            team_season_overview_output = DEFAULT_SEASON_OVERVIEW
+
+        # Combine data
+        combined_team_data = {
+            **team_summaries[team_index],
+            **team_player_gameweek_totals,
+            **team_season_overview_output,
+        }
+
+        combined_team_data["favourite_team"] = favourite_teams[team_index]
+
+        all_team_data[team_id] = (team_names[team_index], combined_team_data)
+
+    return all_team_data
+
+
+def process_teams_isolated(process_teams, team_indices, team_ids):
+    """
+    Runs a batch processing step for many teams, isolating teams with malformed data.
+
+    The step is run for all teams at once. If it fails on malformed data, it is rerun team by
+    team, so only the failing teams are left out of the results. Other errors are raised.
+
+    Parameters
+    ----------
+    process_teams : callable
+        A function taking a list of team indices and returning a dictionary mapping team indices
+        to their results.
+    team_indices : list of int
+        The indices of the teams to process.
+    team_ids : list of int
+        The ID of each team, by team index, used for logging.
+
+    Returns
+    -------
+    results : dict
+        A dictionary mapping the team index of each team processed to its result.
+    """
+    if len(team_indices) == 0:
+        return {}
+
+    try:
+        return process_teams(team_indices)
+    except TEAM_DATA_ERRORS:
+        pass
+
+    results = {}
+    for team_index in team_indices:
+        try:
+            results.update(process_teams([team_index]))
+        except TEAM_DATA_ERRORS as e:
+            print(f"Error processing team {team_ids[team_index]}: {e}")
+    return results
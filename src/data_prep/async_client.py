@@ -0,0 +1,220 @@
+import asyncio
+import copy
+import json
+import weakref
+
+import aiohttp
+
+from src.data_prep.http_client import (
+    RETRY_STATUS_CODES,
+    get_backoff_delay,
+    http_config,
+    parse_retry_after,
+)
+from src.data_prep.http_fixtures import (
+    fixtures_mode,
+    get_replay_response_async,
+    record_response,
+)
+from src.data_prep.rate_limiter import rate_limiter
+
+# Session and concurrency limit for each running event loop
+_loop_state = weakref.WeakKeyDictionary()
+
+
+def get_async_state():
+    """
+    Returns the aiohttp session, concurrency semaphore and in-flight requests for the running
+    event loop.
+
+    These are created on first use within a loop and kept per loop. The semaphore caps the number
+    of requests in flight across every coroutine on that loop, regardless of how many are awaiting.
+
+    Returns
+    -------
+    session : aiohttp.ClientSession
+        The shared session for the running event loop.
+    semaphore : asyncio.Semaphore
+        The semaphore limiting the number of requests in flight.
+    in_flight : dict
+        The requests currently in flight, keyed by URL.
+    """
+    loop = asyncio.get_running_loop()
+    state = _loop_state.get(loop)
+    if state is None:
+        max_in_flight = http_config["async_max_in_flight"]
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max_in_flight),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=http_config["connect_timeout"],
+                sock_read=http_config["read_timeout"],
+            ),
+        )
+        state = (session, asyncio.Semaphore(max_in_flight), {})
+        _loop_state[loop] = state
+    return state
+
+
+async def close_async_session():
+    """
+    Closes the aiohttp session for the running event loop, if one was created.
+
+    Returns
+    -------
+    None
+    """
+    state = _loop_state.pop(asyncio.get_running_loop(), None)
+    if state is not None:
+        await state[0].close()
+
+
+def run_async(coroutine):
+    """
+    Runs a coroutine to completion from synchronous code, closing the session afterwards.
+
+    Parameters
+    ----------
+    coroutine : coroutine
+        The coroutine to run.
+
+    Returns
+    -------
+    any
+        The result of the coroutine.
+    """
+
+    async def runner():
+        try:
+            return await coroutine
+        finally:
+            await close_async_session()
+
+    return asyncio.run(runner())
+
+
+async def fetch_json_async(url):
+    """
+    Fetches JSON data from a URL, sharing the request with any concurrent callers for the same URL.
+
+    This mirrors `http_client.fetch_json`: callers arriving while a request for the same URL is in
+    flight on the running event loop await that request and receive a copy of its result.
+
+    Parameters
+    ----------
+    url : str
+        The URL to fetch data from.
+
+    Returns
+    -------
+    data : dict or None
+        The JSON data retrieved from the URL, or None if the request did not succeed.
+    """
+    in_flight = get_async_state()[2]
+    task = in_flight.get(url)
+    if task is not None:
+        return copy.deepcopy(await asyncio.shield(task))
+
+    task = asyncio.ensure_future(request_json_async(url))
+    in_flight[url] = task
+    task.add_done_callback(lambda _: in_flight.pop(url, None))
+    return await asyncio.shield(task)
+
+
+async def request_json_async(url):
+    """
+    Requests JSON data from a URL using the shared aiohttp session, retrying on failures.
+
+    This mirrors `http_client.request_json`, waiting for the shared rate limiter before each
+    attempt and retrying connection errors, timeouts and retryable status codes with jittered
+    exponential backoff.
+
+    Parameters
+    ----------
+    url : str
+        The URL to fetch data from.
+
+    Returns
+    -------
+    data : dict or None
+        The JSON data retrieved from the URL, or None if the request did not succeed.
+    """
+    session, semaphore, _ = get_async_state()
+    max_retries = http_config["max_retries"]
+
+    for attempt in range(max_retries + 1):
+        await rate_limiter.acquire_async()
+        try:
+            async with semaphore:
+                status, retry_after, body = await get_response_async(session, url)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == max_retries:
+                return None
+            await asyncio.sleep(get_backoff_delay(attempt))
+            continue
+
+        if status < 400:
+            rate_limiter.on_success()
+            try:
+                return json.loads(body)
+            except ValueError:
+                return None
+
+        if status == 429:
+            rate_limiter.on_rate_limited()
+
+        if status not in RETRY_STATUS_CODES or attempt == max_retries:
+            return None
+
+        await asyncio.sleep(get_backoff_delay(attempt, retry_after))
+
+    return None
+
+
+async def get_response_async(session, url):
+    """
+    Makes a single request for a URL, honouring the configured fixtures mode.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to make live requests with.
+    url : str
+        The URL to request.
+
+    Returns
+    -------
+    status : int
+        The HTTP status code of the response.
+    retry_after : float or None
+        Seconds requested by the server via the Retry-After header.
+    body : str
+        The body of the response.
+    """
+    if fixtures_mode == "replay":
+        status, body = await get_replay_response_async(url)
+        return status, None, body
+
+    async with session.get(url) as response:
+        body = await response.text()
+        if fixtures_mode == "record":
+            record_response(url, response.status, body)
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return response.status, retry_after, body
+
+
+async def fetch_urls_async(urls):
+    """
+    Fetches multiple URLs concurrently on the running event loop.
+
+    Parameters
+    ----------
+    urls : list
+        A list of URLs to fetch.
+
+    Returns
+    -------
+    results : list
+        The fetched results in the same order as `urls`, with None for failed requests.
+    """
+    results = await asyncio.gather(*(fetch_json_async(url) for url in urls))
+    return list(results)
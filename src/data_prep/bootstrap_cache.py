@@ -0,0 +1,167 @@
+import json
+import os
+import threading
+import time
+
+from src.app_tools.yaml_loader import load_yaml_file
+
+# Get config
+yaml_file_path = "conf/parameters.yaml"
+config = load_yaml_file(yaml_file_path)
+
+bootstrap_cache_ttl_seconds = config["bootstrap_cache"]["ttl_seconds"]
+bootstrap_cache_path = config["bootstrap_cache"]["path"]
+
+# Process-wide cache shared by every Streamlit session and script rerun
+_cache = {"data": None, "fetched_at": 0.0, "refreshing": False}
+_cache_lock = threading.Lock()
+
+
+def load_persisted_bootstrap_data(cache_path):
+    """
+    Loads the persisted copy of the bootstrap static data.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path to the persisted JSON file.
+
+    Returns
+    -------
+    bootstrap_data : dict or None
+        The persisted bootstrap data, or None if there is no valid copy.
+    fetched_at : float
+        The time the persisted copy was written, as a Unix timestamp.
+    """
+    try:
+        with open(cache_path, "r") as file:
+            bootstrap_data = json.load(file)
+        fetched_at = os.path.getmtime(cache_path)
+    except (OSError, ValueError):
+        return None, 0.0
+    return bootstrap_data, fetched_at
+
+
+def persist_bootstrap_data(bootstrap_data, cache_path):
+    """
+    Writes the bootstrap static data to disk so that new processes can start from it.
+
+    Parameters
+    ----------
+    bootstrap_data : dict
+        The bootstrap static data.
+    cache_path : str
+        Path to the persisted JSON file.
+
+    Returns
+    -------
+    None
+    """
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w") as file:
+            json.dump(bootstrap_data, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Persisting is best effort, e.g. on read-only file systems
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def refresh_bootstrap_data(fetch_function, cache_path):
+    """
+    Fetches the bootstrap static data and stores it in the cache.
+
+    Parameters
+    ----------
+    fetch_function : callable
+        Function returning the bootstrap static data from the API, or None on failure.
+    cache_path : str
+        Path to the persisted JSON file.
+
+    Returns
+    -------
+    bootstrap_data : dict or None
+        The fetched bootstrap data, or None if the fetch failed.
+    """
+    try:
+        bootstrap_data = fetch_function()
+        if bootstrap_data is not None:
+            with _cache_lock:
+                _cache["data"] = bootstrap_data
+                _cache["fetched_at"] = time.time()
+            persist_bootstrap_data(bootstrap_data, cache_path)
+    finally:
+        with _cache_lock:
+            _cache["refreshing"] = False
+    return bootstrap_data
+
+
+def get_cached_bootstrap_data(
+    fetch_function,
+    ttl_seconds=bootstrap_cache_ttl_seconds,
+    cache_path=bootstrap_cache_path,
+):
+    """
+    Returns the bootstrap static data from the process-wide cache.
+
+    On a cold start the persisted copy is used if it is still fresh, otherwise the data is
+    fetched. Once the in-memory data is older than `ttl_seconds` it is still returned, and a
+    refresh is started in a background thread so callers do not wait on the download.
+
+    Parameters
+    ----------
+    fetch_function : callable
+        Function returning the bootstrap static data from the API, or None on failure.
+    ttl_seconds : float, optional
+        How long cached data is considered fresh.
+    cache_path : str, optional
+        Path to the persisted JSON file.
+
+    Returns
+    -------
+    bootstrap_data : dict or None
+        The bootstrap static data.
+    """
+    persisted_data = None
+    with _cache_lock:
+        if _cache["data"] is None:
+            persisted_data, fetched_at = load_persisted_bootstrap_data(cache_path)
+            if time.time() - fetched_at <= ttl_seconds:
+                _cache["data"], _cache["fetched_at"] = persisted_data, fetched_at
+        bootstrap_data = _cache["data"]
+        is_stale = time.time() - _cache["fetched_at"] > ttl_seconds
+        start_refresh = (
+            bootstrap_data is not None and is_stale and not _cache["refreshing"]
+        )
+        if start_refresh:
+            _cache["refreshing"] = True
+
+    if bootstrap_data is None:
+        # Nothing fresh to serve yet, so fetch in the foreground and only fall back to
+        # an out of date persisted copy if the API is unavailable
+        bootstrap_data = refresh_bootstrap_data(fetch_function, cache_path)
+        return bootstrap_data if bootstrap_data is not None else persisted_data
+
+    if start_refresh:
+        threading.Thread(
+            target=refresh_bootstrap_data,
+            args=(fetch_function, cache_path),
+            daemon=True,
+        ).start()
+
+    return bootstrap_data
+
+
+def clear_bootstrap_cache():
+    """
+    Clears the in-memory bootstrap cache. The persisted copy is left in place.
+
+    Returns
+    -------
+    None
+    """
+    with _cache_lock:
+        _cache["data"] = None
+        _cache["fetched_at"] = 0.0
+        _cache["refreshing"] = False
@@ -0,0 +1,133 @@
+import numpy as np
+
+# Shape of a team's picks: one row per gameweek (indexed by gameweek number) and one column per squad position.
+# Gameweeks with more picks than a squad (e.g. the Assistant Manager chip adds
+# position 16) widen the position axis to fit.
+MAX_GAMEWEEK = 38
+PICKS_PER_GAMEWEEK = 15
+
+# Bits of the pick flags, the multiplier (0 to 3) is held in the two bits from MULTIPLIER_SHIFT
+CAPTAIN_FLAG = 1
+VICE_CAPTAIN_FLAG = 2
+BBOOST_FLAG = 4
+MULTIPLIER_SHIFT = 3
+
+
+def build_compact_team_gw_picks(gw_picks, bboost_gw, max_gameweek=MAX_GAMEWEEK):
+    """
+    Builds the compact array representation of a team's picks from the raw picks of each gameweek.
+
+    Element ids are held in a (gameweek, position) array, with 0 where there is no pick. The
+    captaincy, vice-captaincy, bench boost and multiplier of each pick are bit-packed into a
+    matching array of flags.
+
+    Parameters
+    ----------
+    gw_picks : dict
+        A dictionary where keys are gameweek numbers and values are the list of picks for that gameweek.
+    bboost_gw : int or None
+        The gameweek number when the Bench Boost chip was used, or None if it was not used.
+    max_gameweek : int, optional
+        The last gameweek of the season. Default is 38.
+
+    Returns
+    -------
+    compact_picks : dict
+        A dictionary containing:
+        - "element": uint16 array of shape (max_gameweek + 1, positions) with the element id of each pick,
+          where positions is the highest pick position, and at least 15.
+        - "flags": uint8 array of the same shape with the flags of each pick.
+    """
+    positions = max(
+        [PICKS_PER_GAMEWEEK]
+        + [pick["position"] for picks in gw_picks.values() for pick in picks]
+    )
+    element = np.zeros((max_gameweek + 1, positions), dtype=np.uint16)
+    flags = np.zeros((max_gameweek + 1, positions), dtype=np.uint8)
+
+    for gw, picks in gw_picks.items():
+        bboost_flag = BBOOST_FLAG if gw == bboost_gw else 0
+        for pick in picks:
+            slot = pick["position"] - 1
+            element[gw, slot] = pick["element"]
+            flags[gw, slot] = (
+                (CAPTAIN_FLAG if pick["is_captain"] else 0)
+                | (VICE_CAPTAIN_FLAG if pick["is_vice_captain"] else 0)
+                | bboost_flag
+                | (pick["multiplier"] << MULTIPLIER_SHIFT)
+            )
+
+    compact_picks = {"element": element, "flags": flags}
+    return compact_picks
+
+
+def stack_compact_team_gw_picks(team_compact_picks, max_gameweek=MAX_GAMEWEEK):
+    """
+    Stacks the compact picks of many teams into (team, gameweek, position) arrays.
+
+    The position axis is as wide as the widest team's picks, with 0 in unused positions.
+
+    Parameters
+    ----------
+    team_compact_picks : list of dict or None
+        The compact picks of each team (see `build_compact_team_gw_picks`), or None for teams without picks.
+    max_gameweek : int, optional
+        The last gameweek of the season. Default is 38.
+
+    Returns
+    -------
+    compact_picks : dict
+        A dictionary with the same keys as `build_compact_team_gw_picks`, with a leading team axis.
+    """
+    positions = max(
+        [PICKS_PER_GAMEWEEK]
+        + [
+            team_picks["element"].shape[1]
+            for team_picks in team_compact_picks
+            if team_picks is not None
+        ]
+    )
+    shape = (len(team_compact_picks), max_gameweek + 1, positions)
+    compact_picks = {
+        "element": np.zeros(shape, dtype=np.uint16),
+        "flags": np.zeros(shape, dtype=np.uint8),
+    }
+    for team_index, team_picks in enumerate(team_compact_picks):
+        if team_picks is not None:
+            team_positions = team_picks["element"].shape[1]
+            compact_picks["element"][team_index, :, :team_positions] = team_picks[
+                "element"
+            ]
+            compact_picks["flags"][team_index, :, :team_positions] = team_picks["flags"]
+    return compact_picks
+
+
+def unpack_compact_picks(compact_picks):
+    """
+    Lists the picks held in stacked compact picks.
+
+    Parameters
+    ----------
+    compact_picks : dict
+        The stacked compact picks (see `stack_compact_team_gw_picks`).
+
+    Returns
+    -------
+    picks : dict
+        A dictionary of equal length arrays with the "team_index", "GW", "position", "element",
+        "multiplier", "is_captain", "is_vice_captain" and "bboost" of each pick.
+    """
+    team_index, gw, slot = np.nonzero(compact_picks["element"])
+    flags = compact_picks["flags"][team_index, gw, slot]
+
+    picks = {
+        "team_index": team_index,
+        "GW": gw,
+        "position": slot + 1,
+        "element": compact_picks["element"][team_index, gw, slot],
+        "multiplier": flags >> MULTIPLIER_SHIFT,
+        "is_captain": (flags & CAPTAIN_FLAG) != 0,
+        "is_vice_captain": (flags & VICE_CAPTAIN_FLAG) != 0,
+        "bboost": ((flags & BBOOST_FLAG) != 0).astype(np.int64),
+    }
+    return picks
@@ -1,9 +1,16 @@
 from src.data_prep.load_data import get_boostrap_data
 from src.app_tools.yaml_loader import load_yaml_file
-from src.data_prep.all_team_data import get_all_team_data
+from src.data_prep.all_team_data import (
+    TEAM_DATA_ERRORS,
+    fetch_all_team_data,
+    fetch_all_team_data_async,
+    process_all_team_data_batch,
+)
+from src.data_prep.async_client import run_async
+from src.data_prep.http_client import http_config
 import pandas as pd
+import asyncio
 import random
-import time
 
 # Get config
 yaml_file_path = "conf/parameters.yaml"
@@ -42,14 +49,16 @@ def get_all_data_sample(bootstrap_data, current_gameweek, player_data):
     """
     Retrieves data for a random sample of teams based on the provided bootstrap data, current gameweek, and player data.
 
+    The data for all teams is fetched first and then processed together in one batch.
+
     Parameters
     ----------
     bootstrap_data : dict
         A dictionary containing the bootstrap static data from the Fantasy Premier League API.
     current_gameweek : int
         The current gameweek number.
-    player_data : pd.DataFrame
-        A DataFrame containing player data for the current season.
+    player_data : dict
+        The player stat tensor for the current season.
 
     Returns
     -------
@@ -61,25 +70,177 @@ def get_all_data_sample(bootstrap_data, current_gameweek, player_data):
         training_sample_size=training_sample_size, random_seed=random_seed
     )
 
-    # Get data for each sample
-    all_data = []
+    all_data = get_data_sample(
+        sample_ids=sample_ids,
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+    )
+
+    return all_data
+
+
+def get_data_sample_chunks(bootstrap_data, current_gameweek, player_data, chunk_size):
+    """
+    Retrieves data for the random sample of teams in chunks, so only one chunk is held in memory.
+
+    The sampled teams are the same as `get_all_data_sample`, each chunk is fetched and processed
+    in one batch.
+
+    Parameters
+    ----------
+    bootstrap_data : dict
+        A dictionary containing the bootstrap static data from the Fantasy Premier League API.
+    current_gameweek : int
+        The current gameweek number.
+    player_data : dict
+        The player stat tensor for the current season.
+    chunk_size : int
+        The number of sampled teams in each chunk.
+
+    Yields
+    ------
+    chunk_data : list of dict
+        A list containing data for each sampled team in the chunk.
+    """
+    # Get random sample of ids
+    sample_ids = get_sample_ids(
+        training_sample_size=training_sample_size, random_seed=random_seed
+    )
+
+    for chunk_start in range(0, len(sample_ids), chunk_size):
+        yield get_data_sample(
+            sample_ids=sample_ids[chunk_start : chunk_start + chunk_size],
+            bootstrap_data=bootstrap_data,
+            current_gameweek=current_gameweek,
+            player_data=player_data,
+        )
+
+
+def get_data_sample(sample_ids, bootstrap_data, current_gameweek, player_data):
+    """
+    Fetches data for the given teams and processes it together in one batch.
+
+    Parameters
+    ----------
+    sample_ids : list of int
+        The team IDs to retrieve data for.
+    bootstrap_data : dict
+        A dictionary containing the bootstrap static data from the Fantasy Premier League API.
+    current_gameweek : int
+        The current gameweek number.
+    player_data : dict
+        The player stat tensor for the current season.
+
+    Returns
+    -------
+    all_data : list of dict
+        A list containing data for each team.
+    """
+    if http_config["engine"] == "asyncio":
+        fetched_team_data = run_async(
+            fetch_all_data_sample_async(
+                sample_ids=sample_ids, current_gameweek=current_gameweek
+            )
+        )
+    else:
+        fetched_team_data = fetch_all_data_sample(
+            sample_ids=sample_ids, current_gameweek=current_gameweek
+        )
+
+    # Process data for all samples
+    all_team_data = process_all_team_data_batch(
+        fetched_team_data=fetched_team_data,
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+    )
+    all_data = [team_data for team_name, team_data in all_team_data.values()]
+
+    return all_data
+
+
+def fetch_all_data_sample(sample_ids, current_gameweek, verbose=True):
+    """
+    Fetches data for the sampled teams one team at a time.
+
+    Parameters
+    ----------
+    sample_ids : list of int
+        The team IDs to retrieve data for.
+    current_gameweek : int
+        The current gameweek number.
+    verbose : bool, optional
+        Whether to log each team completed. Default is True.
+
+    Returns
+    -------
+    fetched_team_data : dict
+        A dictionary mapping each team ID to its fetched data (see `fetch_all_team_data`), in the order of
+        `sample_ids`. Teams whose data could not be fetched are left out.
+    """
+    fetched_team_data = {}
     counter = 0
     for team_id in sample_ids:
         try:
-            team_name, team_data = get_all_team_data(
-                team_id=team_id,
-                bootstrap_data=bootstrap_data,
-                current_gameweek=current_gameweek,
-                player_data=player_data,
+            fetched_team_data[team_id] = fetch_all_team_data(
+                team_id=team_id, current_gameweek=current_gameweek, compact=True
             )
-            all_data.append(team_data)
             counter += 1
-            print(f"Log: Team {counter} completed")
-            # Add a 0.2-second sleep every 50 iterations
-            if counter % 50 == 0:
-                time.sleep(0.2)
-        except TypeError as e:
+            if verbose:
+                print(f"Log: Team {counter} completed")
+        except TEAM_DATA_ERRORS as e:
             print(f"Error processing team {team_id}: {e}")
             continue  # Skip to the next iteration if an error occurs
 
-    return all_data
+    return fetched_team_data
+
+
+async def fetch_all_data_sample_async(sample_ids, current_gameweek, verbose=True):
+    """
+    Fetches data for the sampled teams concurrently on a single event loop.
+
+    All teams are scheduled at once, the number of requests in flight is bounded by the
+    asynchronous client's concurrency limit.
+
+    Parameters
+    ----------
+    sample_ids : list of int
+        The team IDs to retrieve data for.
+    current_gameweek : int
+        The current gameweek number.
+    verbose : bool, optional
+        Whether to log each team completed. Default is True.
+
+    Returns
+    -------
+    fetched_team_data : dict
+        A dictionary mapping each team ID to its fetched data (see `fetch_all_team_data`), in the order of
+        `sample_ids`. Teams whose data could not be fetched are left out.
+    """
+    counter = 0
+
+    async def fetch_team_sample(team_id):
+        nonlocal counter
+        try:
+            fetched_data = await fetch_all_team_data_async(
+                team_id=team_id, current_gameweek=current_gameweek, compact=True
+            )
+        except TEAM_DATA_ERRORS as e:
+            print(f"Error processing team {team_id}: {e}")
+            return None
+        counter += 1
+        if verbose:
+            print(f"Log: Team {counter} completed")
+        return fetched_data
+
+    results = await asyncio.gather(
+        *(fetch_team_sample(team_id) for team_id in sample_ids)
+    )
+
+    fetched_team_data = {
+        team_id: fetched_data
+        for team_id, fetched_data in zip(sample_ids, results)
+        if fetched_data is not None
+    }
+    return fetched_team_data
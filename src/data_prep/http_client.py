@@ -0,0 +1,255 @@
+import concurrent.futures
+import copy
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.app_tools.yaml_loader import load_yaml_file
+from src.data_prep.http_fixtures import RecordingAdapter, ReplayAdapter, fixtures_mode
+from src.data_prep.rate_limiter import rate_limiter
+
+# Get config
+yaml_file_path = "conf/parameters.yaml"
+config = load_yaml_file(yaml_file_path)
+
+http_config = config["http_client"]
+
+# Status codes worth retrying (rate limited or temporary server issues)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Requests currently in flight, keyed by URL
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Returns the shared requests session used for all FPL API calls.
+
+    The session is created once per process and keeps a pool of keep-alive connections
+    sized to the number of concurrent workers, so repeated calls to the API reuse
+    existing TCP/TLS connections rather than opening a new one per request. The transport
+    depends on the fixtures mode, see `get_transport_adapter`.
+
+    Returns
+    -------
+    requests.Session
+        The shared session.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = get_transport_adapter()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def get_transport_adapter():
+    """
+    Returns the transport adapter for the configured fixtures mode.
+
+    In "live" mode requests go to the network, "record" additionally stores each response in the
+    fixture store, and "replay" serves the stored responses without any network access.
+
+    Returns
+    -------
+    requests.adapters.BaseAdapter
+        The transport adapter to mount on the session.
+    """
+    if fixtures_mode == "replay":
+        return ReplayAdapter()
+
+    pool_kwargs = {
+        "pool_connections": http_config["max_workers"],
+        "pool_maxsize": http_config["max_workers"],
+        "pool_block": True,
+    }
+    if fixtures_mode == "record":
+        return RecordingAdapter(**pool_kwargs)
+    return HTTPAdapter(**pool_kwargs)
+
+
+def get_executor():
+    """
+    Returns the long-lived thread pool used for concurrent requests.
+
+    The pool is sized to match the session's connection pool and is shared by every batch of
+    requests in the process. Tasks submitted to it must not themselves wait on other tasks
+    submitted to it, otherwise the pool can deadlock once all workers are waiting.
+
+    Returns
+    -------
+    concurrent.futures.ThreadPoolExecutor
+        The shared executor.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=http_config["max_workers"],
+                    thread_name_prefix="fpl-http",
+                )
+    return _executor
+
+
+def parse_retry_after(retry_after):
+    """
+    Parses a Retry-After header value into a number of seconds.
+
+    Parameters
+    ----------
+    retry_after : str or None
+        The header value, either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    float or None
+        The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_time = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_time.tzinfo is None:
+        retry_time = retry_time.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_time - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_backoff_delay(attempt, retry_after=None):
+    """
+    Calculates how long to wait before retrying a request.
+
+    Uses exponential backoff with full jitter, unless the server specified a Retry-After value.
+
+    Parameters
+    ----------
+    attempt : int
+        The zero-based number of the attempt that just failed.
+    retry_after : float or None
+        Seconds requested by the server via the Retry-After header.
+
+    Returns
+    -------
+    float
+        The number of seconds to wait.
+    """
+    if retry_after is not None:
+        return min(retry_after, http_config["backoff_max"])
+
+    delay = min(http_config["backoff_max"], http_config["backoff_factor"] * 2**attempt)
+    return random.uniform(0, delay)
+
+
+def fetch_json(url):
+    """
+    Fetches JSON data from a URL, sharing the request with any concurrent callers for the same URL.
+
+    The first caller for a URL makes the request and any callers arriving while it is in flight
+    wait for, and receive a copy of, the same result instead of making their own request.
+
+    Parameters
+    ----------
+    url : str
+        The URL to fetch data from.
+
+    Returns
+    -------
+    data : dict or None
+        The JSON data retrieved from the URL, or None if the request did not succeed.
+    """
+    with _in_flight_lock:
+        future = _in_flight.get(url)
+        is_leader = future is None
+        if is_leader:
+            future = concurrent.futures.Future()
+            _in_flight[url] = future
+
+    if not is_leader:
+        # Callers may modify the returned data, so each follower gets its own copy
+        return copy.deepcopy(future.result())
+
+    try:
+        data = request_json(url)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(data)
+    finally:
+        with _in_flight_lock:
+            del _in_flight[url]
+
+    return data
+
+
+def request_json(url):
+    """
+    Requests JSON data from a URL using the shared session, retrying on failures.
+
+    Each attempt first waits for the shared rate limiter. Connection errors, timeouts and
+    retryable status codes (429 and 5xx) are retried up to `max_retries` times with jittered
+    exponential backoff.
+
+    Parameters
+    ----------
+    url : str
+        The URL to fetch data from.
+
+    Returns
+    -------
+    data : dict or None
+        The JSON data retrieved from the URL, or None if the request did not succeed.
+    """
+    session = get_session()
+    max_retries = http_config["max_retries"]
+    timeout = (http_config["connect_timeout"], http_config["read_timeout"])
+
+    for attempt in range(max_retries + 1):
+        rate_limiter.acquire()
+        try:
+            response = session.get(url, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                return None
+            time.sleep(get_backoff_delay(attempt))
+            continue
+
+        if response.ok:
+            rate_limiter.on_success()
+            try:
+                return response.json()
+            except ValueError:
+                return None
+
+        if response.status_code == 429:
+            rate_limiter.on_rate_limited()
+
+        if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        time.sleep(get_backoff_delay(attempt, retry_after))
+
+    return None
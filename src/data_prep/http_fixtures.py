@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.app_tools.yaml_loader import load_yaml_file
+
+# Get config
+yaml_file_path = "conf/parameters.yaml"
+config = load_yaml_file(yaml_file_path)
+
+fixtures_config = config["http_fixtures"]
+fixtures_mode = fixtures_config["mode"]
+fixtures_path = fixtures_config["path"]
+
+# Responses with these status codes are transient, so are never recorded
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def get_fixture_file_path(url, fixtures_path=fixtures_path):
+    """
+    Gets the path of the fixture file for a URL.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+    fixtures_path : str, optional
+        The directory holding the recorded fixtures.
+
+    Returns
+    -------
+    str
+        The path of the fixture file.
+    """
+    url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(fixtures_path, f"{url_hash}.json")
+
+
+def record_response(url, status_code, body, fixtures_path=fixtures_path):
+    """
+    Records a response in the fixture store.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+    status_code : int
+        The HTTP status code of the response.
+    body : str
+        The body of the response.
+    fixtures_path : str, optional
+        The directory holding the recorded fixtures.
+
+    Returns
+    -------
+    None
+    """
+    if status_code in TRANSIENT_STATUS_CODES:
+        return
+
+    os.makedirs(fixtures_path, exist_ok=True)
+    file_path = get_fixture_file_path(url, fixtures_path)
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as file:
+        json.dump({"url": url, "status_code": status_code, "body": body}, file)
+    os.replace(temp_path, file_path)
+
+
+def load_recorded_response(url, fixtures_path=fixtures_path):
+    """
+    Loads a recorded response from the fixture store.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+    fixtures_path : str, optional
+        The directory holding the recorded fixtures.
+
+    Returns
+    -------
+    status_code : int
+        The recorded HTTP status code, or 404 if the URL was not recorded.
+    body : str
+        The recorded body of the response.
+    """
+    try:
+        with open(get_fixture_file_path(url, fixtures_path), "r") as file:
+            fixture = json.load(file)
+    except FileNotFoundError:
+        return 404, ""
+    return fixture["status_code"], fixture["body"]
+
+
+def get_replay_response(url, fixtures_path=fixtures_path):
+    """
+    Gets the response to replay for a URL, applying the configured error injection.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+    fixtures_path : str, optional
+        The directory holding the recorded fixtures.
+
+    Returns
+    -------
+    status_code : int
+        The HTTP status code to replay.
+    body : str
+        The body to replay.
+    """
+    if random.random() < fixtures_config["replay_error_rate"]:
+        return fixtures_config["replay_error_status"], ""
+    return load_recorded_response(url, fixtures_path)
+
+
+def get_replay_latency():
+    """
+    Gets the simulated latency of a replayed request.
+
+    Returns
+    -------
+    float
+        The latency in seconds.
+    """
+    return fixtures_config["replay_latency_ms"] / 1000
+
+
+async def get_replay_response_async(url, fixtures_path=fixtures_path):
+    """
+    Asynchronous equivalent of `get_replay_response`, including the simulated latency.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+    fixtures_path : str, optional
+        The directory holding the recorded fixtures.
+
+    Returns
+    -------
+    status_code : int
+        The HTTP status code to replay.
+    body : str
+        The body to replay.
+    """
+    await asyncio.sleep(get_replay_latency())
+    return get_replay_response(url, fixtures_path)
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter serving recorded responses instead of making network requests.
+    """
+
+    def __init__(self, fixtures_path=fixtures_path):
+        super().__init__()
+        self.fixtures_path = fixtures_path
+
+    def send(self, request, **kwargs):
+        time.sleep(get_replay_latency())
+        status_code, body = get_replay_response(request.url, self.fixtures_path)
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Transport adapter making network requests and recording their responses.
+    """
+
+    def __init__(self, fixtures_path=fixtures_path, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures_path = fixtures_path
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        record_response(
+            request.url, response.status_code, response.text, self.fixtures_path
+        )
+        return response
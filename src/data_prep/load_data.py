@@ -1,11 +1,29 @@
-import requests
 import concurrent.futures
+import itertools
+import urllib.error
 import pandas as pd
 
+from src.data_prep.http_client import fetch_json, get_executor, http_config
+from src.data_prep.async_client import fetch_urls_async, run_async
+from src.data_prep.picks_cache import load_cached_picks, store_picks
+from src.data_prep.bootstrap_cache import get_cached_bootstrap_data
+from src.data_prep.compact_picks import build_compact_team_gw_picks
+from src.data_prep.player_store import PLAYER_STORE_COLUMNS, load_player_data
+
+TEAM_GW_PICKS_COLUMNS = [
+    "element",
+    "position",
+    "multiplier",
+    "is_captain",
+    "is_vice_captain",
+    "GW",
+    "bboost",
+]
+
 
 def fetch_url(url):
     """
-    Fetches data from a given URL using the requests library.
+    Fetches data from a given URL using the shared HTTP client, retrying on failures.
 
     Parameters:
     ----------
@@ -17,45 +35,78 @@ def fetch_url(url):
     data : dict or None
         The JSON data retrieved from the URL if the request is successful, otherwise None.
     """
-    response = requests.get(url)
-    if response.ok:
-        data = response.json()
-        return data
-    else:
-        return None
+    return fetch_json(url)
 
 
-# Function to fetch URLs concurrently
-def fetch_urls_concurrently(urls):
+def fetch_urls_concurrently(urls, max_workers=None):
     """
-    Fetches multiple URLs concurrently using ThreadPoolExecutor.
+    Fetches multiple URLs concurrently using the shared thread pool.
+
+    At most `max_workers` requests from this batch are in flight at once. Duplicate URLs are
+    only fetched once.
 
     Parameters:
     ----------
     urls : list
         A list of URLs to fetch.
+    max_workers : int, optional
+        The maximum number of concurrent requests for this batch. Defaults to the size of the
+        shared thread pool.
 
     Returns:
     ----------
-    results : list:
-        A list containing the fetched results from the URLs.
-    """
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        # Submit tasks to the executor
-        futures = [executor.submit(fetch_url, url) for url in urls]
-
-        # Retrieve results as they become available
-        results = []
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                results.append(result)
+    results : dict
+        A dictionary mapping each URL to its fetched result, or None if the request failed.
+        Keys are in the same order as `urls`.
+    """
+    if max_workers is None:
+        max_workers = http_config["max_workers"]
+
+    unique_urls = list(dict.fromkeys(urls))
+    results = dict.fromkeys(unique_urls)
+    executor = get_executor()
+
+    # Keep a sliding window of at most max_workers requests in flight
+    url_iterator = iter(unique_urls)
+    pending = {
+        executor.submit(fetch_url, url): url
+        for url in itertools.islice(url_iterator, max(1, max_workers))
+    }
+    while pending:
+        done, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            url = pending.pop(future)
+            try:
+                results[url] = future.result()
+            except Exception:
+                results[url] = None
+
+            next_url = next(url_iterator, None)
+            if next_url is not None:
+                pending[executor.submit(fetch_url, next_url)] = next_url
+
     return results
 
 
 def get_boostrap_data():
     """
-    This gets the bootstrap static data from the Fantasy Premier League API.
+    This gets the bootstrap static data, served from a process-wide cache that is refreshed in the
+    background once it is older than the configured TTL.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the bootstrap static data from the Fantasy Premier League API. This data typically includes information about teams, players, and other game-related metadata.
+    """
+    bootstrap_data = get_cached_bootstrap_data(fetch_function=fetch_boostrap_data)
+    return bootstrap_data
+
+
+def fetch_boostrap_data():
+    """
+    This fetches the bootstrap static data from the Fantasy Premier League API.
 
     Returns
     -------
@@ -91,19 +142,51 @@ def get_team_data(team_id):
     The data is fetched from the URL:
     'https://fantasy.premierleague.com/api/entry/{team_id}/', where `{team_id}` is replaced with the provided team ID.
     """
-    team_url = f"https://fantasy.premierleague.com/api/entry/{team_id}/"
-    team_data = fetch_url(team_url)
+    if http_config["engine"] == "asyncio":
+        return run_async(get_team_data_async(team_id=team_id))
 
+    team_url = f"https://fantasy.premierleague.com/api/entry/{team_id}/"
     team_history_url = f"https://fantasy.premierleague.com/api/entry/{team_id}/history/"
-    team_history_data = fetch_url(team_history_url)
+
+    results = fetch_urls_concurrently([team_url, team_history_url])
+    team_data = results[team_url]
+    team_history_data = results[team_history_url]
 
     return team_data, team_history_data
 
 
-def get_team_gw_data(team_id, team_history_data, current_gameweek):
+async def get_team_data_async(team_id):
+    """
+    Asynchronous equivalent of `get_team_data`, fetching the team and team history data concurrently.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier for the team whose data is to be fetched.
+
+    Returns
+    -------
+    team_data : dict
+        A dictionary containing the team data from the Fantasy Premier League API.
+    team_history_data : dict
+        A dictionary containing the team's history data.
+    """
+    team_data, team_history_data = await fetch_urls_async(
+        [
+            f"https://fantasy.premierleague.com/api/entry/{team_id}/",
+            f"https://fantasy.premierleague.com/api/entry/{team_id}/history/",
+        ]
+    )
+    return team_data, team_history_data
+
+
+def get_team_gw_data(team_id, team_history_data, current_gameweek, compact=False):
     """
     Retrieves the gameweek picks data for a given team up to the specified current gameweek.
 
+    Picks for gameweeks already held in the local picks cache are read from disk, and only newer
+    gameweeks are fetched from the API.
+
     Parameters
     ----------
     team_id : int
@@ -112,56 +195,215 @@ def get_team_gw_data(team_id, team_history_data, current_gameweek):
         A dictionary containing the team's history data.
     current_gameweek : int or str
         The current gameweek number. If the season has not started, it can be set to "Season Not Started".
+    compact : bool, optional
+        Whether to return the picks as compact arrays (see `build_compact_team_gw_picks`). Default is False.
 
     Returns
     -------
-    team_gw_picks : pd.DataFrame
-        A DataFrame containing the team's picks for each gameweek up to the current gameweek.
-        Includes columns for element, position, multiplier, captaincy, vice-captaincy, gameweek number, and whether the bench boost was active.
+    team_gw_picks : pd.DataFrame or dict
+        A DataFrame containing the team's picks for each gameweek up to the current gameweek, or the compact
+        picks if `compact` is True. Includes the element, position, multiplier, captaincy, vice-captaincy,
+        gameweek number, and whether the bench boost was active.
     """
 
+    if http_config["engine"] == "asyncio":
+        return run_async(
+            get_team_gw_data_async(
+                team_id=team_id,
+                team_history_data=team_history_data,
+                current_gameweek=current_gameweek,
+                compact=compact,
+            )
+        )
+
     if current_gameweek == "Season Not Started":
         return "Season Not Started"
     else:
         current_gameweek = int(current_gameweek)
 
     bboost_gw = get_bboost_gw(team_history_data)
-    team_gw_picks = pd.DataFrame(
-        columns=[
-            "element",
-            "position",
-            "multiplier",
-            "is_captain",
-            "is_vice_captain",
-            "GW",
-            "bboost",
-        ]
+
+    # Past gameweek picks never change, so only fetch gameweeks missing from the cache
+    cached_picks = load_cached_picks(team_id=team_id, max_gameweek=current_gameweek)
+    team_event_urls = get_team_event_urls(
+        team_id=team_id, cached_picks=cached_picks, current_gameweek=current_gameweek
     )
-    for gw in range(1, current_gameweek + 1):
-        team_event_url = (
-            f"https://fantasy.premierleague.com/api/entry/{team_id}/event/{gw}/picks/"
-        )
-        team_gw_data_stage = fetch_url(team_event_url)
 
-        if team_gw_data_stage is not None:
-            team_gw_picks_stage = team_gw_data_stage["picks"]
+    # Fetch remaining gameweeks concurrently
+    results = fetch_urls_concurrently(list(team_event_urls.values()))
+    team_gw_data = [results[url] for url in team_event_urls.values()]
+
+    team_gw_picks = combine_team_gw_picks(
+        team_id=team_id,
+        bboost_gw=bboost_gw,
+        cached_picks=cached_picks,
+        current_gameweek=current_gameweek,
+        gameweeks=list(team_event_urls),
+        team_gw_data=team_gw_data,
+        compact=compact,
+    )
+    return team_gw_picks
+
 
-            team_gw_picks_stage_df = pd.DataFrame(team_gw_data_stage["picks"])
+async def get_team_gw_data_async(
+    team_id, team_history_data, current_gameweek, compact=False
+):
+    """
+    Asynchronous equivalent of `get_team_gw_data`.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier for the team whose gameweek data is to be fetched.
+    team_history_data : dict
+        A dictionary containing the team's history data.
+    current_gameweek : int or str
+        The current gameweek number. If the season has not started, it can be set to "Season Not Started".
+    compact : bool, optional
+        Whether to return the picks as compact arrays (see `build_compact_team_gw_picks`). Default is False.
 
-            team_gw_picks_stage_df["GW"] = gw
+    Returns
+    -------
+    team_gw_picks : pd.DataFrame or dict
+        A DataFrame containing the team's picks for each gameweek up to the current gameweek, or the compact
+        picks if `compact` is True.
+    """
+    if current_gameweek == "Season Not Started":
+        return "Season Not Started"
+    else:
+        current_gameweek = int(current_gameweek)
 
-            if gw == bboost_gw:
-                team_gw_picks_stage_df["bboost"] = 1
+    bboost_gw = get_bboost_gw(team_history_data)
 
-            else:
-                team_gw_picks_stage_df["bboost"] = 0
+    cached_picks = load_cached_picks(team_id=team_id, max_gameweek=current_gameweek)
+    team_event_urls = get_team_event_urls(
+        team_id=team_id, cached_picks=cached_picks, current_gameweek=current_gameweek
+    )
 
-            team_gw_picks = pd.concat(
-                [team_gw_picks, team_gw_picks_stage_df], ignore_index=True
-            )
+    team_gw_data = await fetch_urls_async(list(team_event_urls.values()))
+
+    team_gw_picks = combine_team_gw_picks(
+        team_id=team_id,
+        bboost_gw=bboost_gw,
+        cached_picks=cached_picks,
+        current_gameweek=current_gameweek,
+        gameweeks=list(team_event_urls),
+        team_gw_data=team_gw_data,
+        compact=compact,
+    )
+    return team_gw_picks
+
+
+def get_team_event_urls(team_id, cached_picks, current_gameweek):
+    """
+    Gets the picks URLs for the gameweeks up to the current gameweek that are missing from the cached picks.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier for the team.
+    cached_picks : dict
+        A dictionary where keys are gameweek numbers and values are the cached picks for that gameweek.
+    current_gameweek : int
+        The current gameweek number.
+
+    Returns
+    -------
+    team_event_urls : dict
+        A dictionary where keys are gameweek numbers and values are the picks URLs, in gameweek order.
+    """
+    team_event_urls = {
+        gw: f"https://fantasy.premierleague.com/api/entry/{team_id}/event/{gw}/picks/"
+        for gw in range(1, current_gameweek + 1)
+        if gw not in cached_picks
+    }
+    return team_event_urls
+
+
+def combine_team_gw_picks(
+    team_id,
+    bboost_gw,
+    cached_picks,
+    current_gameweek,
+    gameweeks,
+    team_gw_data,
+    compact=False,
+):
+    """
+    Stores newly fetched picks of finished gameweeks in the picks cache and combines them with the
+    cached picks.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier for the team.
+    bboost_gw : int or None
+        The gameweek number when the Bench Boost chip was used, or None if it was not used.
+    cached_picks : dict
+        A dictionary where keys are gameweek numbers and values are the cached picks for that gameweek.
+    current_gameweek : int
+        The current gameweek number. Its picks are not stored, as the gameweek may not have finished.
+    gameweeks : list of int
+        The gameweeks that were fetched.
+    team_gw_data : list
+        The fetched picks data for each gameweek in `gameweeks`, with None for failed requests.
+    compact : bool, optional
+        Whether to return the picks as compact arrays (see `build_compact_team_gw_picks`). Default is False.
+
+    Returns
+    -------
+    team_gw_picks : pd.DataFrame or dict
+        A DataFrame containing the team's picks for each gameweek, or the compact picks if `compact` is True.
+    """
+    new_picks = {
+        gw: team_gw_data_stage["picks"]
+        for gw, team_gw_data_stage in zip(gameweeks, team_gw_data)
+        if team_gw_data_stage is not None
+    }
+    finished_picks = {
+        gw: picks for gw, picks in new_picks.items() if gw < current_gameweek
+    }
+    store_picks(team_id=team_id, gw_picks=finished_picks)
+
+    gw_picks = {**cached_picks, **new_picks}
+
+    if compact:
+        return build_compact_team_gw_picks(gw_picks=gw_picks, bboost_gw=bboost_gw)
+
+    team_gw_picks = build_team_gw_picks(gw_picks=gw_picks, bboost_gw=bboost_gw)
+    return team_gw_picks
+
+
+def build_team_gw_picks(gw_picks, bboost_gw):
+    """
+    Builds the gameweek picks DataFrame for a team from the raw picks of each gameweek.
+
+    Parameters
+    ----------
+    gw_picks : dict
+        A dictionary where keys are gameweek numbers and values are the list of picks for that gameweek.
+    bboost_gw : int or None
+        The gameweek number when the Bench Boost chip was used, or None if it was not used.
+
+    Returns
+    -------
+    team_gw_picks : pd.DataFrame
+        A DataFrame containing the team's picks for each gameweek, ordered by gameweek.
+    """
+    records = [
+        {**pick, "GW": gw, "bboost": 1 if gw == bboost_gw else 0}
+        for gw in sorted(gw_picks)
+        for pick in gw_picks[gw]
+    ]
+
+    team_gw_picks = pd.DataFrame(records)
+
+    # Keep the standard columns first, followed by any extra fields returned by the API
+    extra_columns = [
+        column for column in team_gw_picks.columns if column not in TEAM_GW_PICKS_COLUMNS
+    ]
+    team_gw_picks = team_gw_picks.reindex(columns=TEAM_GW_PICKS_COLUMNS + extra_columns)
 
-        else:
-            continue
     return team_gw_picks
 
 
@@ -237,6 +479,8 @@ def get_player_data(current_season_year):
     """
     Retrieves player data for the current season from the GitHub repository. Fantasy-Premier-League by vaastav.
 
+    Only the columns used when scoring teams are read.
+
     Parameters
     ----------
     current_season_year : str
@@ -250,10 +494,12 @@ def get_player_data(current_season_year):
         The latest gameweek number in the data, or "Season Not Started" if the data is not available.
     """
     try:
-        vaastav_url = f"https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data/{current_season_year}/gws/merged_gw.csv"
+        vaastav_url = get_vaastav_url(
+            current_season_year=current_season_year, file_name="merged_gw.csv"
+        )
 
         # Read the CSV file into a pandas DataFrame
-        player_data = pd.read_csv(vaastav_url)
+        player_data = pd.read_csv(vaastav_url, usecols=PLAYER_STORE_COLUMNS)
 
         # Get latest GW in data
         current_gameweek = max(player_data["GW"])
@@ -264,7 +510,7 @@ def get_player_data(current_season_year):
             local_url = "data/merged_gw.csv"
 
             # Read the CSV file into a pandas DataFrame
-            player_data = pd.read_csv(local_url)
+            player_data = pd.read_csv(local_url, usecols=PLAYER_STORE_COLUMNS)
 
             # Get latest GW in data
             current_gameweek = max(player_data["GW"])
@@ -274,3 +520,112 @@ def get_player_data(current_season_year):
             current_gameweek = "Season Not Started"
 
     return player_data, current_gameweek
+
+
+def get_vaastav_url(current_season_year, file_name):
+    """
+    Gets the URL of a gameweek data file in the GitHub repository Fantasy-Premier-League by vaastav.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+    file_name : str
+        The name of the file, e.g. "merged_gw.csv" or "gw1.csv".
+
+    Returns
+    -------
+    str
+        The URL of the file.
+    """
+    return f"https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data/{current_season_year}/gws/{file_name}"
+
+
+def get_player_gw_data(current_season_year, gameweek):
+    """
+    Retrieves the player data for a single gameweek from the GitHub repository Fantasy-Premier-League by vaastav.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+    gameweek : int
+        The gameweek number.
+
+    Returns
+    -------
+    player_gw_data : pd.DataFrame or None
+        A DataFrame containing the gameweek player data, or None if the gameweek has not been published.
+    """
+    url = get_vaastav_url(
+        current_season_year=current_season_year, file_name=f"gw{gameweek}.csv"
+    )
+    gw_columns = [column for column in PLAYER_STORE_COLUMNS if column != "GW"]
+    try:
+        player_gw_data = pd.read_csv(url, usecols=gw_columns)
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+
+    # Individual gameweek files have no GW column
+    player_gw_data["GW"] = gameweek
+    return player_gw_data[PLAYER_STORE_COLUMNS]
+
+
+def update_player_data(current_season_year, max_gameweek=38):
+    """
+    Updates the stored player data for the current season with any newly published gameweeks.
+
+    Only the individual gameweek files from the latest stored gameweek onwards are downloaded. The
+    latest stored gameweek is downloaded again as it may have been stored before it finished. If
+    there is no stored data for the season, or the update fails, the full season is downloaded
+    with `get_player_data`.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+    max_gameweek : int, optional
+        The last gameweek of the season. Default is 38.
+
+    Returns
+    -------
+    player_data : pd.DataFrame or str
+        A DataFrame containing the gameweek player data if available, or "Season Not Started" if the data is not available.
+    current_gameweek : int or str
+        The latest gameweek number in the data, or "Season Not Started" if the data is not available.
+    """
+    stored_player_data = load_player_data(
+        current_season_year=current_season_year, default_value=None
+    )
+    if stored_player_data is None or stored_player_data.empty:
+        return get_player_data(current_season_year=current_season_year)
+
+    stored_gameweek = int(stored_player_data["GW"].max())
+    new_player_data = []
+    try:
+        for gameweek in range(stored_gameweek, max_gameweek + 1):
+            player_gw_data = get_player_gw_data(
+                current_season_year=current_season_year, gameweek=gameweek
+            )
+            if player_gw_data is None:
+                break
+            new_player_data.append(player_gw_data)
+    except Exception as e:
+        print(f"Incremental player data update failed: {e}")
+        return get_player_data(current_season_year=current_season_year)
+
+    if not new_player_data:
+        return stored_player_data, stored_gameweek
+
+    # Replace the latest stored gameweek with its downloaded version
+    stored_player_data = stored_player_data[
+        stored_player_data["GW"] < stored_gameweek
+    ].astype({"team": str, "position": str})
+    player_data = pd.concat([stored_player_data, *new_player_data], ignore_index=True)
+
+    # Get latest GW in data
+    current_gameweek = int(player_data["GW"].max())
+
+    return player_data, current_gameweek
@@ -1,4 +1,9 @@
-import requests
+from src.data_prep.load_data import fetch_url, fetch_urls_concurrently
+from src.data_prep.http_client import http_config
+from src.data_prep.async_client import fetch_json_async, fetch_urls_async, run_async
+
+# Number of league pages requested concurrently at a time after the first page
+LEAGUE_PAGES_PER_WAVE = 4
 
 
 def get_league_data_season_started(league_id, page_limit):
@@ -17,31 +22,13 @@ def get_league_data_season_started(league_id, page_limit):
     team_data : list
         Team data extracted from all fetched URLs.
     """
-    urls = []
-    page = 1
-    url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_standings={page}"
-    urls.append(url)
-
-    league_data = requests.get(url).json()
-    all_results = [league_data]
-
-    while league_data["standings"]["has_next"] == True:
-        page += 1
-
-        if page > page_limit:
-            break
-
-        url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_standings={page}"
-        league_data = requests.get(url).json()
-        urls.append(url)
-        all_results.append(league_data)
-
-    team_data = []
-    for item in all_results:
-        if "standings" in item and "results" in item["standings"]:
-            team_data.extend(item["standings"]["results"])
-
-    return all_results[0], team_data
+    all_results = get_league_pages(
+        league_id=league_id,
+        page_parameter="page_standings",
+        results_key="standings",
+        page_limit=page_limit,
+    )
+    return process_league_pages(all_results=all_results, results_key="standings")
 
 
 def get_league_data_season_not_started(league_id, page_limit):
@@ -60,34 +47,211 @@ def get_league_data_season_not_started(league_id, page_limit):
     team_data : list
         Team data extracted from all fetched URLs.
     """
-    urls = []
-    page = 1
-    url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_new_entries={page}"
-    urls.append(url)
+    all_results = get_league_pages(
+        league_id=league_id,
+        page_parameter="page_new_entries",
+        results_key="new_entries",
+        page_limit=page_limit,
+    )
+    return process_league_pages(all_results=all_results, results_key="new_entries")
+
 
-    league_data = requests.get(url).json()
+def get_league_page_url(league_id, page_parameter, page):
+    """
+    Gets the URL of a page of a league's standings or new entries.
+
+    Parameters:
+    ----------
+    league_id : int
+        The ID of the league.
+    page_parameter : str
+        The pagination query parameter, either "page_standings" or "page_new_entries".
+    page : int
+        The page number.
+
+    Returns:
+    ----------
+    url : str
+        The URL of the page.
+    """
+    url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?{page_parameter}={page}"
+    return url
+
+
+def get_league_pages(league_id, page_parameter, results_key, page_limit):
+    """
+    Fetches the pages of a league, requesting the pages after the first concurrently in waves.
+
+    The first page is fetched on its own. While the last page kept has a next page, the following
+    `LEAGUE_PAGES_PER_WAVE` pages (up to `page_limit`) are fetched in parallel, and the pages are
+    kept up to the first page that is missing, empty or has no next page.
+
+    Parameters:
+    ----------
+    league_id : int
+        The ID of the league.
+    page_parameter : str
+        The pagination query parameter, either "page_standings" or "page_new_entries".
+    results_key : str
+        The key holding the paginated results, either "standings" or "new_entries".
+    page_limit : int
+        The maximum number of pages to fetch.
+
+    Returns:
+    ----------
+    all_results : list of dict
+        The fetched pages, in page order.
+    """
+    league_data = fetch_url(get_league_page_url(league_id, page_parameter, 1))
+    all_results = [league_data]
+
+    for urls in get_league_page_waves(league_id, page_parameter, page_limit):
+        if all_results[-1][results_key]["has_next"] != True:
+            break
+
+        results = fetch_urls_concurrently(urls)
+        pages_kept = len(all_results)
+        all_results = trim_league_pages(
+            all_results=all_results,
+            next_pages=[results[url] for url in urls],
+            results_key=results_key,
+        )
+
+        # The league ended, or a page failed, within this wave
+        if len(all_results) - pages_kept < len(urls):
+            break
+
+    return all_results
+
+
+async def get_league_pages_async(league_id, page_parameter, results_key, page_limit):
+    """
+    Asynchronous equivalent of `get_league_pages`.
+
+    Parameters:
+    ----------
+    league_id : int
+        The ID of the league.
+    page_parameter : str
+        The pagination query parameter, either "page_standings" or "page_new_entries".
+    results_key : str
+        The key holding the paginated results, either "standings" or "new_entries".
+    page_limit : int
+        The maximum number of pages to fetch.
+
+    Returns:
+    ----------
+    all_results : list of dict
+        The fetched pages, in page order.
+    """
+    league_data = await fetch_json_async(
+        get_league_page_url(league_id, page_parameter, 1)
+    )
     all_results = [league_data]
 
-    while league_data["new_entries"]["has_next"] == True:
-        page += 1
+    for urls in get_league_page_waves(league_id, page_parameter, page_limit):
+        if all_results[-1][results_key]["has_next"] != True:
+            break
+
+        pages_kept = len(all_results)
+        all_results = trim_league_pages(
+            all_results=all_results,
+            next_pages=await fetch_urls_async(urls),
+            results_key=results_key,
+        )
+
+        # The league ended, or a page failed, within this wave
+        if len(all_results) - pages_kept < len(urls):
+            break
+
+    return all_results
+
 
-        if page > page_limit:
+def get_league_page_waves(league_id, page_parameter, page_limit):
+    """
+    Gets the URLs of the pages of a league after the first, in waves of `LEAGUE_PAGES_PER_WAVE`.
+
+    Parameters:
+    ----------
+    league_id : int
+        The ID of the league.
+    page_parameter : str
+        The pagination query parameter, either "page_standings" or "page_new_entries".
+    page_limit : int
+        The maximum number of pages to fetch.
+
+    Yields:
+    ----------
+    urls : list of str
+        The URLs of the pages in the wave, in page order.
+    """
+    for first_page in range(2, page_limit + 1, LEAGUE_PAGES_PER_WAVE):
+        last_page = min(first_page + LEAGUE_PAGES_PER_WAVE - 1, page_limit)
+        yield [
+            get_league_page_url(league_id, page_parameter, page)
+            for page in range(first_page, last_page + 1)
+        ]
+
+
+def trim_league_pages(all_results, next_pages, results_key):
+    """
+    Appends a wave of fetched pages up to the end of the league.
+
+    Parameters:
+    ----------
+    all_results : list of dict
+        The pages fetched so far, the last of which has a next page.
+    next_pages : list of dict or None
+        The following pages in page order, with None for failed requests.
+    results_key : str
+        The key holding the paginated results, either "standings" or "new_entries".
+
+    Returns:
+    ----------
+    all_results : list of dict
+        The pages up to and including the first page that has no next page.
+    """
+    all_results = list(all_results)
+    for league_data in next_pages:
+        if league_data is None or len(league_data[results_key]["results"]) == 0:
             break
 
-        url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/?page_new_entries={page}"
-        league_data = requests.get(url).json()
-        urls.append(url)
         all_results.append(league_data)
 
+        if league_data[results_key]["has_next"] != True:
+            break
+
+    return all_results
+
+
+def process_league_pages(all_results, results_key):
+    """
+    Extracts the team data from the fetched pages of a league.
+
+    Parameters:
+    ----------
+    all_results : list of dict
+        The fetched league pages, in page order.
+    results_key : str
+        The key holding the paginated results, either "standings" or "new_entries".
+
+    Returns:
+    ----------
+    league_data : dict
+        League data retrieved from the first page.
+    team_data : list
+        Team data extracted from all fetched pages.
+    """
     team_data = []
     for item in all_results:
-        if "new_entries" in item and "results" in item["new_entries"]:
-            team_data.extend(item["new_entries"]["results"])
+        if results_key in item and "results" in item[results_key]:
+            team_data.extend(item[results_key]["results"])
 
-    for team in team_data:
-        team["player_name"] = (
-            f"{team.pop('player_first_name')} {team.pop('player_last_name')}"
-        )
+    if results_key == "new_entries":
+        for team in team_data:
+            team["player_name"] = (
+                f"{team.pop('player_first_name')} {team.pop('player_last_name')}"
+            )
 
     return all_results[0], team_data
 
@@ -108,8 +272,50 @@ def get_league_data(league_id, current_gameweek, page_limit):
     team_data : list
         Team data extracted from all fetched URLs.
     """
+    if http_config["engine"] == "asyncio":
+        return run_async(
+            get_league_data_async(
+                league_id=league_id,
+                current_gameweek=current_gameweek,
+                page_limit=page_limit,
+            )
+        )
 
     if current_gameweek != "Season Not Started":
         return get_league_data_season_started(league_id, page_limit)
     else:
         return get_league_data_season_not_started(league_id, page_limit)
+
+
+async def get_league_data_async(league_id, current_gameweek, page_limit):
+    """
+    Asynchronous equivalent of `get_league_data`.
+
+    Parameters:
+    ----------
+    league_id : int
+        The ID of the league for which data is to be fetched.
+    current_gameweek : int or str
+        The current gameweek number, or "Season Not Started".
+    page_limit : int
+        The maximum number of pages to fetch.
+
+    Returns:
+    ----------
+    league_data : dict
+        League data retrieved from the first URL.
+    team_data : list
+        Team data extracted from all fetched URLs.
+    """
+    if current_gameweek != "Season Not Started":
+        page_parameter, results_key = "page_standings", "standings"
+    else:
+        page_parameter, results_key = "page_new_entries", "new_entries"
+
+    all_results = await get_league_pages_async(
+        league_id=league_id,
+        page_parameter=page_parameter,
+        results_key=results_key,
+        page_limit=page_limit,
+    )
+    return process_league_pages(all_results=all_results, results_key=results_key)
@@ -0,0 +1,120 @@
+import json
+import sqlite3
+import threading
+
+from src.app_tools.yaml_loader import load_yaml_file
+
+# Get config
+yaml_file_path = "conf/parameters.yaml"
+config = load_yaml_file(yaml_file_path)
+
+picks_cache_enabled = config["picks_cache"]["enabled"]
+picks_cache_path = config["picks_cache"]["path"]
+
+_initialised_paths = set()
+_write_lock = threading.Lock()
+
+
+def connect_picks_cache(cache_path):
+    """
+    Opens a connection to the picks cache, creating the table if needed.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path to the SQLite database file.
+
+    Returns
+    -------
+    sqlite3.Connection
+        An open connection to the picks cache.
+    """
+    connection = sqlite3.connect(cache_path, timeout=30)
+    if cache_path not in _initialised_paths:
+        # WAL allows readers in other processes while a write is in progress
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS picks (
+                team_id INTEGER NOT NULL,
+                gameweek INTEGER NOT NULL,
+                picks TEXT NOT NULL,
+                PRIMARY KEY (team_id, gameweek)
+            )
+            """
+        )
+        connection.commit()
+        _initialised_paths.add(cache_path)
+    return connection
+
+
+def load_cached_picks(team_id, max_gameweek, cache_path=picks_cache_path):
+    """
+    Loads the cached gameweek picks for a team.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier for the team.
+    max_gameweek : int
+        The latest gameweek to return picks for.
+    cache_path : str, optional
+        Path to the SQLite database file.
+
+    Returns
+    -------
+    gw_picks : dict
+        A dictionary where keys are gameweek numbers and values are the list of picks for that gameweek.
+    """
+    if not picks_cache_enabled:
+        return {}
+
+    connection = connect_picks_cache(cache_path)
+    try:
+        rows = connection.execute(
+            "SELECT gameweek, picks FROM picks WHERE team_id = ? AND gameweek <= ?",
+            (int(team_id), int(max_gameweek)),
+        ).fetchall()
+    finally:
+        connection.close()
+
+    gw_picks = {gameweek: json.loads(picks) for gameweek, picks in rows}
+    return gw_picks
+
+
+def store_picks(team_id, gw_picks, cache_path=picks_cache_path):
+    """
+    Stores gameweek picks for a team in the cache.
+
+    Only finished gameweeks should be stored, as picks are never refreshed once cached.
+
+    Parameters
+    ----------
+    team_id : int
+        The unique identifier for the team.
+    gw_picks : dict
+        A dictionary where keys are gameweek numbers and values are the list of picks for that gameweek.
+    cache_path : str, optional
+        Path to the SQLite database file.
+
+    Returns
+    -------
+    None
+    """
+    if not picks_cache_enabled or len(gw_picks) == 0:
+        return
+
+    rows = [
+        (int(team_id), int(gameweek), json.dumps(picks))
+        for gameweek, picks in gw_picks.items()
+    ]
+    with _write_lock:
+        connection = connect_picks_cache(cache_path)
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO picks (team_id, gameweek, picks) VALUES (?, ?, ?)",
+                rows,
+            )
+            connection.commit()
+        finally:
+            connection.close()
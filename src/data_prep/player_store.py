@@ -0,0 +1,310 @@
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+# Stats summed for each team's starting players
+PLAYER_STAT_COLUMNS = [
+    "assists",
+    "bonus",
+    "bps",
+    "clean_sheets",
+    "goals_conceded",
+    "goals_scored",
+    "own_goals",
+    "penalties_missed",
+    "penalties_saved",
+    "red_cards",
+    "yellow_cards",
+    "saves",
+]
+
+# Columns of the vaastav gameweek data used when scoring teams
+PLAYER_STORE_COLUMNS = ["element", "GW", "team", "position"] + PLAYER_STAT_COLUMNS
+
+# Columns stored as integer codes with a lookup of their values
+PLAYER_STORE_CATEGORICAL_COLUMNS = ["team", "position"]
+
+# Arrays of the player stat tensor, in the order they are written ("stats" last)
+PLAYER_TENSOR_ARRAYS = ["team_values", "team", "fixtures", "stats"]
+
+
+def get_player_store_path(current_season_year):
+    """
+    Gets the path of the player store for a season.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+
+    Returns
+    -------
+    str
+        The path of the player store file.
+    """
+    return f"data/vaastav-data/player_data_{current_season_year}.npz"
+
+
+def write_player_store(player_data, file_path):
+    """
+    Writes player gameweek data to a compact columnar store.
+
+    Only the columns used when scoring teams are kept, stored as small integer arrays. Team and
+    position names are stored as integer codes alongside their values.
+
+    Parameters
+    ----------
+    player_data : pd.DataFrame
+        A DataFrame containing the gameweek player data.
+    file_path : str
+        The path of the player store file.
+
+    Returns
+    -------
+    None
+    """
+    arrays = {
+        "element": player_data["element"].to_numpy(dtype=np.uint16),
+        "GW": player_data["GW"].to_numpy(dtype=np.uint8),
+    }
+    for column in PLAYER_STORE_CATEGORICAL_COLUMNS:
+        codes, values = pd.factorize(player_data[column])
+        arrays[column] = codes.astype(np.uint8)
+        arrays[f"{column}_values"] = np.asarray(values, dtype=str)
+    for column in PLAYER_STAT_COLUMNS:
+        arrays[column] = player_data[column].to_numpy(dtype=np.int16)
+
+    temp_path = f"{file_path}.{os.getpid()}.tmp.npz"
+    np.savez(temp_path, **arrays)
+    os.replace(temp_path, file_path)
+
+
+@functools.lru_cache(maxsize=4)
+def read_player_store(file_path, modified_time):
+    """
+    Reads the player store into a DataFrame. Results are cached per file and modification time.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the player store file.
+    modified_time : float
+        The modification time of the file, used to invalidate the cache when it is rewritten.
+
+    Returns
+    -------
+    player_data : pd.DataFrame
+        A DataFrame containing the stored gameweek player data.
+    """
+    with np.load(file_path) as arrays:
+        player_data = pd.DataFrame(
+            {
+                column: (
+                    pd.Categorical.from_codes(
+                        arrays[column], categories=arrays[f"{column}_values"]
+                    )
+                    if column in PLAYER_STORE_CATEGORICAL_COLUMNS
+                    else arrays[column]
+                )
+                for column in PLAYER_STORE_COLUMNS
+            }
+        )
+    return player_data
+
+
+def load_player_data(current_season_year, default_value="Season Not Started"):
+    """
+    Loads the player gameweek data for a season, loading each file at most once per process.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+    default_value : any
+        Value to return if there is no player data for the season.
+
+    Returns
+    -------
+    pd.DataFrame or str
+        A DataFrame containing the gameweek player data, or a default value if the season has not started.
+    """
+    file_path = get_player_store_path(current_season_year)
+    try:
+        modified_time = os.path.getmtime(file_path)
+    except OSError:
+        return default_value
+    return read_player_store(file_path, modified_time)
+
+
+def build_player_stat_tensor(player_data):
+    """
+    Builds dense arrays of player stats indexed by element and gameweek.
+
+    Rows for the same element and gameweek (double gameweeks) are summed, so the stats for any set
+    of picks can be gathered directly with their element and gameweek numbers.
+
+    Parameters
+    ----------
+    player_data : pd.DataFrame
+        A DataFrame containing the gameweek player data.
+
+    Returns
+    -------
+    player_stat_tensor : dict
+        A dictionary containing:
+        - "stats": Array of shape (elements, gameweeks, stats) with the summed `PLAYER_STAT_COLUMNS`.
+        - "fixtures": Array of shape (elements, gameweeks) with the number of fixtures played.
+        - "team": Array of shape (elements, gameweeks) with the code of the player's team.
+        - "team_values": Array with the team name for each team code.
+    """
+    element = player_data["element"].to_numpy(dtype=np.int64)
+    gw = player_data["GW"].to_numpy(dtype=np.int64)
+    n_elements = int(element.max()) + 1 if len(element) > 0 else 1
+    n_gameweeks = int(gw.max()) + 1 if len(gw) > 0 else 1
+
+    stats = np.zeros((n_elements, n_gameweeks, len(PLAYER_STAT_COLUMNS)), dtype=np.int16)
+    np.add.at(
+        stats, (element, gw), player_data[PLAYER_STAT_COLUMNS].to_numpy(dtype=np.int16)
+    )
+
+    fixtures = np.zeros((n_elements, n_gameweeks), dtype=np.uint8)
+    np.add.at(fixtures, (element, gw), 1)
+
+    team_codes, team_values = pd.factorize(player_data["team"])
+    team = np.zeros((n_elements, n_gameweeks), dtype=np.uint8)
+    team[element, gw] = team_codes
+
+    player_stat_tensor = {
+        "stats": stats,
+        "fixtures": fixtures,
+        "team": team,
+        "team_values": np.asarray(team_values, dtype=str),
+    }
+    return player_stat_tensor
+
+
+def get_player_tensor_path(current_season_year):
+    """
+    Gets the path of the directory holding the player stat tensor for a season.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+
+    Returns
+    -------
+    str
+        The path of the player stat tensor directory.
+    """
+    return f"data/vaastav-data/player_tensor_{current_season_year}"
+
+
+def write_player_stat_tensor(player_stat_tensor, dir_path):
+    """
+    Writes the player stat tensor as one uncompressed .npy file per array so it can be memory-mapped.
+
+    Each file is replaced atomically and "stats.npy" is written last, as its modification time is
+    used to detect new versions.
+
+    Parameters
+    ----------
+    player_stat_tensor : dict
+        The player stat tensor (see `build_player_stat_tensor`).
+    dir_path : str
+        The path of the player stat tensor directory.
+
+    Returns
+    -------
+    None
+    """
+    os.makedirs(dir_path, exist_ok=True)
+    for name in PLAYER_TENSOR_ARRAYS:
+        file_path = os.path.join(dir_path, f"{name}.npy")
+        temp_path = f"{file_path}.{os.getpid()}.tmp.npy"
+        np.save(temp_path, player_stat_tensor[name])
+        os.replace(temp_path, file_path)
+
+
+@functools.lru_cache(maxsize=4)
+def read_player_stat_tensor(dir_path, modified_time):
+    """
+    Memory-maps the player stat tensor read-only. Results are cached per directory and modification time.
+
+    Mapped files are shared through the OS page cache, so every process serving the app uses the
+    same physical memory and nothing is parsed at startup.
+
+    Parameters
+    ----------
+    dir_path : str
+        The path of the player stat tensor directory.
+    modified_time : float
+        The modification time of "stats.npy", used to invalidate the cache when it is rewritten.
+
+    Returns
+    -------
+    player_stat_tensor : dict
+        The player stat tensor (see `build_player_stat_tensor`).
+    """
+    player_stat_tensor = {
+        name: np.load(os.path.join(dir_path, f"{name}.npy"), mmap_mode="r")
+        for name in PLAYER_TENSOR_ARRAYS
+    }
+    return player_stat_tensor
+
+
+@functools.lru_cache(maxsize=4)
+def build_stored_player_stat_tensor(file_path, modified_time):
+    """
+    Builds the player stat tensor from the player store. Results are cached per file and modification time.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the player store file.
+    modified_time : float
+        The modification time of the file, used to invalidate the cache when it is rewritten.
+
+    Returns
+    -------
+    dict
+        The player stat tensor (see `build_player_stat_tensor`).
+    """
+    return build_player_stat_tensor(read_player_store(file_path, modified_time))
+
+
+def load_player_stat_tensor(current_season_year, default_value="Season Not Started"):
+    """
+    Loads the player stat tensor for a season.
+
+    The memory-mapped tensor files are used when present, otherwise the tensor is built from the
+    player store once per process.
+
+    Parameters
+    ----------
+    current_season_year : str
+        The current season year in the format "YYYY-YY".
+    default_value : any
+        Value to return if there is no player data for the season.
+
+    Returns
+    -------
+    dict or str
+        The player stat tensor (see `build_player_stat_tensor`), or a default value if the season has not started.
+    """
+    dir_path = get_player_tensor_path(current_season_year)
+    try:
+        modified_time = os.path.getmtime(os.path.join(dir_path, "stats.npy"))
+    except OSError:
+        pass
+    else:
+        return read_player_stat_tensor(dir_path, modified_time)
+
+    file_path = get_player_store_path(current_season_year)
+    try:
+        modified_time = os.path.getmtime(file_path)
+    except OSError:
+        return default_value
+    return build_stored_player_stat_tensor(file_path, modified_time)
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+
+from src.app_tools.yaml_loader import load_yaml_file
+
+# Get config
+yaml_file_path = "conf/parameters.yaml"
+config = load_yaml_file(yaml_file_path)
+
+rate_limit_config = config["rate_limit"]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the rate of requests, shared by threads and coroutines.
+
+    The rate adapts to the API: it is cut multiplicatively whenever a request is rate limited (429)
+    and recovers additively with each successful request, up to the configured maximum.
+
+    Parameters
+    ----------
+    requests_per_second : float
+        The maximum sustained request rate.
+    burst : int
+        The maximum number of requests that can be made at once after an idle period.
+    min_requests_per_second : float
+        The lowest rate that rate limited responses can reduce the rate to.
+    backoff_multiplier : float
+        Factor applied to the rate after a rate limited response.
+    recovery_per_success : float
+        Requests per second added to the rate after each successful response.
+    """
+
+    def __init__(
+        self,
+        requests_per_second,
+        burst,
+        min_requests_per_second,
+        backoff_multiplier,
+        recovery_per_success,
+    ):
+        self.max_rate = float(requests_per_second)
+        self.rate = float(requests_per_second)
+        self.burst = float(burst)
+        self.min_rate = float(min_requests_per_second)
+        self.backoff_multiplier = backoff_multiplier
+        self.recovery_per_success = recovery_per_success
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes a token from the bucket, returning how long the caller must wait before using it.
+
+        Tokens may go negative, which queues callers in the order they reserved.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before making the request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """
+        Blocks until a request can be made.
+
+        Returns
+        -------
+        None
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Waits, without blocking the event loop, until a request can be made.
+
+        Returns
+        -------
+        None
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self):
+        """
+        Reduces the rate after a rate limited response.
+
+        Returns
+        -------
+        None
+        """
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * self.backoff_multiplier)
+
+    def on_success(self):
+        """
+        Gradually restores the rate after a successful response.
+
+        Returns
+        -------
+        None
+        """
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_per_success)
+
+
+class NoRateLimit:
+    """
+    Stand-in for `TokenBucket` used when rate limiting is disabled.
+    """
+
+    def acquire(self):
+        pass
+
+    async def acquire_async(self):
+        pass
+
+    def on_rate_limited(self):
+        pass
+
+    def on_success(self):
+        pass
+
+
+# Process-wide limiter shared by the threaded and asyncio clients
+if rate_limit_config["enabled"]:
+    rate_limiter = TokenBucket(
+        requests_per_second=rate_limit_config["requests_per_second"],
+        burst=rate_limit_config["burst"],
+        min_requests_per_second=rate_limit_config["min_requests_per_second"],
+        backoff_multiplier=rate_limit_config["backoff_multiplier"],
+        recovery_per_success=rate_limit_config["recovery_per_success"],
+    )
+else:
+    rate_limiter = NoRateLimit()
@@ -1,16 +1,23 @@
+import numpy as np
 import pandas as pd
 
+from src.data_prep.compact_picks import unpack_compact_picks
+from src.data_prep.player_store import PLAYER_STAT_COLUMNS, build_player_stat_tensor
+
 
 def get_player_gameweek_totals(player_data, team_gw_picks, favourite_team, rival_teams):
     """
     This looks at gameweek data for the teams players.
 
-    This calculates summary statistics for a teams selected players up to the current gameweek. This merges the teams picks with the player data.
+    This calculates summary statistics for a teams selected players up to the current gameweek. The stats for
+    each pick are gathered from the player stat tensor by element and gameweek, so the cost depends on the number
+    of picks rather than the size of the player data.
 
     Parameters
     ----------
-    player_data : pd.DataFrame
-        A DataFrame containing player performance data for the current season.
+    player_data : dict or pd.DataFrame
+        The player stat tensor for the current season (see `build_player_stat_tensor`). A DataFrame of player
+        performance data is converted to a tensor first.
     team_gw_picks : pd.DataFrame
         A DataFrame containing the gameweek picks for the team.
     favourite_team : str
@@ -25,14 +32,21 @@ def get_player_gameweek_totals(player_data, team_gw_picks, favourite_team, rival
         for starters, all players, and a categorical indication of whether rival team players
         were picked.
     """
-    # Append player gameweek data
-    player_data = pd.merge(
-        team_gw_picks,
-        player_data,
-        on=["element", "GW"],
-        how="inner",
-        suffixes=("_team", "_player"),
-    )
+    if isinstance(player_data, pd.DataFrame):
+        player_data = build_player_stat_tensor(player_data)
+
+    stats = player_data["stats"]
+    n_elements, n_gameweeks = player_data["fixtures"].shape
+
+    # Picks without player data for the gameweek are excluded
+    element = team_gw_picks["element"].to_numpy(dtype=np.int64)
+    gw = team_gw_picks["GW"].to_numpy(dtype=np.int64)
+    has_player_data = (element < n_elements) & (gw < n_gameweeks)
+    team_gw_picks = team_gw_picks[has_player_data]
+    element = element[has_player_data]
+    gw = gw[has_player_data]
+
+    fixtures = player_data["fixtures"][element, gw].astype(np.int64)
 
     # Get rival teams
     if favourite_team != "Not Specified":
@@ -40,49 +54,29 @@ def get_player_gameweek_totals(player_data, team_gw_picks, favourite_team, rival
     else:
         rivals = None
 
-    # Create 'rival_team_player' column and initialize to 0
-    player_data["rival_team_player"] = 0
-
+    # Count rival team players for each fixture played
     if rivals is not None:
-        # Set 'rival_team_player' to 1 where 'player_data' is in the list of rivals
-        player_data.loc[player_data["team"].isin(rivals), "rival_team_player"] = 1
-
-    # Filter DataFrame where position_team >= 11
-    player_data_starters = player_data[
-        (player_data["position_team"] <= 11) | (player_data["bboost"] == 1)
-    ]
-
-    # Sum the specified columns
-    columns_to_sum_starters = [
-        "assists",
-        "bonus",
-        "bps",
-        "clean_sheets",
-        "goals_conceded",
-        "goals_scored",
-        "own_goals",
-        "penalties_missed",
-        "penalties_saved",
-        "red_cards",
-        "yellow_cards",
-        "saves",
-    ]
-
-    columns_to_sum_all = ["rival_team_player"]
+        is_rival_team = np.isin(player_data["team_values"], rivals)
+        rival_team_player = fixtures * is_rival_team[player_data["team"][element, gw]]
+    else:
+        rival_team_player = np.zeros_like(fixtures)
 
-    player_starter_totals = (
-        player_data_starters[columns_to_sum_starters].sum().to_dict()
+    # Filter picks where position_team <= 11 or bench boost is active
+    starters = (team_gw_picks["position"].to_numpy() <= 11) | (
+        team_gw_picks["bboost"].to_numpy() == 1
     )
 
-    players_all_totals = player_data[columns_to_sum_all].sum().to_dict()
+    # Sum the stats for starters
+    player_starter_totals = stats[element[starters], gw[starters]].sum(axis=0)
 
     player_gameweek_totals = {
-        **player_starter_totals,
-        **players_all_totals,
+        column: int(total)
+        for column, total in zip(PLAYER_STAT_COLUMNS, player_starter_totals)
     }
 
-    player_gameweek_totals["total_players_starters"] = len(player_data_starters)
-    player_gameweek_totals["total_players_all"] = len(player_data)
+    player_gameweek_totals["rival_team_player"] = int(rival_team_player.sum())
+    player_gameweek_totals["total_players_starters"] = int(fixtures[starters].sum())
+    player_gameweek_totals["total_players_all"] = int(fixtures.sum())
 
     if rivals is not None and player_gameweek_totals["rival_team_player"] > 0:
         player_gameweek_totals["rival_team_player_categorical"] = "Picked Rivals"
@@ -169,3 +163,187 @@ def get_season_gameweek_overview(team_history_data, current_gameweek):
     )
 
     return current_season_overview_output
+
+
+def get_player_gameweek_totals_batch(
+    player_data, team_gw_picks, favourite_teams, rival_teams
+):
+    """
+    Batch version of `get_player_gameweek_totals`, calculating the totals for many teams at once.
+
+    The stats for all picks are gathered in one pass and summed per team with segment sums.
+
+    Parameters
+    ----------
+    player_data : dict or pd.DataFrame
+        The player stat tensor for the current season (see `build_player_stat_tensor`). A DataFrame of player
+        performance data is converted to a tensor first.
+    team_gw_picks : dict or pd.DataFrame
+        The stacked compact picks of all teams (see `stack_compact_team_gw_picks`), in the order of
+        `favourite_teams`. A long-format DataFrame of picks with a "team_index" column giving the position of
+        each pick's team in `favourite_teams` is also accepted.
+    favourite_teams : list of str
+        The name of each team's favorite team.
+    rival_teams : dict
+        A dictionary where keys are team names and values are lists of rival teams.
+
+    Returns
+    -------
+    player_gameweek_totals : pd.DataFrame
+        A DataFrame indexed by team index with the same columns as `get_player_gameweek_totals`. Teams whose
+        favourite team has no rival teams listed are left out, as `get_player_gameweek_totals` fails for them.
+    """
+    if isinstance(player_data, pd.DataFrame):
+        player_data = build_player_stat_tensor(player_data)
+
+    stats = player_data["stats"]
+    n_elements, n_gameweeks = player_data["fixtures"].shape
+    n_teams = len(favourite_teams)
+
+    if isinstance(team_gw_picks, pd.DataFrame):
+        picks = {column: team_gw_picks[column].to_numpy() for column in team_gw_picks}
+    else:
+        picks = unpack_compact_picks(team_gw_picks)
+
+    # Picks without player data for the gameweek are excluded
+    team_index = picks["team_index"].astype(np.int64)
+    element = picks["element"].astype(np.int64)
+    gw = picks["GW"].astype(np.int64)
+    has_player_data = (element < n_elements) & (gw < n_gameweeks)
+    team_index = team_index[has_player_data]
+    element = element[has_player_data]
+    gw = gw[has_player_data]
+
+    fixtures = player_data["fixtures"][element, gw].astype(np.int64)
+
+    # Get rival teams for each distinct favourite team ("Not Specified" has none)
+    favourite_team_codes, favourite_team_values = pd.factorize(
+        pd.Series(favourite_teams, dtype=object)
+    )
+    has_rivals = np.array(
+        [team != "Not Specified" for team in favourite_team_values], dtype=bool
+    )
+    has_rival_list = np.array(
+        [
+            team == "Not Specified" or team in rival_teams
+            for team in favourite_team_values
+        ],
+        dtype=bool,
+    )
+    is_rival_team = np.array(
+        [
+            np.isin(player_data["team_values"], rival_teams.get(team, []))
+            for team in favourite_team_values
+        ],
+        dtype=bool,
+    ).reshape(len(favourite_team_values), len(player_data["team_values"]))
+
+    # Count rival team players for each fixture played
+    is_rival_pick = is_rival_team[
+        favourite_team_codes[team_index], player_data["team"][element, gw]
+    ]
+    rival_team_player = fixtures * is_rival_pick
+
+    # Filter picks where position_team <= 11 or bench boost is active
+    starters = (picks["position"][has_player_data] <= 11) | (
+        picks["bboost"][has_player_data] == 1
+    )
+    starter_stats = stats[element[starters], gw[starters]]
+
+    # Sum the stats for starters of each team
+    player_gameweek_totals = {
+        column: np.bincount(
+            team_index[starters], weights=starter_stats[:, i], minlength=n_teams
+        ).astype(np.int64)
+        for i, column in enumerate(PLAYER_STAT_COLUMNS)
+    }
+
+    player_gameweek_totals["rival_team_player"] = np.bincount(
+        team_index, weights=rival_team_player, minlength=n_teams
+    ).astype(np.int64)
+    player_gameweek_totals["total_players_starters"] = np.bincount(
+        team_index[starters], weights=fixtures[starters], minlength=n_teams
+    ).astype(np.int64)
+    player_gameweek_totals["total_players_all"] = np.bincount(
+        team_index, weights=fixtures, minlength=n_teams
+    ).astype(np.int64)
+
+    player_gameweek_totals = pd.DataFrame(player_gameweek_totals)
+
+    team_has_rivals = has_rivals[favourite_team_codes]
+    player_gameweek_totals["rival_team_player_categorical"] = np.where(
+        ~team_has_rivals,
+        "No Rival Team",
+        np.where(
+            player_gameweek_totals["rival_team_player"] > 0,
+            "Picked Rivals",
+            "Not Picked Rivals",
+        ),
+    )
+
+    return player_gameweek_totals[has_rival_list[favourite_team_codes]]
+
+
+def get_season_gameweek_overview_batch(team_history, current_gameweek):
+    """
+    Batch version of `get_season_gameweek_overview`, calculating the overview for many teams at once.
+
+    Parameters
+    ----------
+    team_history : pd.DataFrame
+        A long-format DataFrame containing the current season history of all teams, with a "team_index"
+        column identifying the team of each gameweek.
+    current_gameweek : int
+        The current gameweek number.
+
+    Returns
+    -------
+    current_season_overview_output : pd.DataFrame
+        A DataFrame indexed by team index with the same columns as `get_season_gameweek_overview`. Teams
+        without gameweeks up to the current gameweek, or without any points, are left out as
+        `get_season_gameweek_overview` fails for them.
+    """
+    current_season_overview = team_history[team_history["event"] <= current_gameweek]
+    grouped = current_season_overview.groupby("team_index", sort=True)
+
+    columns_to_sum_all_gws = [
+        "points_on_bench",
+        "event_transfers",
+        "event_transfers_cost",
+    ]
+
+    columns_to_mean_all_gws = ["bank"]
+
+    columns_lates_gw = ["bank", "value", "total_points"]
+
+    season_totals = grouped[columns_to_sum_all_gws].sum().add_suffix("_total")
+
+    season_means = grouped[columns_to_mean_all_gws].mean().add_suffix("_mean")
+
+    # Get latest gameweek
+    max_event_rows = current_season_overview.loc[grouped["event"].idxmax()]
+    season_latest = (
+        max_event_rows.set_index("team_index")[columns_lates_gw]
+        .add_suffix("_latest")
+    )
+
+    current_season_overview_output = pd.concat(
+        [season_totals, season_means, season_latest], axis=1
+    )
+    current_season_overview_output = current_season_overview_output[
+        current_season_overview_output["total_points_latest"] != 0
+    ]
+
+    # Calculate percentage of points on bench
+    current_season_overview_output["points_on_bench_percentage"] = np.round(
+        100
+        * current_season_overview_output["points_on_bench_total"]
+        / current_season_overview_output["total_points_latest"]
+    ).astype(np.int64)
+
+    # Round bank average
+    current_season_overview_output["bank_mean"] = current_season_overview_output[
+        "bank_mean"
+    ].map(lambda bank_mean: round(bank_mean, 1))
+
+    return current_season_overview_output
@@ -1,5 +1,16 @@
 import pandas as pd
 import ast
+import functools
+import json
+
+KIT_SUMMARY_COLUMNS = [
+    "kit",
+    "kit_shirt_type",
+    "kit_shirt_logo",
+    "kit_socks_type",
+    "kit_shorts",
+    "kit_full",
+]
 
 
 def get_kit_information(team_data):
@@ -25,7 +36,56 @@ def get_kit_information(team_data):
         - "kit_shorts": The type of shorts in the kit.
         - "kit_full": Boolean indicating whether the kit is considered a "full kit" (socks/shorts/shirt populated).
     """
-    if team_data["kit"] is None:
+    kit_summary_data = dict(
+        zip(KIT_SUMMARY_COLUMNS, summarise_kit(kit_string=team_data["kit"]))
+    )
+
+    return kit_summary_data
+
+
+def get_kit_information_batch(team_data_list):
+    """
+    Batch version of `get_kit_information`, returning the kit information of many teams as columns.
+
+    Parameters
+    ----------
+    team_data_list : list of dict
+        The data of each team, including a string representation of the team's kit details.
+
+    Returns
+    -------
+    kit_summary_data : dict
+        A dictionary with the same keys as `get_kit_information`, where each value is a list holding
+        that kit feature for every team.
+    """
+    kit_summaries = [
+        summarise_kit(kit_string=team_data["kit"]) for team_data in team_data_list
+    ]
+
+    kit_summary_data = {
+        column: [kit_summary[i] for kit_summary in kit_summaries]
+        for i, column in enumerate(KIT_SUMMARY_COLUMNS)
+    }
+
+    return kit_summary_data
+
+
+@functools.lru_cache(maxsize=4096)
+def summarise_kit(kit_string):
+    """
+    Summarises a kit string. Results are cached per kit string, as many teams share the same kit.
+
+    Parameters
+    ----------
+    kit_string : str or None
+        The string representation of the team's kit details, or None if the team has no kit.
+
+    Returns
+    -------
+    tuple
+        The kit features, in the order of `KIT_SUMMARY_COLUMNS`.
+    """
+    if kit_string is None:
         kit = False
         kit_shirt_type = None
         kit_shirt_logo = None
@@ -34,7 +94,7 @@ def get_kit_information(team_data):
         kit_shirt_base = None
 
     else:
-        kit_dict = ast.literal_eval(team_data["kit"])
+        kit_dict = parse_kit(kit_string)
         kit = True
         kit_shirt_type = kit_dict["kit_shirt_type"]
         kit_shirt_logo = kit_dict["kit_shirt_logo"]
@@ -53,13 +113,33 @@ def get_kit_information(team_data):
         and kit_shirt_base.upper() != "#E1E1E1"
     )
 
-    kit_summary_data = {
-        "kit": kit,
-        "kit_shirt_type": kit_shirt_type,
-        "kit_shirt_logo": kit_shirt_logo,
-        "kit_socks_type": kit_socks_type,
-        "kit_shorts": kit_shorts,
-        "kit_full": kit_full,
-    }
+    return (
+        kit,
+        kit_shirt_type,
+        kit_shirt_logo,
+        kit_socks_type,
+        kit_shorts,
+        kit_full,
+    )
 
-    return kit_summary_data
+
+def parse_kit(kit_string):
+    """
+    Parses a kit string into a dictionary.
+
+    The API returns kits as JSON, which is parsed directly. Other strings are evaluated as Python literals.
+
+    Parameters
+    ----------
+    kit_string : str
+        The string representation of the team's kit details.
+
+    Returns
+    -------
+    kit_dict : dict
+        The kit details.
+    """
+    try:
+        return json.loads(kit_string)
+    except ValueError:
+        return ast.literal_eval(kit_string)
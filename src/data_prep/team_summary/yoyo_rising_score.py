@@ -1,6 +1,4 @@
-import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
 
 def calculate_yoyo_rising_scores(team_history_data):
@@ -26,33 +24,75 @@ def calculate_yoyo_rising_scores(team_history_data):
         A negative value indicates improvement, while a positive value indicates a decline in performance.
     """
     past_data = team_history_data["past"]
-    past_data_df = pd.DataFrame(past_data)
-    past_data_df["year"] = past_data_df["season_name"].apply(
-        lambda x: int(x.split("/")[0])
+    years = [int(season["season_name"].split("/")[0]) for season in past_data]
+    positions = [season["rank"] for season in past_data]
+
+    yoyo_scores, rising_scores = calculate_yoyo_rising_scores_batch(
+        years=years, positions=positions, offsets=[0, len(past_data)]
     )
 
-    # Sort by year
-    past_data_df = past_data_df.sort_values("year")
+    return yoyo_scores[0], rising_scores[0]
+
+
+def calculate_yoyo_rising_scores_batch(years, positions, offsets):
+    """
+    Calculates the Yo-Yo and Rising scores for many teams at once.
+
+    The seasons of all teams are held in flat arrays, with the seasons of team `i` at
+    `offsets[i]:offsets[i + 1]`. The slope of the ranks over time is calculated in closed form
+    from per-team sums, and is 0 for teams whose seasons all start in the same year.
 
-    positions = past_data_df["rank"].values
-    years = past_data_df["year"].values
+    Parameters
+    ----------
+    years : array-like of int
+        The start year of each season.
+    positions : array-like of int
+        The overall rank of each season.
+    offsets : array-like of int
+        The start of each team's seasons in `years` and `positions`, followed by the total number of seasons.
 
-    seasons_played = len(years)
+    Returns
+    -------
+    yoyo_scores : list of float
+        The Yo-Yo score of each team, rounded to 3 decimal places. NaN for teams without seasons.
+    rising_scores : list of float
+        The Rising score of each team, rounded to 3 decimal places. NaN for teams without seasons.
+    """
+    years = np.asarray(years, dtype=np.int64)
+    positions = np.asarray(positions, dtype=np.int64)
+    seasons_played = np.diff(np.asarray(offsets, dtype=np.int64))
+    n_teams = len(seasons_played)
+    team_index = np.repeat(np.arange(n_teams), seasons_played)
 
-    # Reshape for sklearn
-    positions_reshaped = positions.reshape(-1, 1)
-    years_reshaped = years.reshape(-1, 1)
+    # Sort by year within each team
+    order = np.lexsort((years, team_index))
+    years = years[order]
+    positions = positions[order]
 
-    yoyo_score = np.sum(np.abs(np.diff(positions))) / seasons_played
+    # Sum the absolute rank differences between consecutive seasons of the same team
+    same_team = team_index[1:] == team_index[:-1]
+    position_changes = np.abs(np.diff(positions))[same_team]
+    position_changes_total = np.bincount(
+        team_index[1:][same_team], weights=position_changes, minlength=n_teams
+    )
 
-    model = LinearRegression()
-    model.fit(years_reshaped, positions_reshaped)
-    slope = model.coef_[0]
+    # Least squares slope from sums, which are exact for integer years and ranks
+    sum_x = np.bincount(team_index, weights=years, minlength=n_teams)
+    sum_y = np.bincount(team_index, weights=positions, minlength=n_teams)
+    sum_xy = np.bincount(team_index, weights=years * positions, minlength=n_teams)
+    sum_xx = np.bincount(team_index, weights=years * years, minlength=n_teams)
+    numerator = seasons_played * sum_xy - sum_x * sum_y
+    denominator = seasons_played * sum_xx - sum_x * sum_x
+    slope = np.divide(
+        numerator, denominator, out=np.zeros(n_teams), where=denominator != 0
+    )
 
-    rising_score = -slope[0]  # Negative slope indicates improvement
+    with np.errstate(invalid="ignore", divide="ignore"):
+        yoyo_scores = position_changes_total / seasons_played
+    rising_scores = np.where(seasons_played > 0, -slope, np.nan)
 
     # Round numbers
-    yoyo_score = round(yoyo_score, 3)
-    rising_score = round(rising_score, 3)
+    yoyo_scores = [round(score, 3) for score in yoyo_scores.tolist()]
+    rising_scores = [round(score, 3) for score in rising_scores.tolist()]
 
-    return yoyo_score, rising_score
+    return yoyo_scores, rising_scores
@@ -1,9 +1,16 @@
+import itertools
 import pandas as pd
 import numpy as np
 
 from src.data_prep.load_data import get_team_data
-from src.data_prep.team_summary.kit import get_kit_information
-from src.data_prep.team_summary.yoyo_rising_score import calculate_yoyo_rising_scores
+from src.data_prep.team_summary.kit import (
+    get_kit_information,
+    get_kit_information_batch,
+)
+from src.data_prep.team_summary.yoyo_rising_score import (
+    calculate_yoyo_rising_scores,
+    calculate_yoyo_rising_scores_batch,
+)
 
 
 def process_team_history(team_history_data):
@@ -78,6 +85,102 @@ def process_team_history(team_history_data):
     return team_summary_history_data
 
 
+def process_team_history_batch(team_past_data):
+    """
+    Batch version of `process_team_history`, processing the historical data of many teams at once.
+
+    The past seasons of all teams are concatenated into flat arrays, and the statistics of each
+    team are computed with segmented reductions over its slice of the arrays.
+
+    Parameters
+    ----------
+    team_past_data : list of list of dict
+        The past seasons' data of each team, i.e. the "past" value of each team's history data.
+
+    Returns
+    -------
+    team_summary_history_data : list of dict
+        The historical statistics of each team, with the same keys and None values as `process_team_history`.
+    """
+    n_teams = len(team_past_data)
+    seasons_played = np.array([len(past) for past in team_past_data], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(seasons_played)])
+    team_index = np.repeat(np.arange(n_teams), seasons_played)
+
+    seasons = list(itertools.chain.from_iterable(team_past_data))
+    start_years = np.array(
+        [int(season["season_name"].split("/")[0]) for season in seasons], dtype=np.int64
+    )
+    ranks = np.array([season["rank"] for season in seasons], dtype=np.int64)
+    total_points = np.array(
+        [season["total_points"] for season in seasons], dtype=np.int64
+    )
+
+    # Get metrics for teams with history, each segment runs to the start of the next
+    has_history = seasons_played > 0
+    segment_starts = offsets[:-1][has_history]
+    min_rank_history = np.zeros(n_teams, dtype=np.int64)
+    max_rank_history = np.zeros(n_teams, dtype=np.int64)
+    max_total_points_history = np.zeros(n_teams, dtype=np.int64)
+    earliest_season_year_history = np.zeros(n_teams, dtype=np.int64)
+    if len(segment_starts) > 0:
+        min_rank_history[has_history] = np.minimum.reduceat(ranks, segment_starts)
+        max_rank_history[has_history] = np.maximum.reduceat(ranks, segment_starts)
+        max_total_points_history[has_history] = np.maximum.reduceat(
+            total_points, segment_starts
+        )
+        earliest_season_year_history[has_history] = np.minimum.reduceat(
+            start_years, segment_starts
+        )
+
+    # Calculate the differences between consecutive years, in the order given
+    same_team = team_index[1:] == team_index[:-1]
+    career_break_history = np.full(n_teams, np.nan)
+    np.fmax.at(
+        career_break_history,
+        team_index[1:][same_team],
+        np.diff(start_years)[same_team].astype(np.float64),
+    )
+
+    yoyo_scores, rising_scores = calculate_yoyo_rising_scores_batch(
+        years=start_years, positions=ranks, offsets=offsets
+    )
+
+    team_summary_history_data = []
+    for i in range(n_teams):
+        if not has_history[i]:
+            team_summary_history_data.append(
+                {
+                    "min_rank_history": None,
+                    "max_rank_history": None,
+                    "max_total_points_history": None,
+                    "earliest_season_year_history": None,
+                    "career_break_history": None,
+                    "seasons_played_in": None,
+                    "yoyo_score": None,
+                    "rising_score": None,
+                }
+            )
+            continue
+
+        # Teams with a single season have no career break (NaN) and no scores (None)
+        multiple_seasons = seasons_played[i] > 1
+        team_summary_history_data.append(
+            {
+                "min_rank_history": int(min_rank_history[i]),
+                "max_rank_history": int(max_rank_history[i]),
+                "max_total_points_history": int(max_total_points_history[i]),
+                "earliest_season_year_history": int(earliest_season_year_history[i]),
+                "career_break_history": float(career_break_history[i]),
+                "seasons_played_in": int(seasons_played[i]),
+                "yoyo_score": yoyo_scores[i] if multiple_seasons else None,
+                "rising_score": rising_scores[i] if multiple_seasons else None,
+            }
+        )
+
+    return team_summary_history_data
+
+
 def aggregate_team_data(team_data, kit_summary_data, team_summary_history_data):
     """
     Aggregates various pieces of team-related data, including current season data, kit information,
@@ -175,3 +278,44 @@ def get_team_summary(team_data, team_history_data):
     )
 
     return team_summary_data
+
+
+def get_team_summary_batch(team_data_list, team_history_data_list):
+    """
+    Batch version of `get_team_summary`, processing the historical data of all teams together.
+
+    Parameters
+    ----------
+    team_data_list : list of dict
+        The current top level data of each team.
+    team_history_data_list : list of dict
+        The historical performance data of each team.
+
+    Returns
+    -------
+    team_summary_data : list of dict
+        The summary of each team, as returned by `get_team_summary`.
+    """
+    # Process team history
+    team_summary_history_data = process_team_history_batch(
+        team_past_data=[
+            team_history_data["past"] for team_history_data in team_history_data_list
+        ]
+    )
+
+    # Get kit information
+    kit_summary_data = get_kit_information_batch(team_data_list=team_data_list)
+
+    # Create team summaries
+    team_summary_data = [
+        aggregate_team_data(
+            team_data,
+            kit_summary_data={
+                column: values[i] for column, values in kit_summary_data.items()
+            },
+            team_summary_history_data=team_summary_history_data[i],
+        )
+        for i, team_data in enumerate(team_data_list)
+    ]
+
+    return team_summary_data
@@ -1,6 +1,82 @@
+import collections
+import math
+
 import pandas as pd
 import numpy as np
 
+from src.profiling.quantile_sketch import KLLSketch
+
+# Columns of the numeric and categorical lookup tables
+LOOKUP_TABLE_NUMERIC_COLUMNS = [
+    "column_name",
+    "percentage",
+    "interpolated_value_above",
+    "interpolated_value_below",
+]
+LOOKUP_TABLE_CATEGORICAL_COLUMNS = [
+    "column_name",
+    "value",
+    "percentage_share",
+    "rank_ascending",
+    "rank_descending",
+]
+
+# Type of each column of the sample data used for profiling
+COLUMN_DATA_TYPES = {
+    "player_region_iso_code_long": "categorical",
+    "name_change_blocked": "categorical",
+    "kit": "categorical",
+    "kit_shirt_type": "categorical",
+    "kit_shirt_logo": "categorical",
+    "kit_socks_type": "categorical",
+    "kit_shorts": "categorical",
+    "kit_full": "categorical",
+    "classic_leagues_competed_in": "numeric",
+    "h2h_leagues_competed_in": "numeric",
+    "last_deadline_bank": "numeric",
+    "last_deadline_value": "numeric",
+    "last_deadline_total_transfers": "numeric",
+    "summary_overall_points": "numeric",
+    "summary_overall_rank": "numeric",
+    "leagues_admin": "numeric",
+    "min_rank_history": "numeric",
+    "max_total_points_history": "numeric",
+    "earliest_season_year_history": "numeric",
+    "career_break_history": "numeric",
+    "seasons_played_in": "numeric",
+    "yoyo_score": "numeric",
+    "rising_score": "numeric",
+    "assists": "numeric",
+    "bonus": "numeric",
+    "bps": "numeric",
+    "clean_sheets": "numeric",
+    "goals_conceded": "numeric",
+    "goals_scored": "numeric",
+    "own_goals": "numeric",
+    "penalties_missed": "numeric",
+    "penalties_saved": "numeric",
+    "red_cards": "numeric",
+    "yellow_cards": "numeric",
+    "saves": "numeric",
+    "rival_team_player": "numeric",
+    "total_players_starters": "numeric",
+    "total_players_all": "numeric",
+    "rival_team_player_categorical": "categorical",
+    "points_on_bench_total": "numeric",
+    "event_transfers_total": "numeric",
+    "event_transfers_cost_total": "numeric",
+    "bank_mean": "numeric",
+    "bank_latest": "numeric",
+    "value_latest": "numeric",
+    "total_points_latest": "numeric",
+    "points_on_bench_percentage": "numeric",
+    "favourite_team": "categorical",
+}
+
+# Numeric columns profiled separately for each value of other columns,
+# given as a column name or a list of column names
+PARTITION_COLUMNS = {"rival_team_player": "favourite_team"}
+
 
 def create_distribution_table_numeric(df, column_name):
     """
@@ -60,54 +136,6 @@ def create_distribution_table_numeric(df, column_name):
     return distribution_table
 
 
-def create_distribution_table_numeric_partitioned(
-    df, column_name, partition_column="Not Specified"
-):
-    """
-    Creates a distribution table for a numeric column, partitioned by another column if specified.
-
-    Parameters
-    ----------
-    df : pd.DataFrame
-        The DataFrame containing the data.
-    column_name : str
-        The name of the numeric column to create the distribution table for.
-    partition_column : str, optional
-        The name of the column to partition the data by (default is "Not Specified").
-
-    Returns
-    -------
-    final_distribution_table : pd.DataFrame
-        A DataFrame containing the partitioned distribution tables combined.
-    """
-    if partition_column == "Not Specified":
-        # No partitioning, just calculate the distribution
-        return create_distribution_table_numeric(df, column_name)
-
-    else:
-        # Partition by the specified column
-        partition_values = df[partition_column].unique()
-        all_partitions = []
-
-        for value in partition_values:
-            partition_df = df[df[partition_column] == value]
-            partition_table = create_distribution_table_numeric(
-                partition_df, column_name
-            )
-
-            # Append partition column info to column_name
-            partition_table["column_name"] = (
-                partition_table["column_name"] + f"_{value}"
-            )
-
-            all_partitions.append(partition_table)
-
-        # Combine all partitions
-        final_distribution_table = pd.concat(all_partitions, ignore_index=True)
-
-        return final_distribution_table
-
-
 def create_lookup_table_numeric(distribution_table, column_name):
     """
     Creates a lookup table for a numeric column using interpolation to estimate values
@@ -167,56 +195,174 @@ def create_lookup_table_numeric(distribution_table, column_name):
     return lookup_table
 
 
-def create_lookup_table_numeric_partitioned(
-    distribution_table, column_name, partition_column="Not Specified"
-):
+def create_lookup_table_numeric_sorted(sorted_values, column_name, weights=None):
     """
-    Creates a lookup table for a numeric column, partitioned by another column if specified. This applies linear interpolation to estimate values
-    at specific percentage points.
+    Creates a lookup table for a numeric column directly from its sorted values.
+
+    This gives the same result as `create_distribution_table_numeric` followed by
+    `create_lookup_table_numeric`, with the distribution computed from the runs of equal values in
+    the sorted data rather than from value counts.
 
     Parameters
     ----------
-    distribution_table : pd.DataFrame
-        The distribution table containing the data.
+    sorted_values : np.ndarray
+        The non-NaN values of the column, sorted in ascending order.
     column_name : str
-        The name of the numeric column to create the lookup table for.
-    partition_column : str, optional
-        The name of the column to partition the data by (default is "Not Specified").
+        The name of the column for which to create the lookup table.
+    weights : np.ndarray, optional
+        The number of rows each value stands for, e.g. the weights of a quantile sketch.
+        Default is one row per value.
 
     Returns
     -------
-    final_lookup_table : pd.DataFrame
-        A DataFrame containing the partitioned lookup tables combined.
+    lookup_table : pd.DataFrame
+        A DataFrame containing interpolated values for specific percentage points above and below.
     """
-    if partition_column == "Not Specified":
-        # Filter the distribution table by the specified column_name
-        filtered_table = distribution_table[
-            distribution_table["column_name"] == column_name
-        ]
+    if weights is None:
+        weights = np.ones(len(sorted_values), dtype=np.int64)
 
-        # Calculate the interpolated values without partitioning
-        return create_lookup_table_numeric(filtered_table, column_name)
+    # Rows at or below each value, and the total number of rows
+    cumulative_weights = np.cumsum(weights)
+    total_non_nan_rows = cumulative_weights[-1]
 
-    else:
-        # Get the unique values of the partition column
-        partition_values = distribution_table["column_name"].unique()
-        all_partitions = []
-
-        for partition in partition_values:
-            # Filter the distribution table by column_name and partition value
-            partitioned_table = distribution_table[
-                (distribution_table["column_name"] == partition)
-            ]
+    # Each unique value is the start of a run of equal values
+    run_starts = np.flatnonzero(
+        np.concatenate([[True], sorted_values[1:] != sorted_values[:-1]])
+    )
+    run_ends = np.append(run_starts[1:], len(sorted_values))
+    values = sorted_values[run_starts]
+    rows_below = cumulative_weights[run_ends - 1]
+    rows_above = total_non_nan_rows - np.concatenate([[0], rows_below[:-1]])
 
-            # Calculate the interpolated values for the current partition
-            lookup_table = create_lookup_table_numeric(partitioned_table, partition)
+    # Percentage of rows that are each value and above, and each value and below
+    percentages_above = np.round((rows_above / total_non_nan_rows) * 100, 3)
+    percentages_below = np.round((rows_below / total_non_nan_rows) * 100, 3)
 
-            all_partitions.append(lookup_table)
+    # Define the new points for interpolation (100 to 1 in increments of 5)
+    new_points = np.arange(100, 0, -5)
 
-        # Combine all lookup tables into one DataFrame
-        final_lookup_table = pd.concat(all_partitions, ignore_index=True)
+    lookup_table = pd.DataFrame(
+        {
+            "column_name": column_name,
+            "percentage": new_points,
+            "interpolated_value_above": np.round(
+                np.interp(new_points, percentages_above[::-1], values[::-1]), 3
+            ),
+            "interpolated_value_below": np.round(
+                np.interp(new_points, percentages_below, values), 3
+            ),
+        }
+    )
 
-        return final_lookup_table
+    return lookup_table
+
+
+def create_lookup_tables_numeric(df, column_names):
+    """
+    Creates the lookup tables for many numeric columns in a single pass.
+
+    All columns are sorted together as one 2D array, and each column's lookup table is computed from
+    its sorted values. Columns without any values are left out.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame containing the data.
+    column_names : list of str
+        The names of the numeric columns to create lookup tables for.
+
+    Returns
+    -------
+    lookup_tables : dict
+        A dictionary mapping each column name to its lookup table (see `create_lookup_table_numeric`).
+    """
+    # NaN values are sorted to the end of each column
+    sorted_values = np.sort(df[column_names].to_numpy(dtype=np.float64), axis=0)
+    non_nan_rows = np.count_nonzero(~np.isnan(sorted_values), axis=0)
+
+    lookup_tables = {
+        column_name: create_lookup_table_numeric_sorted(
+            sorted_values=sorted_values[: non_nan_rows[i], i],
+            column_name=column_name,
+        )
+        for i, column_name in enumerate(column_names)
+        if non_nan_rows[i] > 0
+    }
+
+    return lookup_tables
+
+
+def create_lookup_tables_numeric_partitioned(df, column_name, partition_columns):
+    """
+    Creates the lookup tables for a numeric column partitioned by one or more other columns.
+
+    This gives the same result as filtering the data for each partition and creating its lookup
+    table with `create_lookup_tables_numeric`. Rather than filtering the data for each partition,
+    the rows are sorted once by partition and value, and each partition's lookup table is computed
+    from its segment of the sorted values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame containing the data.
+    column_name : str
+        The name of the numeric column to create the lookup tables for.
+    partition_columns : str or list of str
+        The name of the column, or columns, to partition the data by.
+
+    Returns
+    -------
+    lookup_table : pd.DataFrame
+        A DataFrame containing the partitioned lookup tables combined, with each partition's column
+        name suffixed by its partition values (e.g. "rival_team_player_1.0"). Partitions are in
+        order of first appearance, and rows with a missing partition value are left out.
+    """
+    if isinstance(partition_columns, str):
+        partition_columns = [partition_columns]
+
+    # Number each partition in order of first appearance
+    has_partition = df[partition_columns].notna().all(axis=1).to_numpy()
+    partition_codes, partition_keys = pd.factorize(
+        pd.MultiIndex.from_frame(df.loc[has_partition, partition_columns])
+    )
+    codes = np.full(len(df), -1, dtype=np.int64)
+    codes[has_partition] = partition_codes
+
+    # Sort by partition then value, leaving out rows without a partition or value
+    values = df[column_name].to_numpy(dtype=np.float64)
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes = codes[keep]
+    values = values[keep]
+    order = np.lexsort((values, codes))
+    codes = codes[order]
+    values = values[order]
+
+    # Each partition is a segment of the sorted values
+    segment_starts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+    segment_ends = np.append(segment_starts[1:], len(codes))
+
+    all_partitions = [
+        create_lookup_table_numeric_sorted(
+            sorted_values=values[start:end],
+            column_name=column_name
+            + "".join(f"_{value}" for value in partition_keys[codes[start]]),
+        )
+        for start, end in zip(segment_starts, segment_ends)
+    ]
+
+    if len(all_partitions) == 0:
+        return pd.DataFrame(
+            columns=[
+                "column_name",
+                "percentage",
+                "interpolated_value_above",
+                "interpolated_value_below",
+            ]
+        )
+
+    lookup_table = pd.concat(all_partitions, ignore_index=True)
+
+    return lookup_table
 
 
 def create_lookup_table_categorical(df, column_name):
@@ -230,13 +376,36 @@ def create_lookup_table_categorical(df, column_name):
     column_name : str
         The name of the categorical column to create the lookup table for.
 
+    Returns
+    -------
+    lookup_table : pd.DataFrame
+        A DataFrame containing the proportion and rank of each unique value.
+    """
+    lookup_table = create_lookup_table_categorical_counts(
+        value_counts=df[column_name].value_counts(), column_name=column_name
+    )
+
+    return lookup_table
+
+
+def create_lookup_table_categorical_counts(value_counts, column_name):
+    """
+    Creates a lookup table for a categorical column from the count of each unique value.
+
+    Parameters
+    ----------
+    value_counts : pd.Series
+        The count of each unique value, indexed by value and sorted in descending order of count.
+    column_name : str
+        The name of the categorical column to create the lookup table for.
+
     Returns
     -------
     lookup_table : pd.DataFrame
         A DataFrame containing the proportion and rank of each unique value.
     """
     # Calculate the proportion of each unique value
-    percentage_share = df[column_name].value_counts(normalize=True)
+    percentage_share = value_counts / value_counts.sum()
 
     # Create lookup table
     lookup_table = pd.DataFrame(
@@ -279,104 +448,39 @@ def create_lookup_tables_aggregated(df, impute_nulls):
     lookup_table_categorical : pd.DataFrame
         A DataFrame containing the categorical lookup tables.
     """
-    column_data_types = {
-        "player_region_iso_code_long": "categorical",
-        "name_change_blocked": "categorical",
-        "kit": "categorical",
-        "kit_shirt_type": "categorical",
-        "kit_shirt_logo": "categorical",
-        "kit_socks_type": "categorical",
-        "kit_shorts": "categorical",
-        "kit_full": "categorical",
-        "classic_leagues_competed_in": "numeric",
-        "h2h_leagues_competed_in": "numeric",
-        "last_deadline_bank": "numeric",
-        "last_deadline_value": "numeric",
-        "last_deadline_total_transfers": "numeric",
-        "summary_overall_points": "numeric",
-        "summary_overall_rank": "numeric",
-        "leagues_admin": "numeric",
-        "min_rank_history": "numeric",
-        "max_total_points_history": "numeric",
-        "earliest_season_year_history": "numeric",
-        "career_break_history": "numeric",
-        "seasons_played_in": "numeric",
-        "yoyo_score": "numeric",
-        "rising_score": "numeric",
-        "assists": "numeric",
-        "bonus": "numeric",
-        "bps": "numeric",
-        "clean_sheets": "numeric",
-        "goals_conceded": "numeric",
-        "goals_scored": "numeric",
-        "own_goals": "numeric",
-        "penalties_missed": "numeric",
-        "penalties_saved": "numeric",
-        "red_cards": "numeric",
-        "yellow_cards": "numeric",
-        "saves": "numeric",
-        "rival_team_player": "numeric",
-        "total_players_starters": "numeric",
-        "total_players_all": "numeric",
-        "rival_team_player_categorical": "categorical",
-        "points_on_bench_total": "numeric",
-        "event_transfers_total": "numeric",
-        "event_transfers_cost_total": "numeric",
-        "bank_mean": "numeric",
-        "bank_latest": "numeric",
-        "value_latest": "numeric",
-        "total_points_latest": "numeric",
-        "points_on_bench_percentage": "numeric",
-        "favourite_team": "categorical",
-    }
-
-    partition_columns = {"rival_team_player": "favourite_team"}
-
     # Fill NaN values in each column with specified values
     df = df.fillna(value=impute_nulls)
 
-    lookup_table_numeric = pd.DataFrame(
-        columns=[
-            "column_name",
-            "percentage",
-            "interpolated_value_above",
-            "interpolated_value_below",
-        ]
-    )
-    lookup_table_categorical = pd.DataFrame(
-        columns=[
-            "column_name",
-            "value",
-            "percentage_share",
-            "rank_ascending",
-            "rank_descending",
-        ]
+    lookup_table_numeric = pd.DataFrame(columns=LOOKUP_TABLE_NUMERIC_COLUMNS)
+    lookup_table_categorical = pd.DataFrame(columns=LOOKUP_TABLE_CATEGORICAL_COLUMNS)
+
+    # Create lookup tables for all numeric columns without a partition at once
+    unpartitioned_lookup_tables = create_lookup_tables_numeric(
+        df=df,
+        column_names=[
+            column_name
+            for column_name, column_type in COLUMN_DATA_TYPES.items()
+            if column_type == "numeric" and column_name not in PARTITION_COLUMNS
+        ],
     )
 
-    for column_name, column_type in column_data_types.items():
-        if column_type == "numeric":
-            # Get partition
-            try:
-                partition_column = partition_columns[column_name]
-            except:
-                partition_column = "Not Specified"
-
-            distribution_table_stage_numeric = (
-                create_distribution_table_numeric_partitioned(
-                    df=df, column_name=column_name, partition_column=partition_column
+    for column_name, column_type in COLUMN_DATA_TYPES.items():
+        if column_type == "numeric" and column_name not in PARTITION_COLUMNS:
+            if column_name in unpartitioned_lookup_tables:
+                lookup_table_numeric = pd.concat(
+                    [lookup_table_numeric, unpartitioned_lookup_tables[column_name]],
+                    axis=0,
                 )
+        elif column_type == "numeric":
+            lookup_table_stage_numeric = create_lookup_tables_numeric_partitioned(
+                df=df,
+                column_name=column_name,
+                partition_columns=PARTITION_COLUMNS[column_name],
             )
-            if len(distribution_table_stage_numeric) > 0:
-                lookup_table_stage_numeric = create_lookup_table_numeric_partitioned(
-                    distribution_table=distribution_table_stage_numeric,
-                    column_name=column_name,
-                    partition_column=partition_column,
-                )
+            if len(lookup_table_stage_numeric) > 0:
                 lookup_table_numeric = pd.concat(
                     [lookup_table_numeric, lookup_table_stage_numeric], axis=0
                 )
-            else:
-                continue
         elif column_type == "categorical":
             lookup_table_stage_categorical = create_lookup_table_categorical(
                 df=df, column_name=column_name
@@ -387,3 +491,204 @@ def create_lookup_tables_aggregated(df, impute_nulls):
             )
 
     return lookup_table_numeric, lookup_table_categorical
+
+
+def get_sketch_seed(seed, lookup_column_name):
+    """
+    Derives the seed of the numeric sketch of a lookup column, so each column is compacted with
+    its own reproducible random choices.
+
+    Parameters
+    ----------
+    seed : int or None
+        The seed of the profile sketch, or None for unseeded sketches.
+    lookup_column_name : str
+        The name of the lookup column, including any partition values.
+
+    Returns
+    -------
+    sketch_seed : str or None
+        The seed of the column's sketch, or None if `seed` is None.
+    """
+    if seed is None:
+        return None
+    sketch_seed = f"{seed}_{lookup_column_name}"
+    return sketch_seed
+
+
+def update_profile_sketch(profile_sketch, team_data, impute_nulls, k=200, seed=None):
+    """
+    Adds a team's data to a profile sketch, so the sample can be profiled team by team.
+
+    Numeric columns are held in a `KLLSketch` per column (and per partition value for partitioned
+    columns), and categorical columns in a count of each value, so memory stays bounded however
+    many teams are profiled.
+
+    Parameters
+    ----------
+    profile_sketch : dict
+        The profile sketch to update in place. Start from an empty dictionary.
+    team_data : dict
+        A dictionary containing the team's data, with the columns in `COLUMN_DATA_TYPES`.
+    impute_nulls : dict
+        A dictionary specifying the values to use for imputing missing data.
+    k : int, optional
+        The size of each numeric sketch (see `KLLSketch`). Default is 200.
+    seed : int, optional
+        Seed for the numeric sketches created, so that the sketches are reproducible (see
+        `get_sketch_seed`). Default is None, for unseeded sketches.
+
+    Returns
+    -------
+    None
+    """
+    numeric_sketches = profile_sketch.setdefault("numeric", {})
+    categorical_counts = profile_sketch.setdefault("categorical", {})
+
+    def get_value(column_name):
+        value = team_data.get(column_name)
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            value = impute_nulls.get(column_name, value)
+        return value
+
+    for column_name, column_type in COLUMN_DATA_TYPES.items():
+        value = get_value(column_name)
+
+        if column_type == "numeric":
+            if column_name in PARTITION_COLUMNS:
+                partition_columns = PARTITION_COLUMNS[column_name]
+                if isinstance(partition_columns, str):
+                    partition_columns = [partition_columns]
+                partition_values = [
+                    get_value(partition_column)
+                    for partition_column in partition_columns
+                ]
+                if any(value is None or value != value for value in partition_values):
+                    continue
+                lookup_column_name = column_name + "".join(
+                    f"_{partition_value}" for partition_value in partition_values
+                )
+            else:
+                lookup_column_name = column_name
+
+            column_sketches = numeric_sketches.setdefault(column_name, {})
+            if lookup_column_name not in column_sketches:
+                column_sketches[lookup_column_name] = KLLSketch(
+                    k=k, seed=get_sketch_seed(seed, lookup_column_name)
+                )
+            column_sketches[lookup_column_name].update(value)
+
+        elif column_type == "categorical":
+            value_counts = categorical_counts.setdefault(
+                column_name, collections.Counter()
+            )
+            if value is not None and value == value:
+                value_counts[value] += 1
+
+
+def merge_profile_sketches(profile_sketch, other_profile_sketch, seed=None):
+    """
+    Merges a profile sketch into another, e.g. to combine the sketches built by separate workers.
+
+    Parameters
+    ----------
+    profile_sketch : dict
+        The profile sketch to merge into, updated in place.
+    other_profile_sketch : dict
+        The profile sketch to merge. It is not modified.
+    seed : int, optional
+        Seed for the numeric sketches created in `profile_sketch` (see `get_sketch_seed`).
+        Default is None, for unseeded sketches.
+
+    Returns
+    -------
+    None
+    """
+    numeric_sketches = profile_sketch.setdefault("numeric", {})
+    categorical_counts = profile_sketch.setdefault("categorical", {})
+
+    for column_name, other_column_sketches in other_profile_sketch.get(
+        "numeric", {}
+    ).items():
+        column_sketches = numeric_sketches.setdefault(column_name, {})
+        for lookup_column_name, other_sketch in other_column_sketches.items():
+            if lookup_column_name not in column_sketches:
+                column_sketches[lookup_column_name] = KLLSketch(
+                    k=other_sketch.k, seed=get_sketch_seed(seed, lookup_column_name)
+                )
+            column_sketches[lookup_column_name].merge(other_sketch)
+
+    for column_name, other_value_counts in other_profile_sketch.get(
+        "categorical", {}
+    ).items():
+        categorical_counts.setdefault(column_name, collections.Counter()).update(
+            other_value_counts
+        )
+
+
+def create_lookup_tables_from_sketch(profile_sketch):
+    """
+    Creates the numeric and categorical lookup tables from a profile sketch.
+
+    The tables have the same format as `create_lookup_tables_aggregated`, and are identical to it
+    while every numeric sketch holds no more than `k` values.
+
+    Parameters
+    ----------
+    profile_sketch : dict
+        The profile sketch (see `update_profile_sketch`).
+
+    Returns
+    -------
+    lookup_table_numeric : pd.DataFrame
+        A DataFrame containing the numeric lookup tables.
+    lookup_table_categorical : pd.DataFrame
+        A DataFrame containing the categorical lookup tables.
+    """
+    numeric_sketches = profile_sketch.get("numeric", {})
+    categorical_counts = profile_sketch.get("categorical", {})
+
+    lookup_tables_numeric = []
+    lookup_tables_categorical = []
+
+    for column_name, column_type in COLUMN_DATA_TYPES.items():
+        if column_type == "numeric":
+            for lookup_column_name, sketch in numeric_sketches.get(
+                column_name, {}
+            ).items():
+                if sketch.count == 0:
+                    continue
+                sorted_values, weights = sketch.get_weighted_values()
+                lookup_tables_numeric.append(
+                    create_lookup_table_numeric_sorted(
+                        sorted_values=sorted_values,
+                        column_name=lookup_column_name,
+                        weights=weights,
+                    )
+                )
+        elif column_type == "categorical":
+            value_counts = categorical_counts.get(column_name)
+            if not value_counts:
+                continue
+            lookup_tables_categorical.append(
+                create_lookup_table_categorical_counts(
+                    value_counts=pd.Series(value_counts).sort_values(
+                        ascending=False, kind="stable"
+                    ),
+                    column_name=column_name,
+                )
+            )
+
+    # Samples without teams have empty lookup tables
+    if len(lookup_tables_numeric) > 0:
+        lookup_table_numeric = pd.concat(lookup_tables_numeric, axis=0)
+    else:
+        lookup_table_numeric = pd.DataFrame(columns=LOOKUP_TABLE_NUMERIC_COLUMNS)
+    if len(lookup_tables_categorical) > 0:
+        lookup_table_categorical = pd.concat(lookup_tables_categorical, axis=0)
+    else:
+        lookup_table_categorical = pd.DataFrame(
+            columns=LOOKUP_TABLE_CATEGORICAL_COLUMNS
+        )
+
+    return lookup_table_numeric, lookup_table_categorical
@@ -1,7 +1,124 @@
+import functools
+import os
+
 import pandas as pd
 import inflect
 
 
+class CategoricalLookup:
+    """
+    Categorical lookup table compiled into a dictionary for fast lookups.
+
+    Each (column name, value) pair maps to its percentage share and ranks, and each column holds a
+    default for values that did not appear in the training data (see `add_new_row_if_missing`).
+
+    Parameters
+    ----------
+    lookup_table_categorical : pd.DataFrame
+        DataFrame containing categorical lookup data with columns 'column_name',
+        'value', 'percentage_share', 'rank_ascending', and 'rank_descending'.
+    """
+
+    def __init__(self, lookup_table_categorical):
+        self.values = {}
+        for row in lookup_table_categorical[
+            [
+                "column_name",
+                "value",
+                "percentage_share",
+                "rank_ascending",
+                "rank_descending",
+            ]
+        ].itertuples(index=False):
+            # Values are matched as strings, and the first matching row is used
+            if isinstance(row.value, str):
+                self.values.setdefault(
+                    (row.column_name, row.value),
+                    (row.percentage_share, row.rank_ascending, row.rank_descending),
+                )
+
+        self.rank_ascending_max = (
+            lookup_table_categorical.groupby("column_name")["rank_ascending"]
+            .max()
+            .to_dict()
+        )
+
+    def get_rank_and_percentage(self, feature_name, value):
+        """
+        Look up the percentage and ranks of a categorical feature value.
+
+        This gives the same result as `team_medal_categorical` on the uncompiled lookup table.
+
+        Parameters
+        ----------
+        feature_name : str
+            The name of the feature to lookup.
+        value : str
+            The value to compare against the lookup table.
+
+        Returns
+        -------
+        percentage : int
+            The percentage corresponding to the feature and value.
+        rank_ascending : int
+            The rank in ascending order.
+        rank_descending : int
+            The rank in descending order.
+        """
+        try:
+            percentage_share, rank_ascending, rank_descending = self.values[
+                (feature_name, str(value))
+            ]
+        except KeyError:
+            # Values missing from the training data are ranked as the rarest
+            percentage_share = 0.01
+            rank_ascending = self.rank_ascending_max.get(feature_name, float("nan"))
+            rank_descending = 1.0
+
+        percentage = int(round(100 * percentage_share, 0))
+
+        return percentage, rank_ascending, rank_descending
+
+
+@functools.lru_cache(maxsize=4)
+def read_categorical_lookup(file_path, modified_time):
+    """
+    Reads and compiles the categorical lookup table. Results are cached per file and modification time.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the categorical lookup table CSV.
+    modified_time : float
+        The modification time of the file, used to invalidate the cache when it is rewritten.
+
+    Returns
+    -------
+    CategoricalLookup
+        The compiled categorical lookup table.
+    """
+    return CategoricalLookup(pd.read_csv(file_path))
+
+
+def load_categorical_lookup(
+    file_path="data/variable_lookup_tables/categorical_columns.csv",
+):
+    """
+    Loads the compiled categorical lookup table, compiling it only when the file has changed.
+
+    Parameters
+    ----------
+    file_path : str, optional
+        The path of the categorical lookup table CSV.
+
+    Returns
+    -------
+    CategoricalLookup
+        The compiled categorical lookup table.
+    """
+    return read_categorical_lookup(file_path, os.path.getmtime(file_path))
+
+
 def add_new_row_if_missing(filtered_df, lookup_table_categorical, feature_name, value):
     """
     Add a new row to the filtered DataFrame if the feature value did not appear in the training data.
@@ -74,9 +191,10 @@ def team_medal_categorical(lookup_table_categorical, feature_name, value):
 
     Parameters
     ----------
-    lookup_table_categorical : pd.DataFrame
+    lookup_table_categorical : pd.DataFrame or CategoricalLookup
         DataFrame containing categorical lookup data with columns 'column_name',
-        'value', 'percentage_share', 'rank_ascending', and 'rank_descending'.
+        'value', 'percentage_share', 'rank_ascending', and 'rank_descending', or the compiled
+        lookup table.
     feature_name : str
         The name of the feature to lookup.
     value : str
@@ -91,6 +209,11 @@ def team_medal_categorical(lookup_table_categorical, feature_name, value):
     rank_descending : int
         The rank in descending order.
     """
+    if isinstance(lookup_table_categorical, CategoricalLookup):
+        return lookup_table_categorical.get_rank_and_percentage(
+            feature_name=feature_name, value=value
+        )
+
     # Filter the lookup table for the given feature and value
     filtered_df = lookup_table_categorical[
         (lookup_table_categorical["column_name"] == feature_name)
@@ -148,126 +271,3 @@ def generate_categorical_overview(
     overview = overview.replace("<value>", value)
 
     return overview
-
-
-def assign_categorical_medal(percentage, medal_details):
-    """
-    Assign a medal (Gold, Silver, Bronze, or No Medal) based on the percentage and medal thresholds.
-
-    Parameters
-    ----------
-    percentage : int
-        The percentage share of the feature.
-    medal_details : dict
-        Dictionary with medal threshold details including 'gold_threshold',
-        'silver_threshold', and 'bronze_threshold'.
-
-    Returns
-    -------
-    medal : str
-        The assigned medal ('Gold', 'Silver', 'Bronze', or 'No Medal').
-    """
-    if percentage <= medal_details["gold_threshold"]:
-        return "Gold"
-    elif percentage <= medal_details["silver_threshold"]:
-        return "Silver"
-    elif percentage <= medal_details["bronze_threshold"]:
-        return "Bronze"
-    return "No Medal"
-
-
-def process_categorical_medal(
-    medal_name, medal_details, team_data, lookup_table_categorical
-):
-    """
-    Process a single categorical medal, calculate the ranks and percentage, and generate the result row.
-
-    Parameters
-    ----------
-    medal_name : str
-        Name of the categorical medal to process.
-    medal_details : dict
-        Dictionary with details of the categorical medal.
-    team_data : dict
-        Dictionary containing the team's data for comparison.
-    lookup_table_categorical : pd.DataFrame
-        DataFrame containing lookup data for categorical features.
-
-    Returns
-    -------
-    medal_entry : pd.DataFrame
-        DataFrame containing a single row of processed medal information.
-    """
-    feature_name = medal_details["feature_name"]
-    value = team_data[feature_name]
-
-    # Retrieve percentage and ranks using team_medal_categorical
-    percentage, rank_ascending, rank_descending = team_medal_categorical(
-        lookup_table_categorical=lookup_table_categorical,
-        feature_name=feature_name,
-        value=value,
-    )
-
-    # Determine the medal type based on thresholds
-    medal = assign_categorical_medal(percentage, medal_details)
-
-    # Generate the overview text
-    overview = generate_categorical_overview(
-        medal_details, percentage, rank_ascending, rank_descending, value
-    )
-
-    # Create the result DataFrame entry
-    medal_entry = pd.DataFrame(
-        [
-            {
-                "Medal Name": medal_name,
-                "Medal": medal,
-                "Overview": overview,
-                "image_path": medal_details["image_path"],
-                "medal_background": medal_details["medal_background"],
-            }
-        ]
-    )
-
-    return medal_entry
-
-
-def get_categorical_medals(
-    medal_details_categorical, lookup_table_categorical, team_data
-):
-    """
-    Calculate medals for categorical features based on thresholds and team data.
-
-    Parameters
-    ----------
-    medal_details_categorical : dict
-        Dictionary with medal details for categorical features including 'feature_name',
-        'gold_threshold', 'silver_threshold', 'bronze_threshold', 'text', 'image_path',
-        and 'medal_background'.
-    lookup_table_categorical : pd.DataFrame
-        DataFrame containing categorical lookup data.
-    team_data : dict
-        Dictionary containing the team's data for comparison.
-
-    Returns
-    -------
-    medals : pd.DataFrame
-        DataFrame with the results for all categorical medals including columns for 'Medal Name',
-        'Medal', 'Overview', 'image_path', and 'medal_background'.
-    """
-    medals = pd.DataFrame(
-        columns=["Medal Name", "Medal", "Overview", "image_path", "medal_background"]
-    )
-
-    for medal_name, medal_details in medal_details_categorical.items():
-        # Process each categorical medal
-        medal_entry = process_categorical_medal(
-            medal_name=medal_name,
-            medal_details=medal_details,
-            team_data=team_data,
-            lookup_table_categorical=lookup_table_categorical,
-        )
-        # Append the medal entry to the medals DataFrame
-        medals = pd.concat([medals, medal_entry], axis=0, ignore_index=True)
-
-    return medals
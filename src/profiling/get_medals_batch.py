@@ -0,0 +1,374 @@
+import numpy as np
+import pandas as pd
+from src.profiling.get_binary_medals import generate_overview_text
+from src.profiling.get_categorical_medals import (
+    CategoricalLookup,
+    generate_categorical_overview,
+    team_medal_categorical,
+)
+from src.profiling.get_numeric_medals import (
+    NumericLookup,
+    apply_manual_adjustments,
+    format_overview,
+    get_feature_partition,
+    is_medal_excluded,
+)
+
+SPECIAL_MEDAL_NAME = "Harry Kane Award"
+
+
+def get_feature_values(team_features):
+    """
+    Get the values of every feature for all teams.
+
+    Parameters
+    ----------
+    team_features : pd.DataFrame
+        DataFrame with one row per team and one column per feature.
+
+    Returns
+    -------
+    feature_values : dict
+        A dictionary mapping each feature name to an object array with the value of each team.
+    """
+    feature_values = dict(
+        zip(team_features.columns, team_features.to_numpy(dtype=object).T)
+    )
+    return feature_values
+
+
+def assign_medal_tiers(percentages, medal_details):
+    """
+    Vectorised equivalent of `determine_medal`, assigning a medal to each percentage.
+
+    Parameters
+    ----------
+    percentages : np.ndarray
+        The percentage of each team for the feature.
+    medal_details : dict
+        Dictionary containing medal thresholds.
+
+    Returns
+    -------
+    medals : np.ndarray
+        Object array with the medal of each team: 'Gold', 'Silver', 'Bronze', or 'No Medal'.
+    """
+    medals = np.select(
+        [
+            percentages <= medal_details["gold_threshold"],
+            percentages <= medal_details["silver_threshold"],
+            percentages <= medal_details["bronze_threshold"],
+        ],
+        ["Gold", "Silver", "Bronze"],
+        default="No Medal",
+    ).astype(object)
+    return medals
+
+
+def get_numeric_medal_tiers_batch(
+    medal_details_numeric, lookup_table_numeric, feature_values, n_teams
+):
+    """
+    Calculate the numeric medals of many teams at once.
+
+    Each medal is a column, with the percentages of all teams found in one binary search per
+    partition value.
+
+    Parameters
+    ----------
+    medal_details_numeric : dict
+        Dictionary with medal details for numeric features.
+    lookup_table_numeric : NumericLookup
+        The compiled numeric lookup table.
+    feature_values : dict
+        A dictionary mapping each feature name to the value of each team (see `get_feature_values`).
+    n_teams : int
+        The number of teams.
+
+    Returns
+    -------
+    medal_tiers : dict
+        A dictionary mapping each medal name to an object array with the medal of each team:
+        'Gold', 'Silver', 'Bronze', 'No Medal', or None where the team has no value for the feature.
+    """
+    medal_tiers = {}
+
+    for medal_name, medal_details in medal_details_numeric.items():
+        feature_name = medal_details["feature_name"]
+        objective = medal_details["objective"]
+        values = feature_values.get(feature_name)
+        if values is None:
+            values = np.full(n_teams, None, dtype=object)
+        missing = np.array([value is None for value in values], dtype=bool)
+        numeric_values = np.where(missing, np.nan, values).astype(np.float64)
+
+        if (
+            "partition_feature" in medal_details
+            and medal_details["partition_feature"] in feature_values
+        ):
+            partition_values = feature_values[medal_details["partition_feature"]]
+        else:
+            partition_values = np.full(n_teams, "Not Specified", dtype=object)
+
+        # Look up the teams of each partition value together
+        partitions = {}
+        for position, partition_value in enumerate(partition_values):
+            partitions.setdefault(partition_value, []).append(position)
+
+        percentages = np.full(n_teams, 100.0)
+        excluded = np.zeros(n_teams, dtype=bool)
+        for partition_value, positions in partitions.items():
+            if partition_value != "Not Specified":
+                lookup_feature_name = f"{feature_name}_{partition_value}"
+            else:
+                lookup_feature_name = feature_name
+            percentages[positions] = lookup_table_numeric.get_percentages(
+                feature_name=lookup_feature_name,
+                values=numeric_values[positions],
+                objective=objective,
+            )
+            excluded[positions] = is_medal_excluded(medal_details, partition_value)
+
+        medals = assign_medal_tiers(percentages, medal_details)
+        medals[excluded] = "No Medal"
+        medals[missing] = None
+        medal_tiers[medal_name] = medals
+
+    return medal_tiers
+
+
+def get_categorical_medal_tiers_batch(
+    medal_details_categorical, lookup_table_categorical, feature_values
+):
+    """
+    Calculate the categorical medals of many teams at once.
+
+    Parameters
+    ----------
+    medal_details_categorical : dict
+        Dictionary with medal details for categorical features.
+    lookup_table_categorical : CategoricalLookup
+        The compiled categorical lookup table.
+    feature_values : dict
+        A dictionary mapping each feature name to the value of each team (see `get_feature_values`).
+
+    Returns
+    -------
+    medal_tiers : dict
+        A dictionary mapping each medal name to an object array with the medal of each team:
+        'Gold', 'Silver', 'Bronze' or 'No Medal'.
+    """
+    medal_tiers = {}
+
+    for medal_name, medal_details in medal_details_categorical.items():
+        feature_name = medal_details["feature_name"]
+        percentages = np.array(
+            [
+                lookup_table_categorical.get_rank_and_percentage(feature_name, value)[0]
+                for value in feature_values[feature_name]
+            ],
+            dtype=np.float64,
+        )
+        medal_tiers[medal_name] = assign_medal_tiers(percentages, medal_details)
+
+    return medal_tiers
+
+
+def get_binary_medal_tiers_batch(medal_details_binary, feature_values):
+    """
+    Calculate the binary medals of many teams at once.
+
+    Parameters
+    ----------
+    medal_details_binary : dict
+        Dictionary with medal details for binary features.
+    feature_values : dict
+        A dictionary mapping each feature name to the value of each team (see `get_feature_values`).
+
+    Returns
+    -------
+    medal_tiers : dict
+        A dictionary mapping each medal name to an object array with the medal of each team:
+        'Gold' or 'No Medal'.
+    """
+    medal_tiers = {}
+
+    for medal_name, medal_details in medal_details_binary.items():
+        values = feature_values[medal_details["feature_name"]]
+        gold = values == medal_details["gold_values"]
+        medal_tiers[medal_name] = np.where(gold, "Gold", "No Medal").astype(object)
+
+    return medal_tiers
+
+
+def get_medal_tiers_batch(
+    medal_details_numeric,
+    lookup_table_numeric,
+    medal_details_categorical,
+    lookup_table_categorical,
+    medal_details_binary,
+    team_features,
+):
+    """
+    Calculate all medals (special, numeric, categorical, binary) of many teams at once.
+
+    Parameters
+    ----------
+    medal_details_numeric : dict
+        Dictionary with medal details for numeric features.
+    lookup_table_numeric : pd.DataFrame or NumericLookup
+        DataFrame with numeric lookup data, or the compiled lookup table.
+    medal_details_categorical : dict
+        Dictionary with medal details for categorical features.
+    lookup_table_categorical : pd.DataFrame or CategoricalLookup
+        DataFrame with categorical lookup data, or the compiled lookup table.
+    medal_details_binary : dict
+        Dictionary with medal details for binary features.
+    team_features : pd.DataFrame
+        DataFrame with one row per team and one column per feature, with object dtype so that
+        missing values (None) are kept apart from NaN.
+
+    Returns
+    -------
+    medal_tiers : pd.DataFrame
+        DataFrame with one row per team and one column per medal, starting with the special medal
+        for teams without any Gold medals. Holds 'Gold', 'Silver', 'Bronze', 'No Medal', or None
+        where the medal does not apply to the team.
+    """
+    if not isinstance(lookup_table_numeric, NumericLookup):
+        lookup_table_numeric = NumericLookup(lookup_table_numeric)
+    if not isinstance(lookup_table_categorical, CategoricalLookup):
+        lookup_table_categorical = CategoricalLookup(lookup_table_categorical)
+
+    feature_values = get_feature_values(team_features)
+    medal_tiers = {
+        **get_numeric_medal_tiers_batch(
+            medal_details_numeric,
+            lookup_table_numeric,
+            feature_values,
+            n_teams=len(team_features),
+        ),
+        **get_categorical_medal_tiers_batch(
+            medal_details_categorical, lookup_table_categorical, feature_values
+        ),
+        **get_binary_medal_tiers_batch(medal_details_binary, feature_values),
+    }
+
+    # Add special medal if no gold medals are present
+    no_gold = ~np.any(
+        [medals == "Gold" for medals in medal_tiers.values()], axis=0
+    )
+    medal_tiers = {
+        SPECIAL_MEDAL_NAME: np.where(no_gold, "Gold", None).astype(object),
+        **medal_tiers,
+    }
+
+    medal_tiers = pd.DataFrame(medal_tiers, index=team_features.index, dtype=object)
+
+    return medal_tiers
+
+
+def get_awarded_medals(medal_tiers):
+    """
+    List the medals awarded to each team from the medal tiers.
+
+    Parameters
+    ----------
+    medal_tiers : pd.DataFrame
+        DataFrame with one row per team and one column per medal (see `get_medal_tiers_batch`).
+
+    Returns
+    -------
+    awarded_medals : pd.DataFrame
+        DataFrame with a row for each medal awarded, with columns 'team_index' (the index of the
+        team in `medal_tiers`), 'Medal Name' and 'Medal'. Rows are in order of team and then medal.
+    """
+    tiers = medal_tiers.to_numpy(dtype=object)
+    awarded = pd.notna(tiers) & (tiers != "No Medal")
+    team_positions, medal_positions = np.nonzero(awarded)
+
+    awarded_medals = pd.DataFrame(
+        {
+            "team_index": medal_tiers.index[team_positions],
+            "Medal Name": medal_tiers.columns[medal_positions],
+            "Medal": tiers[team_positions, medal_positions],
+        }
+    )
+
+    return awarded_medals
+
+
+def get_medal_overview(
+    medal_name,
+    medal_details_numeric,
+    lookup_table_numeric,
+    medal_details_categorical,
+    lookup_table_categorical,
+    medal_details_binary,
+    medal_details_special,
+    team_data,
+):
+    """
+    Generate the overview text of a medal awarded to a team.
+
+    Parameters
+    ----------
+    medal_name : str
+        The name of the medal.
+    medal_details_numeric : dict
+        Dictionary with medal details for numeric features.
+    lookup_table_numeric : NumericLookup
+        The compiled numeric lookup table.
+    medal_details_categorical : dict
+        Dictionary with medal details for categorical features.
+    lookup_table_categorical : CategoricalLookup
+        The compiled categorical lookup table.
+    medal_details_binary : dict
+        Dictionary with medal details for binary features.
+    medal_details_special : dict
+        Dictionary with special medal details.
+    team_data : dict
+        Dictionary containing the team's data.
+
+    Returns
+    -------
+    overview : str
+        The overview text of the medal.
+    """
+    if medal_name in medal_details_numeric:
+        medal_details = medal_details_numeric[medal_name]
+        value = team_data.get(medal_details["feature_name"])
+        partition_value = get_feature_partition(medal_details, team_data)
+        percentage = lookup_table_numeric.get_percentage(
+            feature_name=medal_details["feature_name"],
+            value=value,
+            objective=medal_details["objective"],
+            partition_value=partition_value,
+        )
+        value, _ = apply_manual_adjustments(
+            medal_details, value, partition_value, medal=None
+        )
+        return format_overview(medal_details, percentage, value, partition_value)
+
+    if medal_name in medal_details_categorical:
+        medal_details = medal_details_categorical[medal_name]
+        value = team_data[medal_details["feature_name"]]
+        percentage, rank_ascending, rank_descending = team_medal_categorical(
+            lookup_table_categorical, medal_details["feature_name"], value
+        )
+        return generate_categorical_overview(
+            medal_details, percentage, rank_ascending, rank_descending, value
+        )
+
+    if medal_name in medal_details_binary:
+        medal_details = medal_details_binary[medal_name]
+        percentage, rank_ascending, rank_descending = team_medal_categorical(
+            lookup_table_categorical,
+            medal_details["feature_name"],
+            team_data[medal_details["feature_name"]],
+        )
+        return generate_overview_text(
+            medal_details, percentage, rank_ascending, rank_descending
+        )
+
+    return medal_details_special[medal_name]["text"]
@@ -1,3 +1,7 @@
+import functools
+import os
+
+import numpy as np
 import pandas as pd
 from src.app_tools.yaml_loader import load_yaml_file
 
@@ -6,6 +10,173 @@ yaml_file_path = "conf/rival_teams.yaml"
 rival_teams = load_yaml_file(yaml_file_path)
 
 
+class NumericLookup:
+    """
+    Numeric lookup table compiled for fast percentage lookups.
+
+    For each column of the lookup table, the interpolated values are held in sorted arrays
+    alongside the running minimum of their percentages, so the percentage for a value is found
+    with a binary search rather than by filtering the whole table.
+
+    Parameters
+    ----------
+    lookup_table_numeric : pd.DataFrame
+        DataFrame containing numeric lookup data.
+    """
+
+    def __init__(self, lookup_table_numeric):
+        self.features = {}
+        for feature_name, feature_table in lookup_table_numeric.groupby(
+            "column_name", sort=False
+        ):
+            percentages = feature_table["percentage"].to_numpy()
+            values_below = feature_table["interpolated_value_below"].to_numpy(
+                dtype=np.float64
+            )
+            values_above = feature_table["interpolated_value_above"].to_numpy(
+                dtype=np.float64
+            )
+
+            # Rows with a value below of at least a given value are a suffix
+            keep = ~np.isnan(values_below)
+            order = np.argsort(values_below[keep], kind="stable")
+            sorted_below = values_below[keep][order]
+            suffix_min_below = np.minimum.accumulate(
+                percentages[keep][order][::-1]
+            )[::-1]
+
+            # Rows with a value above of at most a given value are a prefix
+            keep = ~np.isnan(values_above)
+            order = np.argsort(values_above[keep], kind="stable")
+            sorted_above = values_above[keep][order]
+            prefix_min_above = np.minimum.accumulate(percentages[keep][order])
+
+            self.features[feature_name] = (
+                sorted_below,
+                suffix_min_below,
+                sorted_above,
+                prefix_min_above,
+            )
+
+    def get_percentage(
+        self, feature_name, value, objective, partition_value="Not Specified"
+    ):
+        """
+        Calculate the percentage based on a numeric feature, objective, and partition value.
+
+        This gives the same result as `calculate_percentage` on the uncompiled lookup table.
+
+        Parameters
+        ----------
+        feature_name : str
+            The name of the feature to lookup.
+        value : float
+            The value to compare against the lookup table.
+        objective : str
+            The objective for the comparison, either 'minimise' or 'maximise'.
+        partition_value : str, optional
+            The partition value used to refine the feature name. Default is 'Not Specified'.
+
+        Returns
+        -------
+        float
+            The percentage corresponding to the feature and value, or 100 if there is none.
+        """
+        if partition_value != "Not Specified":
+            feature_name = f"{feature_name}_{partition_value}"
+
+        feature = self.features.get(feature_name)
+        if feature is None or value != value:
+            return 100
+        sorted_below, suffix_min_below, sorted_above, prefix_min_above = feature
+
+        if objective == "minimise":
+            index = np.searchsorted(sorted_below, value, side="left")
+            if index < len(sorted_below):
+                return suffix_min_below[index]
+        elif objective == "maximise":
+            index = np.searchsorted(sorted_above, value, side="right")
+            if index > 0:
+                return prefix_min_above[index - 1]
+
+        return 100
+
+    def get_percentages(self, feature_name, values, objective):
+        """
+        Vectorised equivalent of `get_percentage`, for many values of the same feature.
+
+        Parameters
+        ----------
+        feature_name : str
+            The name of the feature to lookup, including any partition suffix.
+        values : array-like of float
+            The values to compare against the lookup table.
+        objective : str
+            The objective for the comparison, either 'minimise' or 'maximise'.
+
+        Returns
+        -------
+        percentages : np.ndarray
+            The percentage corresponding to each value, or 100 where there is none.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        percentages = np.full(len(values), 100.0)
+
+        feature = self.features.get(feature_name)
+        if feature is None:
+            return percentages
+        sorted_below, suffix_min_below, sorted_above, prefix_min_above = feature
+
+        found = ~np.isnan(values)
+        if objective == "minimise":
+            index = np.searchsorted(sorted_below, values, side="left")
+            found &= index < len(sorted_below)
+            percentages[found] = suffix_min_below[index[found]]
+        elif objective == "maximise":
+            index = np.searchsorted(sorted_above, values, side="right")
+            found &= index > 0
+            percentages[found] = prefix_min_above[index[found] - 1]
+
+        return percentages
+
+
+@functools.lru_cache(maxsize=4)
+def read_numeric_lookup(file_path, modified_time):
+    """
+    Reads and compiles the numeric lookup table. Results are cached per file and modification time.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the numeric lookup table CSV.
+    modified_time : float
+        The modification time of the file, used to invalidate the cache when it is rewritten.
+
+    Returns
+    -------
+    NumericLookup
+        The compiled numeric lookup table.
+    """
+    return NumericLookup(pd.read_csv(file_path))
+
+
+def load_numeric_lookup(file_path="data/variable_lookup_tables/numeric_columns.csv"):
+    """
+    Loads the compiled numeric lookup table, compiling it only when the file has changed.
+
+    Parameters
+    ----------
+    file_path : str, optional
+        The path of the numeric lookup table CSV.
+
+    Returns
+    -------
+    NumericLookup
+        The compiled numeric lookup table.
+    """
+    return read_numeric_lookup(file_path, os.path.getmtime(file_path))
+
+
 def get_feature_partition(medal_details, team_data):
     """
     Determine the partition value for a feature.
@@ -36,8 +207,8 @@ def calculate_percentage(
 
     Parameters
     ----------
-    lookup_table_numeric : pd.DataFrame
-        DataFrame containing numeric lookup data.
+    lookup_table_numeric : pd.DataFrame or NumericLookup
+        DataFrame containing numeric lookup data, or the compiled lookup table.
     feature_name : str
         The name of the feature to lookup.
     value : float
@@ -52,6 +223,14 @@ def calculate_percentage(
     float
         The percentage corresponding to the feature and value.
     """
+    if isinstance(lookup_table_numeric, NumericLookup):
+        return lookup_table_numeric.get_percentage(
+            feature_name=feature_name,
+            value=value,
+            objective=objective,
+            partition_value=partition_value,
+        )
+
     if partition_value != "Not Specified":
         feature_name = f"{feature_name}_{partition_value}"
 
@@ -98,6 +277,30 @@ def determine_medal(percentage, medal_details):
         return "No Medal"
 
 
+def is_medal_excluded(medal_details, partition_value):
+    """
+    Check whether a medal is withheld for a partition value, e.g. 'rival_team_player' for teams
+    without a favourite team or rivals.
+
+    Parameters
+    ----------
+    medal_details : dict
+        Dictionary containing medal details for a feature.
+    partition_value : str
+        The partition value for the feature.
+
+    Returns
+    -------
+    bool
+        True if no medal should be awarded.
+    """
+    if medal_details["feature_name"] == "rival_team_player":
+        return partition_value == "Not Specified" or rival_teams.get(
+            partition_value
+        ) == ["None"]
+    return False
+
+
 def apply_manual_adjustments(medal_details, value, partition_value, medal):
     """
     Apply manual adjustments for specific features like 'rival_team_player' and 'bank_mean'.
@@ -120,11 +323,8 @@ def apply_manual_adjustments(medal_details, value, partition_value, medal):
     medal : str
         Adjusted medal based on conditions like 'rival_team_player'.
     """
-    if medal_details["feature_name"] == "rival_team_player":
-        if partition_value == "Not Specified" or rival_teams.get(partition_value) == [
-            "None"
-        ]:
-            medal = "No Medal"
+    if is_medal_excluded(medal_details, partition_value):
+        medal = "No Medal"
 
     if medal_details["feature_name"] == "bank_mean":
         value = value / 10
@@ -156,76 +356,3 @@ def format_overview(medal_details, percentage, value, partition_value):
     overview = overview.replace("<value>", f'{format(value, ",")}')
     overview = overview.replace("<partition_value>", partition_value)
     return overview
-
-
-def get_numeric_medals(medal_details_numeric, lookup_table_numeric, team_data):
-    """
-    Calculate medals for numeric features based on thresholds and team data.
-
-    Parameters
-    ----------
-    medal_details_numeric : dict
-        Dictionary with medal details for numeric features including 'feature_name',
-        'objective', 'partition_feature', 'gold_threshold', 'silver_threshold',
-        'bronze_threshold', 'text', 'image_path', and 'medal_background'.
-    lookup_table_numeric : pd.DataFrame
-        DataFrame with numeric lookup data.
-    team_data : dict
-        Dictionary containing the team's data for comparison.
-
-    Returns
-    -------
-    pd.DataFrame
-        Combined DataFrame with the results including columns for 'Medal Name', 'Medal', 'Overview',
-        'image_path', and 'medal_background'.
-    """
-    medals = pd.DataFrame(
-        columns=["Medal Name", "Medal", "Overview", "image_path", "medal_background"]
-    )
-
-    for medal_name, medal_details in medal_details_numeric.items():
-        feature_name = medal_details["feature_name"]
-        objective = medal_details["objective"]
-        value = team_data.get(feature_name)
-
-        # Skip if value is None
-        if value is None:
-            continue
-
-        partition_value = get_feature_partition(medal_details, team_data)
-
-        # Calculate the percentage based on numeric lookup
-        percentage = calculate_percentage(
-            lookup_table_numeric=lookup_table_numeric,
-            feature_name=feature_name,
-            value=value,
-            objective=objective,
-            partition_value=partition_value,
-        )
-
-        # Determine the medal based on percentage
-        medal = determine_medal(percentage, medal_details)
-
-        # Apply manual adjustments for specific features
-        value, medal = apply_manual_adjustments(
-            medal_details, value, partition_value, medal
-        )
-
-        # Format the overview text with relevant details
-        overview = format_overview(medal_details, percentage, value, partition_value)
-
-        # Create a DataFrame entry for this medal and append to the medals DataFrame
-        medal_stage = pd.DataFrame(
-            [
-                {
-                    "Medal Name": medal_name,
-                    "Medal": medal,
-                    "Overview": overview,
-                    "image_path": medal_details["image_path"],
-                    "medal_background": medal_details["medal_background"],
-                }
-            ]
-        )
-        medals = pd.concat([medals, medal_stage], axis=0, ignore_index=True)
-
-    return medals
@@ -0,0 +1,181 @@
+import math
+import random
+
+import numpy as np
+
+
+class KLLSketch:
+    """
+    Mergeable streaming quantile sketch (KLL) for the distribution of a numeric column.
+
+    Values are held in a hierarchy of compactors, where an item at level `h` stands for `2**h`
+    values. When the sketch is full, the lowest full compactor is sorted and every other item is
+    promoted to the next level, so memory stays bounded at roughly `3 * k` items regardless of the
+    number of values. The sketch is exact until more than `k` values have been added.
+
+    Parameters
+    ----------
+    k : int, optional
+        The capacity of the top compactor, controlling the accuracy and size of the sketch. Default is 200.
+    seed : int, optional
+        Seed for the random choice of items kept when compacting.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.compactors = [[]]
+        self.size = 0
+        self.count = 0
+        self.random = random.Random(seed)
+        self.current_max_size = self.max_size()
+
+    def capacity(self, level):
+        """
+        Returns the number of items a compactor can hold before it is compacted.
+
+        Parameters
+        ----------
+        level : int
+            The level of the compactor.
+
+        Returns
+        -------
+        int
+            The capacity of the compactor.
+        """
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def max_size(self):
+        """
+        Returns the number of items the sketch can hold before it is compressed.
+
+        Returns
+        -------
+        int
+            The total capacity of all compactors.
+        """
+        return sum(self.capacity(level) for level in range(len(self.compactors)))
+
+    def update(self, value):
+        """
+        Adds a value to the sketch. NaN values are ignored.
+
+        Parameters
+        ----------
+        value : float
+            The value to add.
+
+        Returns
+        -------
+        None
+        """
+        if value is None or value != value:
+            return
+        self.compactors[0].append(float(value))
+        self.size += 1
+        self.count += 1
+        if self.size >= self.current_max_size:
+            self.compress_to_capacity()
+
+    def update_many(self, values):
+        """
+        Adds many values to the sketch. NaN values are ignored.
+
+        Parameters
+        ----------
+        values : array-like of float
+            The values to add.
+
+        Returns
+        -------
+        None
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.compactors[0].extend(values.tolist())
+        self.size += len(values)
+        self.count += len(values)
+        self.compress_to_capacity()
+
+    def merge(self, other):
+        """
+        Merges another sketch into this one, e.g. a sketch built by another worker.
+
+        Parameters
+        ----------
+        other : KLLSketch
+            The sketch to merge. It is not modified.
+
+        Returns
+        -------
+        None
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.size += other.size
+        self.count += other.count
+        self.current_max_size = self.max_size()
+        self.compress_to_capacity()
+
+    def compress_to_capacity(self):
+        """
+        Compresses the sketch until it holds fewer items than its total capacity.
+
+        Returns
+        -------
+        None
+        """
+        while self.size >= self.current_max_size:
+            self.compress()
+
+    def compress(self):
+        """
+        Compacts the lowest compactor that is at capacity, promoting half of its items a level up.
+
+        Returns
+        -------
+        None
+        """
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) >= self.capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+                    self.current_max_size = self.max_size()
+
+                items = sorted(self.compactors[level])
+
+                # With an odd number of items the largest stays at this level
+                remaining = [items.pop()] if len(items) % 2 == 1 else []
+                offset = self.random.randint(0, 1)
+
+                self.compactors[level + 1].extend(items[offset::2])
+                self.compactors[level] = remaining
+                self.size = sum(len(compactor) for compactor in self.compactors)
+                return
+
+    def get_weighted_values(self):
+        """
+        Returns the values held by the sketch and the number of values each one stands for.
+
+        Returns
+        -------
+        values : np.ndarray
+            The values, sorted in ascending order.
+        weights : np.ndarray
+            The weight of each value. The weights sum to the number of values added.
+        """
+        values = np.array(
+            [value for compactor in self.compactors for value in compactor],
+            dtype=np.float64,
+        )
+        weights = np.concatenate(
+            [
+                np.full(len(compactor), 2**level, dtype=np.int64)
+                for level, compactor in enumerate(self.compactors)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        return values[order], weights[order]
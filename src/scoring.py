@@ -1,9 +1,19 @@
 from src.app_tools.yaml_loader import load_yaml_file
-from src.data_prep.all_team_data import get_all_team_data
+from src.data_prep.all_team_data import get_all_team_data, process_all_team_data_batch
+from src.data_prep.async_client import run_async
+from src.data_prep.create_sample import (
+    fetch_all_data_sample,
+    fetch_all_data_sample_async,
+)
+from src.data_prep.http_client import http_config
 from src.profiling.get_medals_all_combined import get_all_medals
+from src.profiling.get_medals_batch import get_awarded_medals, get_medal_tiers_batch
+from src.profiling.get_categorical_medals import load_categorical_lookup
+from src.profiling.get_numeric_medals import load_numeric_lookup
 import pandas as pd
 from src.data_prep.load_data import get_current_season_year, get_team_data
 from src.data_prep.load_data_league import get_league_data
+from src.data_prep.player_store import load_player_stat_tensor
 import json
 
 
@@ -19,8 +29,8 @@ def get_team_medals(team_id, bootstrap_data, current_gameweek, player_data):
         Bootstrap data containing season and gameweek information.
     current_gameweek : int
         The current gameweek in the season.
-    player_data : pd.DataFrame or str
-        Player data as a DataFrame or a string indicating if the season has not started.
+    player_data : dict or str
+        The player stat tensor or a string indicating if the season has not started.
 
     Returns
     -------
@@ -39,17 +49,13 @@ def get_team_medals(team_id, bootstrap_data, current_gameweek, player_data):
     current_gameweek = training_meta["training_data_gameweek"]
 
     # Load player data
-    try:  # i.e. season has started
-        file_path = f"data/vaastav-data/player_data_{current_season_year}.csv"
-        player_data = pd.read_csv(file_path)
-    except:
-        player_data = "Season Not Started"
-
-    lookup_table_numeric = pd.read_csv(
-        "data/variable_lookup_tables/numeric_columns.csv"
+    player_data = load_player_stat_tensor(current_season_year=current_season_year)
+
+    lookup_table_numeric = load_numeric_lookup(
+        file_path="data/variable_lookup_tables/numeric_columns.csv"
     )
-    lookup_table_categorical = pd.read_csv(
-        "data/variable_lookup_tables/categorical_columns.csv"
+    lookup_table_categorical = load_categorical_lookup(
+        file_path="data/variable_lookup_tables/categorical_columns.csv"
     )
 
     team_name, team_data = get_all_team_data(
@@ -131,6 +137,8 @@ def get_league_medals(
     """
     Retrieve medal information for all teams in a specified league.
 
+    The data of all teams is fetched first, then processed and scored together in one batch.
+
     Parameters
     ----------
     league_id : int
@@ -141,8 +149,8 @@ def get_league_medals(
         Bootstrap data containing season and gameweek information.
     current_gameweek : int
         The current gameweek in the season.
-    player_data : pd.DataFrame or str
-        Player data as a DataFrame or a string indicating if the season has not started.
+    player_data : dict or str
+        The player stat tensor or a string indicating if the season has not started.
 
     Returns
     -------
@@ -156,20 +164,101 @@ def get_league_medals(
     )
     league_name = league_details["league"]["name"]
 
-    columns = ["Manager", "Team", "Medal Name", "Medal"]
-    league_medals = pd.DataFrame(columns=columns)
+    # Load metadata
+    file_path = "data/training_meta.json"
+    with open(file_path, "r") as file:
+        training_meta = json.load(file)
+    current_gameweek = training_meta["training_data_gameweek"]
 
-    for team in league_data:
-        team_id = team["entry"]
-        team_name, medals_stage = get_team_medals(
-            team_id, bootstrap_data, current_gameweek, player_data
+    # Load player data
+    current_season_year = get_current_season_year(bootstrap_data=bootstrap_data)
+    player_data = load_player_stat_tensor(current_season_year=current_season_year)
+
+    lookup_table_numeric = load_numeric_lookup(
+        file_path="data/variable_lookup_tables/numeric_columns.csv"
+    )
+    lookup_table_categorical = load_categorical_lookup(
+        file_path="data/variable_lookup_tables/categorical_columns.csv"
+    )
+
+    # Fetch the data of all teams quietly, then process it in one batch. Teams whose
+    # picks cannot be fetched get the default gameweek values, and teams whose data
+    # cannot be fetched get no medals
+    team_ids = [team["entry"] for team in league_data]
+    if http_config["engine"] == "asyncio":
+        fetched_team_data = run_async(
+            fetch_all_data_sample_async(
+                sample_ids=team_ids, current_gameweek=current_gameweek, verbose=False
+            )
         )
-        medals_stage["Manager"] = team["player_name"]
-        medals_stage["Team"] = team["entry_name"]
+    else:
+        fetched_team_data = fetch_all_data_sample(
+            sample_ids=team_ids, current_gameweek=current_gameweek, verbose=False
+        )
+
+    all_team_data = process_all_team_data_batch(
+        fetched_team_data=fetched_team_data,
+        bootstrap_data=bootstrap_data,
+        current_gameweek=current_gameweek,
+        player_data=player_data,
+    )
+
+    # Get null imputing values
+    yaml_file_path = "conf/impute_nulls.yaml"
+    impute_nulls = load_yaml_file(yaml_file_path)
+
+    # Update team_data with impute_nulls values for None entries
+    league_teams = []
+    team_data_list = []
+    for team in league_data:
+        if team["entry"] not in all_team_data:
+            continue
+        team_name, team_data = all_team_data[team["entry"]]
+        for key, value in team_data.items():
+            if value is None and key in impute_nulls:
+                team_data[key] = impute_nulls[key]
+        league_teams.append(team)
+        team_data_list.append(team_data)
+
+    # Get medal details
+    yaml_file_path = "conf/medal_details/medal_details_numeric.yaml"
+    medal_details_numeric = load_yaml_file(yaml_file_path)
+
+    yaml_file_path = "conf/medal_details/medal_details_categorical.yaml"
+    medal_details_categorical = load_yaml_file(yaml_file_path)
+
+    yaml_file_path = "conf/medal_details/medal_details_binary.yaml"
+    medal_details_binary = load_yaml_file(yaml_file_path)
 
-        medals_stage = medals_stage[["Manager", "Team", "Medal Name", "Medal"]]
+    if len(team_data_list) == 0:
+        columns = ["Manager", "Team", "Medal Name", "Medal"]
+        return league_name, pd.DataFrame(columns=columns)
 
-        league_medals = pd.concat([league_medals, medals_stage], ignore_index=True)
+    # Score all teams at once
+    medal_tiers = get_medal_tiers_batch(
+        medal_details_numeric=medal_details_numeric,
+        lookup_table_numeric=lookup_table_numeric,
+        medal_details_categorical=medal_details_categorical,
+        lookup_table_categorical=lookup_table_categorical,
+        medal_details_binary=medal_details_binary,
+        team_features=pd.DataFrame(team_data_list, dtype=object),
+    )
+    awarded_medals = get_awarded_medals(medal_tiers)
+
+    league_medals = pd.DataFrame(
+        {
+            "Manager": [
+                league_teams[team_index]["player_name"]
+                for team_index in awarded_medals["team_index"]
+            ],
+            "Team": [
+                league_teams[team_index]["entry_name"]
+                for team_index in awarded_medals["team_index"]
+            ],
+            "Medal Name": awarded_medals["Medal Name"],
+            "Medal": awarded_medals["Medal"],
+        }
+    )
 
     # Define the order of the categories
     medal_order = pd.Categorical(
@@ -0,0 +1,30 @@
+from src.data_prep.team_summary.kit import (
+    get_kit_information,
+    get_kit_information_batch,
+    summarise_kit,
+)
+
+
+def test_get_kit_information_batch():
+    json_kit = (
+        '{"kit_shirt_type": "stripes", "kit_shirt_base": "#ff0000", '
+        '"kit_shirt_logo": "badge", "kit_shorts": "#ffffff", "kit_socks_type": "plain"}'
+    )
+    # Strings that are not valid JSON are evaluated as Python literals
+    literal_kit = json_kit.replace('"', "'")
+    team_data_list = [{"kit": json_kit}, {"kit": None}, {"kit": literal_kit}]
+
+    summarise_kit.cache_clear()
+    kit_summary_data = get_kit_information_batch(team_data_list)
+
+    assert kit_summary_data["kit"] == [True, False, True]
+    assert kit_summary_data["kit_shirt_type"] == ["stripes", None, "stripes"]
+    assert kit_summary_data["kit_full"] == [True, False, True]
+    for i, team_data in enumerate(team_data_list):
+        assert get_kit_information(team_data) == {
+            column: values[i] for column, values in kit_summary_data.items()
+        }
+
+    # Identical kit strings are only parsed once
+    assert summarise_kit.cache_info().currsize == 3
+    assert summarise_kit.cache_info().hits == 3
@@ -0,0 +1,43 @@
+import math
+from src.data_prep.team_summary.yoyo_rising_score import (
+    calculate_yoyo_rising_scores,
+    calculate_yoyo_rising_scores_batch,
+)
+
+
+def test_calculate_yoyo_rising_scores():
+    team_history_data = {
+        "past": [
+            {"season_name": "2021/22", "rank": 1000},
+            {"season_name": "2019/20", "rank": 4000},
+            {"season_name": "2020/21", "rank": 2000},
+        ]
+    }
+
+    yoyo_score, rising_score = calculate_yoyo_rising_scores(team_history_data)
+
+    # Ranks in year order are 4000, 2000, 1000
+    assert yoyo_score == round((2000 + 1000) / 3, 3)
+    assert rising_score == 1500.0
+
+
+def test_calculate_yoyo_rising_scores_batch():
+    yoyo_scores, rising_scores = calculate_yoyo_rising_scores_batch(
+        years=[2020, 2021, 2019, 2019, 2022, 2023],
+        positions=[10, 30, 5, 7, 100, 50],
+        offsets=[0, 2, 2, 4, 6],
+    )
+
+    assert yoyo_scores[0] == 10.0
+    assert rising_scores[0] == -20.0
+
+    # Teams without seasons have no scores
+    assert math.isnan(yoyo_scores[1])
+    assert math.isnan(rising_scores[1])
+
+    # Seasons from the same year have no slope
+    assert yoyo_scores[2] == 1.0
+    assert rising_scores[2] == 0.0
+
+    assert yoyo_scores[3] == 25.0
+    assert rising_scores[3] == 50.0
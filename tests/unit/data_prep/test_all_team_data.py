@@ -0,0 +1,68 @@
+import pytest
+from src.data_prep import all_team_data
+from src.data_prep.all_team_data import (
+    DEFAULT_PLAYER_GAMEWEEK_TOTALS,
+    DEFAULT_SEASON_OVERVIEW,
+    process_all_team_data_batch,
+    process_teams_isolated,
+)
+
+
+def test_process_teams_isolated_leaves_out_failing_teams():
+    team_values = [1, "two", 3]
+
+    def process_teams(team_indices):
+        return {i: team_values[i] + 1 for i in team_indices}
+
+    results = process_teams_isolated(
+        process_teams=process_teams, team_indices=[0, 1, 2], team_ids=[10, 20, 30]
+    )
+
+    assert results == {0: 2, 2: 4}
+
+
+def test_process_teams_isolated_raises_other_errors():
+    def process_teams(team_indices):
+        raise RuntimeError("not a data error")
+
+    with pytest.raises(RuntimeError):
+        process_teams_isolated(
+            process_teams=process_teams, team_indices=[0], team_ids=[10]
+        )
+
+
+def test_process_all_team_data_batch_preseason(mocker, capsys):
+    mocker.patch.object(
+        all_team_data,
+        "get_team_summary_batch",
+        side_effect=lambda team_data_list, team_history_data_list: [
+            {"id": team_data["id"]} for team_data in team_data_list
+        ],
+    )
+    fetched_team_data = {
+        team_id: (
+            {"id": team_id, "name": f"Team {team_id}", "favourite_team": None},
+            {"past": [], "current": []},
+            "Season Not Started",
+        )
+        for team_id in [1, 2, 3]
+    }
+
+    processed_team_data = process_all_team_data_batch(
+        fetched_team_data=fetched_team_data,
+        bootstrap_data={"teams": []},
+        current_gameweek="Season Not Started",
+        player_data="Season Not Started",
+    )
+
+    # Teams without gameweeks get the default values without any errors
+    assert capsys.readouterr().out == ""
+    assert list(processed_team_data) == [1, 2, 3]
+    for team_id, (team_name, team_data) in processed_team_data.items():
+        assert team_name == f"Team {team_id}"
+        assert team_data == {
+            "id": team_id,
+            **DEFAULT_PLAYER_GAMEWEEK_TOTALS,
+            **DEFAULT_SEASON_OVERVIEW,
+            "favourite_team": "Not Specified",
+        }
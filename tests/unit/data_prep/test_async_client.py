@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from src.data_prep import async_client
+from src.data_prep.async_client import (
+    fetch_json_async,
+    fetch_urls_async,
+    get_async_state,
+    run_async,
+)
+
+
+@pytest.fixture
+def mock_get_response(mocker):
+    mocker.patch.object(async_client.rate_limiter, "acquire_async")
+    mocker.patch.object(async_client, "get_backoff_delay", return_value=0)
+    return mocker.patch.object(async_client, "get_response_async")
+
+
+def test_fetch_json_async_retries_on_server_error(mock_get_response):
+    mock_get_response.side_effect = [
+        (503, None, ""),
+        (429, 2.0, ""),
+        (200, None, '{"key": "value"}'),
+    ]
+
+    assert run_async(fetch_json_async("https://example.com")) == {"key": "value"}
+    assert mock_get_response.call_count == 3
+
+    # Retry-After is honoured for the second retry
+    async_client.get_backoff_delay.assert_called_with(1, 2.0)
+
+
+def test_fetch_json_async_retries_on_connection_error(mock_get_response):
+    mock_get_response.side_effect = [
+        asyncio.TimeoutError(),
+        (200, None, '{"key": "value"}'),
+    ]
+
+    assert run_async(fetch_json_async("https://example.com")) == {"key": "value"}
+
+
+def test_fetch_json_async_does_not_retry_client_error(mock_get_response):
+    mock_get_response.return_value = (404, None, "")
+
+    assert run_async(fetch_json_async("https://example.com")) is None
+    assert mock_get_response.call_count == 1
+
+
+def test_fetch_json_async_gives_up_after_max_retries(mock_get_response):
+    mock_get_response.return_value = (500, None, "")
+
+    assert run_async(fetch_json_async("https://example.com")) is None
+    assert (
+        mock_get_response.call_count
+        == async_client.http_config["max_retries"] + 1
+    )
+
+
+def test_fetch_urls_async_preserves_order(mock_get_response):
+    # Earlier URLs take longer, so they complete last
+    async def mock_get_response_async(session, url):
+        await asyncio.sleep(0.01 * (3 - int(url)))
+        if url == "2":
+            return 404, None, ""
+        return 200, None, f'{{"url": "{url}"}}'
+
+    mock_get_response.side_effect = mock_get_response_async
+
+    results = run_async(fetch_urls_async(["0", "1", "2"]))
+
+    assert results == [{"url": "0"}, {"url": "1"}, None]
+
+
+def test_run_async_closes_session():
+    async def get_session():
+        return get_async_state()[0]
+
+    session = run_async(get_session())
+
+    assert session.closed
+    assert len(async_client._loop_state) == 0
+
+
+def test_fetch_json_async_coalesces_concurrent_requests(mocker):
+    async def mock_request_json_async(url):
+        await asyncio.sleep(0.05)
+        return {"url": url}
+
+    mock_request = mocker.patch.object(
+        async_client, "request_json_async", side_effect=mock_request_json_async
+    )
+
+    async def fetch_concurrently():
+        results = await asyncio.gather(
+            *(fetch_json_async("https://a.com") for _ in range(5))
+        )
+        assert mock_request.call_count == 1
+        assert results == [{"url": "https://a.com"}] * 5
+
+        # Each caller gets its own copy of the data
+        assert len({id(result) for result in results}) == 5
+
+        # Completed requests are no longer in flight, so later requests are not
+        # coalesced with them
+        assert get_async_state()[2] == {}
+        await fetch_json_async("https://a.com")
+        assert mock_request.call_count == 2
+
+    run_async(fetch_concurrently())
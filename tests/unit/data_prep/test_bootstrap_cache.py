@@ -0,0 +1,69 @@
+import os
+import time
+import pytest
+from src.data_prep.bootstrap_cache import (
+    clear_bootstrap_cache,
+    get_cached_bootstrap_data,
+    persist_bootstrap_data,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_bootstrap_cache()
+    yield
+    clear_bootstrap_cache()
+
+
+def test_get_cached_bootstrap_data_fetches_once(tmp_path, mocker):
+    cache_path = str(tmp_path / "bootstrap_static.json")
+    fetch_function = mocker.Mock(return_value={"total_players": 1})
+
+    for _ in range(3):
+        bootstrap_data = get_cached_bootstrap_data(
+            fetch_function, ttl_seconds=60, cache_path=cache_path
+        )
+        assert bootstrap_data == {"total_players": 1}
+
+    assert fetch_function.call_count == 1
+    assert os.path.exists(cache_path)
+
+
+def test_get_cached_bootstrap_data_uses_persisted_copy(tmp_path, mocker):
+    cache_path = str(tmp_path / "bootstrap_static.json")
+    persist_bootstrap_data({"total_players": 2}, cache_path)
+    fetch_function = mocker.Mock(return_value={"total_players": 3})
+
+    bootstrap_data = get_cached_bootstrap_data(
+        fetch_function, ttl_seconds=60, cache_path=cache_path
+    )
+
+    assert bootstrap_data == {"total_players": 2}
+    assert fetch_function.call_count == 0
+
+
+def test_get_cached_bootstrap_data_refreshes_in_background(tmp_path, mocker):
+    cache_path = str(tmp_path / "bootstrap_static.json")
+    fetch_function = mocker.Mock(
+        side_effect=[{"total_players": 1}, {"total_players": 2}]
+    )
+
+    get_cached_bootstrap_data(fetch_function, ttl_seconds=0, cache_path=cache_path)
+    time.sleep(0.01)
+
+    # Stale data is served while the refresh runs
+    bootstrap_data = get_cached_bootstrap_data(
+        fetch_function, ttl_seconds=0, cache_path=cache_path
+    )
+    assert bootstrap_data == {"total_players": 1}
+
+    for _ in range(100):
+        bootstrap_data = get_cached_bootstrap_data(
+            fetch_function, ttl_seconds=60, cache_path=cache_path
+        )
+        if bootstrap_data == {"total_players": 2}:
+            break
+        time.sleep(0.01)
+
+    assert bootstrap_data == {"total_players": 2}
+    assert fetch_function.call_count == 2
@@ -0,0 +1,67 @@
+import pandas as pd
+from src.data_prep.compact_picks import (
+    build_compact_team_gw_picks,
+    stack_compact_team_gw_picks,
+    unpack_compact_picks,
+)
+from src.data_prep.load_data import TEAM_GW_PICKS_COLUMNS, build_team_gw_picks
+
+
+def test_compact_picks_round_trip():
+    def make_pick(element, position, multiplier, is_captain, is_vice_captain):
+        return {
+            "element": element,
+            "position": position,
+            "multiplier": multiplier,
+            "is_captain": is_captain,
+            "is_vice_captain": is_vice_captain,
+        }
+
+    gw_picks = {
+        1: [make_pick(5, 1, 2, True, False), make_pick(600, 12, 0, False, True)],
+        3: [make_pick(7, 15, 3, True, False)],
+    }
+
+    compact_picks = stack_compact_team_gw_picks(
+        [None, build_compact_team_gw_picks(gw_picks=gw_picks, bboost_gw=3)]
+    )
+    picks = pd.DataFrame(unpack_compact_picks(compact_picks))
+
+    assert compact_picks["element"].shape == (2, 39, 15)
+    assert list(picks["team_index"]) == [1, 1, 1]
+    pd.testing.assert_frame_equal(
+        picks[TEAM_GW_PICKS_COLUMNS],
+        build_team_gw_picks(gw_picks=gw_picks, bboost_gw=3),
+        check_dtype=False,
+    )
+
+
+def test_compact_picks_with_assistant_manager_pick():
+    # The Assistant Manager chip adds a 16th pick to the gameweek
+    gw_picks = {
+        23: [
+            {
+                "element": position,
+                "position": position,
+                "multiplier": 1,
+                "is_captain": False,
+                "is_vice_captain": False,
+            }
+            for position in range(1, 17)
+        ]
+    }
+
+    compact_picks = stack_compact_team_gw_picks(
+        [
+            build_compact_team_gw_picks(gw_picks={}, bboost_gw=None),
+            build_compact_team_gw_picks(gw_picks=gw_picks, bboost_gw=None),
+        ]
+    )
+    picks = pd.DataFrame(unpack_compact_picks(compact_picks))
+
+    assert compact_picks["element"].shape == (2, 39, 16)
+    pd.testing.assert_frame_equal(
+        picks[TEAM_GW_PICKS_COLUMNS],
+        build_team_gw_picks(gw_picks=gw_picks, bboost_gw=None),
+        check_dtype=False,
+    )
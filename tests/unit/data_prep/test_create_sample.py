@@ -0,0 +1,41 @@
+from src.data_prep import create_sample
+from src.data_prep.create_sample import fetch_all_data_sample, get_data_sample_chunks
+
+
+def test_get_data_sample_chunks_processes_sample_in_chunks(mocker):
+    mocker.patch.object(
+        create_sample, "get_sample_ids", return_value=[4, 8, 15, 16, 23]
+    )
+    mock_get_data_sample = mocker.patch.object(
+        create_sample,
+        "get_data_sample",
+        side_effect=lambda sample_ids, **kwargs: [{"id": i} for i in sample_ids],
+    )
+
+    sample_chunks = get_data_sample_chunks(
+        bootstrap_data={}, current_gameweek=10, player_data={}, chunk_size=2
+    )
+
+    # Chunks are only fetched as they are consumed
+    assert mock_get_data_sample.call_count == 0
+    assert next(sample_chunks) == [{"id": 4}, {"id": 8}]
+    assert mock_get_data_sample.call_count == 1
+    assert list(sample_chunks) == [[{"id": 15}, {"id": 16}], [{"id": 23}]]
+
+
+def test_fetch_all_data_sample_quietly_leaves_out_failing_teams(mocker, capsys):
+    def mock_fetch_all_team_data(team_id, current_gameweek, compact):
+        if team_id == 2:
+            raise KeyError("entry")
+        return {"id": team_id}, {}, None
+
+    mocker.patch.object(
+        create_sample, "fetch_all_team_data", side_effect=mock_fetch_all_team_data
+    )
+
+    fetched_team_data = fetch_all_data_sample(
+        sample_ids=[1, 2, 3], current_gameweek=10, verbose=False
+    )
+
+    assert list(fetched_team_data) == [1, 3]
+    assert capsys.readouterr().out == "Error processing team 2: 'entry'\n"
@@ -0,0 +1,127 @@
+import threading
+import time
+import pytest
+import requests
+from src.data_prep import http_client
+from src.data_prep.http_client import (
+    fetch_json,
+    get_backoff_delay,
+    parse_retry_after,
+)
+
+
+class MockResponse:
+    def __init__(self, status_code, json_data=None, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+
+@pytest.fixture
+def mock_session(mocker):
+    session = mocker.Mock()
+    mocker.patch.object(http_client, "get_session", return_value=session)
+    mocker.patch.object(http_client.time, "sleep")
+    return session
+
+
+def test_fetch_json_success(mock_session):
+    mock_session.get.return_value = MockResponse(200, {"key": "value"})
+    assert fetch_json("https://example.com") == {"key": "value"}
+    assert mock_session.get.call_count == 1
+
+
+def test_fetch_json_retries_on_server_error(mock_session):
+    mock_session.get.side_effect = [
+        MockResponse(503),
+        MockResponse(429, headers={"Retry-After": "2"}),
+        MockResponse(200, {"key": "value"}),
+    ]
+    assert fetch_json("https://example.com") == {"key": "value"}
+    assert mock_session.get.call_count == 3
+
+    # Retry-After is honoured for the second retry
+    http_client.time.sleep.assert_called_with(2.0)
+
+
+def test_fetch_json_retries_on_connection_error(mock_session):
+    mock_session.get.side_effect = [
+        requests.ConnectionError(),
+        MockResponse(200, {"key": "value"}),
+    ]
+    assert fetch_json("https://example.com") == {"key": "value"}
+
+
+def test_fetch_json_does_not_retry_client_error(mock_session):
+    mock_session.get.return_value = MockResponse(404)
+    assert fetch_json("https://example.com") is None
+    assert mock_session.get.call_count == 1
+
+
+def test_fetch_json_gives_up_after_max_retries(mock_session):
+    mock_session.get.return_value = MockResponse(500)
+    assert fetch_json("https://example.com") is None
+    assert (
+        mock_session.get.call_count == http_client.http_config["max_retries"] + 1
+    )
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected",
+    [
+        (None, None),
+        ("5", 5.0),
+        ("-1", 0.0),
+        ("not a date", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ],
+)
+def test_parse_retry_after(retry_after, expected):
+    assert parse_retry_after(retry_after) == expected
+
+
+def test_get_backoff_delay():
+    backoff_max = http_client.http_config["backoff_max"]
+
+    # Server specified delays are capped at the maximum backoff
+    assert get_backoff_delay(0, retry_after=1) == 1
+    assert get_backoff_delay(0, retry_after=backoff_max + 100) == backoff_max
+
+    # Jittered delays stay within the exponential envelope
+    for attempt in range(10):
+        delay = get_backoff_delay(attempt)
+        assert 0 <= delay <= backoff_max
+
+
+def test_fetch_json_coalesces_concurrent_requests(mocker):
+    def mock_request_json(url):
+        time.sleep(0.05)
+        return {"url": url}
+
+    mock_request = mocker.patch.object(
+        http_client, "request_json", side_effect=mock_request_json
+    )
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(fetch_json("https://a.com")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_request.call_count == 1
+    assert results == [{"url": "https://a.com"}] * 5
+
+    # Each caller gets its own copy of the data
+    assert len({id(result) for result in results}) == 5
+
+    # Later requests are not coalesced with completed ones
+    fetch_json("https://a.com")
+    assert mock_request.call_count == 2
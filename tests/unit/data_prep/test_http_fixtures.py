@@ -0,0 +1,42 @@
+import requests
+from src.data_prep import http_fixtures
+from src.data_prep.http_fixtures import (
+    ReplayAdapter,
+    load_recorded_response,
+    record_response,
+)
+
+
+def test_record_and_load_response(tmp_path):
+    fixtures_path = str(tmp_path)
+    url = "https://fantasy.premierleague.com/api/entry/1/"
+
+    # Missing fixtures are replayed as not found
+    assert load_recorded_response(url, fixtures_path) == (404, "")
+
+    record_response(url, 200, '{"id": 1}', fixtures_path)
+    assert load_recorded_response(url, fixtures_path) == (200, '{"id": 1}')
+
+    # Transient errors are not recorded
+    record_response(url, 503, "", fixtures_path)
+    assert load_recorded_response(url, fixtures_path) == (200, '{"id": 1}')
+
+
+def test_replay_adapter(tmp_path, mocker):
+    fixtures_path = str(tmp_path)
+    url = "https://fantasy.premierleague.com/api/entry/1/"
+    record_response(url, 200, '{"id": 1}', fixtures_path)
+
+    session = requests.Session()
+    session.mount("https://", ReplayAdapter(fixtures_path=fixtures_path))
+
+    response = session.get(url)
+    assert response.ok
+    assert response.json() == {"id": 1}
+
+    # Injected errors
+    mocker.patch.dict(
+        http_fixtures.fixtures_config,
+        {"replay_error_rate": 1.0, "replay_error_status": 503},
+    )
+    assert session.get(url).status_code == 503
@@ -0,0 +1,109 @@
+import time
+import pandas as pd
+from src.data_prep import load_data
+from src.data_prep.load_data import (
+    build_team_gw_picks,
+    combine_team_gw_picks,
+    fetch_urls_concurrently,
+    get_team_event_urls,
+    update_player_data,
+)
+from src.data_prep.player_store import PLAYER_STAT_COLUMNS
+
+
+def test_fetch_urls_concurrently_preserves_order(mocker):
+    # Earlier URLs take longer, so they complete last
+    def mock_fetch_url(url):
+        time.sleep(0.01 * (3 - int(url)))
+        return None if url == "2" else {"url": url}
+
+    mocker.patch.object(load_data, "fetch_url", side_effect=mock_fetch_url)
+
+    results = fetch_urls_concurrently(["0", "1", "2", "1"], max_workers=2)
+
+    assert list(results) == ["0", "1", "2"]
+    assert results == {"0": {"url": "0"}, "1": {"url": "1"}, "2": None}
+
+
+def test_build_team_gw_picks():
+    gw_picks = {
+        2: [{"element": 5, "position": 1, "multiplier": 2}],
+        1: [{"element": 3, "position": 12, "multiplier": 0}],
+    }
+
+    team_gw_picks = build_team_gw_picks(gw_picks=gw_picks, bboost_gw=2)
+
+    assert list(team_gw_picks["GW"]) == [1, 2]
+    assert list(team_gw_picks["element"]) == [3, 5]
+    assert list(team_gw_picks["bboost"]) == [0, 1]
+    assert list(team_gw_picks.columns) == load_data.TEAM_GW_PICKS_COLUMNS
+
+
+def test_get_team_event_urls_fetches_gameweeks_missing_from_cache():
+    cached_picks = {1: [], 3: []}
+
+    team_event_urls = get_team_event_urls(
+        team_id=10, cached_picks=cached_picks, current_gameweek=4
+    )
+
+    assert list(team_event_urls) == [2, 4]
+    assert team_event_urls[2] == (
+        "https://fantasy.premierleague.com/api/entry/10/event/2/picks/"
+    )
+
+
+def test_combine_team_gw_picks_stores_finished_gameweeks(mocker):
+    mock_store_picks = mocker.patch.object(load_data, "store_picks")
+    cached_picks = {1: [{"element": 3, "position": 1, "multiplier": 1}]}
+
+    team_gw_picks = combine_team_gw_picks(
+        team_id=10,
+        bboost_gw=None,
+        cached_picks=cached_picks,
+        current_gameweek=3,
+        gameweeks=[2, 3],
+        team_gw_data=[
+            {"picks": [{"element": 5, "position": 1, "multiplier": 1}]},
+            {"picks": [{"element": 7, "position": 1, "multiplier": 1}]},
+        ],
+    )
+
+    # The current gameweek may still be live, so is not stored
+    mock_store_picks.assert_called_once_with(
+        team_id=10, gw_picks={2: [{"element": 5, "position": 1, "multiplier": 1}]}
+    )
+    assert list(team_gw_picks["GW"]) == [1, 2, 3]
+
+
+def test_update_player_data_fetches_from_stored_gameweek(mocker):
+    def make_player_data(gameweeks, goals_scored):
+        return pd.DataFrame(
+            {
+                "element": 1,
+                "GW": gameweeks,
+                "team": "Arsenal",
+                "position": "MID",
+                **{column: goals_scored for column in PLAYER_STAT_COLUMNS},
+            }
+        )
+
+    mocker.patch.object(
+        load_data, "load_player_data", return_value=make_player_data([1, 2], 0)
+    )
+    published = {2: make_player_data([2], 5), 3: make_player_data([3], 7)}
+    mock_get_player_gw_data = mocker.patch.object(
+        load_data,
+        "get_player_gw_data",
+        side_effect=lambda current_season_year, gameweek: published.get(gameweek),
+    )
+
+    player_data, current_gameweek = update_player_data(current_season_year="2024-25")
+
+    # Only the latest stored gameweek onwards is downloaded, stopping at the first unpublished one
+    fetched_gameweeks = [
+        call.kwargs["gameweek"] for call in mock_get_player_gw_data.call_args_list
+    ]
+    assert fetched_gameweeks == [2, 3, 4]
+    assert current_gameweek == 3
+    assert list(player_data["GW"]) == [1, 2, 3]
+    assert list(player_data["goals_scored"]) == [0, 5, 7]
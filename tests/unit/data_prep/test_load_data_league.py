@@ -0,0 +1,89 @@
+from src.data_prep import load_data_league
+from src.data_prep.load_data_league import get_league_pages, trim_league_pages
+
+
+def create_page(page, has_next, results=None):
+    if results is None:
+        results = [{"entry": page}]
+    return {"standings": {"has_next": has_next, "page": page, "results": results}}
+
+
+def test_trim_league_pages():
+    all_results = [create_page(1, True)]
+    next_pages = [
+        create_page(2, True),
+        create_page(3, False),
+        create_page(4, True),
+    ]
+    trimmed = trim_league_pages(all_results, next_pages, "standings")
+    assert [page["standings"]["page"] for page in trimmed] == [1, 2, 3]
+
+    # Stops at failed or empty pages
+    next_pages = [create_page(2, True), None, create_page(4, False)]
+    trimmed = trim_league_pages(all_results, next_pages, "standings")
+    assert [page["standings"]["page"] for page in trimmed] == [1, 2]
+
+    next_pages = [create_page(2, True, results=[]), create_page(3, False)]
+    trimmed = trim_league_pages(all_results, next_pages, "standings")
+    assert [page["standings"]["page"] for page in trimmed] == [1]
+
+
+def test_get_league_pages(mocker):
+    pages = {page: create_page(page, page < 3) for page in range(1, 7)}
+
+    def mock_fetch_url(url):
+        return pages[int(url.split("=")[-1])]
+
+    def mock_fetch_urls_concurrently(urls):
+        return {url: mock_fetch_url(url) for url in urls}
+
+    mocker.patch.object(load_data_league, "fetch_url", side_effect=mock_fetch_url)
+    mock_concurrent = mocker.patch.object(
+        load_data_league,
+        "fetch_urls_concurrently",
+        side_effect=mock_fetch_urls_concurrently,
+    )
+
+    all_results = get_league_pages(1, "page_standings", "standings", page_limit=6)
+
+    assert [page["standings"]["page"] for page in all_results] == [1, 2, 3]
+
+    # The league ends within the first wave of pages after the first
+    assert mock_concurrent.call_count == 1
+    assert len(mock_concurrent.call_args[0][0]) == 4
+
+
+def test_get_league_pages_fetches_in_waves(mocker):
+    pages = {page: create_page(page, page < 5) for page in range(1, 11)}
+
+    def mock_fetch_url(url):
+        return pages[int(url.split("=")[-1])]
+
+    def mock_fetch_urls_concurrently(urls):
+        return {url: mock_fetch_url(url) for url in urls}
+
+    mocker.patch.object(load_data_league, "LEAGUE_PAGES_PER_WAVE", 2)
+    mocker.patch.object(load_data_league, "fetch_url", side_effect=mock_fetch_url)
+    mock_concurrent = mocker.patch.object(
+        load_data_league,
+        "fetch_urls_concurrently",
+        side_effect=mock_fetch_urls_concurrently,
+    )
+
+    all_results = get_league_pages(1, "page_standings", "standings", page_limit=10)
+
+    assert [page["standings"]["page"] for page in all_results] == [1, 2, 3, 4, 5]
+
+    # Pages are requested in waves, stopping after the wave with the last page
+    requested_pages = [
+        [int(url.split("=")[-1]) for url in call.args[0]]
+        for call in mock_concurrent.call_args_list
+    ]
+    assert requested_pages == [[2, 3], [4, 5]]
+
+    # No more pages are requested than the page limit
+    mock_concurrent.reset_mock()
+    all_results = get_league_pages(1, "page_standings", "standings", page_limit=4)
+
+    assert [page["standings"]["page"] for page in all_results] == [1, 2, 3, 4]
+    assert mock_concurrent.call_count == 2
@@ -0,0 +1,27 @@
+from src.data_prep.picks_cache import load_cached_picks, store_picks
+
+
+def test_store_and_load_picks(tmp_path):
+    cache_path = str(tmp_path / "picks_cache.sqlite")
+    gw_picks = {
+        1: [{"element": 1, "position": 1, "multiplier": 1}],
+        2: [{"element": 2, "position": 12, "multiplier": 0}],
+    }
+
+    # Empty cache
+    assert load_cached_picks(team_id=10, max_gameweek=38, cache_path=cache_path) == {}
+
+    store_picks(team_id=10, gw_picks=gw_picks, cache_path=cache_path)
+
+    assert (
+        load_cached_picks(team_id=10, max_gameweek=38, cache_path=cache_path)
+        == gw_picks
+    )
+
+    # Gameweeks after the requested maximum are not returned
+    assert load_cached_picks(team_id=10, max_gameweek=1, cache_path=cache_path) == {
+        1: gw_picks[1]
+    }
+
+    # Other teams are unaffected
+    assert load_cached_picks(team_id=11, max_gameweek=38, cache_path=cache_path) == {}
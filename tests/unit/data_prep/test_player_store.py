@@ -0,0 +1,66 @@
+import pandas as pd
+import numpy as np
+from src.data_prep.player_store import (
+    PLAYER_STAT_COLUMNS,
+    PLAYER_STORE_COLUMNS,
+    PLAYER_TENSOR_ARRAYS,
+    build_player_stat_tensor,
+    read_player_stat_tensor,
+    read_player_store,
+    write_player_stat_tensor,
+    write_player_store,
+)
+
+
+def test_write_and_read_player_store(tmp_path):
+    file_path = str(tmp_path / "player_data.npz")
+    player_data = pd.DataFrame(
+        {
+            "name": ["Player A", "Player B", "Player A"],
+            "element": [1, 2, 1],
+            "GW": [1, 1, 2],
+            "team": ["Arsenal", "Spurs", "Arsenal"],
+            "position": ["MID", "GK", "MID"],
+            "kickoff_time": ["2024-08-17T14:00:00Z"] * 3,
+            **{column: [1, -2, 3] for column in PLAYER_STAT_COLUMNS},
+        }
+    )
+
+    write_player_store(player_data, file_path)
+    stored_player_data = read_player_store(file_path, modified_time=0)
+
+    # Unused columns are pruned
+    assert list(stored_player_data.columns) == PLAYER_STORE_COLUMNS
+
+    pd.testing.assert_frame_equal(
+        stored_player_data.astype({"team": str, "position": str}),
+        player_data[PLAYER_STORE_COLUMNS],
+        check_dtype=False,
+    )
+
+
+def test_write_and_read_player_stat_tensor(tmp_path):
+    dir_path = str(tmp_path / "player_tensor")
+    player_data = pd.DataFrame(
+        {
+            "element": [1, 1, 2],
+            "GW": [1, 1, 2],
+            "team": ["Arsenal", "Arsenal", "Spurs"],
+            "position": ["MID", "MID", "GK"],
+            **{column: [1, 2, 3] for column in PLAYER_STAT_COLUMNS},
+        }
+    )
+    player_stat_tensor = build_player_stat_tensor(player_data)
+
+    write_player_stat_tensor(player_stat_tensor, dir_path)
+    stored_player_stat_tensor = read_player_stat_tensor(dir_path, modified_time=0)
+
+    for name in PLAYER_TENSOR_ARRAYS:
+        assert isinstance(stored_player_stat_tensor[name], np.memmap)
+        np.testing.assert_array_equal(
+            stored_player_stat_tensor[name], player_stat_tensor[name]
+        )
+
+    # Double gameweek rows are summed
+    assert stored_player_stat_tensor["stats"][1, 1, 0] == 3
+    assert stored_player_stat_tensor["fixtures"][1, 1] == 2
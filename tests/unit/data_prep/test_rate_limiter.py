@@ -0,0 +1,53 @@
+import pytest
+from src.data_prep.rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def token_bucket():
+    return TokenBucket(
+        requests_per_second=10,
+        burst=2,
+        min_requests_per_second=1,
+        backoff_multiplier=0.5,
+        recovery_per_success=1,
+    )
+
+
+def test_reserve_allows_burst_then_waits(token_bucket, mocker):
+    mocker.patch("src.data_prep.rate_limiter.time.monotonic", return_value=100.0)
+    token_bucket.updated_at = 100.0
+
+    assert token_bucket.reserve() == 0
+    assert token_bucket.reserve() == 0
+
+    # Queued callers wait for successive tokens
+    assert token_bucket.reserve() == pytest.approx(0.1)
+    assert token_bucket.reserve() == pytest.approx(0.2)
+
+
+def test_reserve_refills_over_time(token_bucket, mocker):
+    monotonic = mocker.patch("src.data_prep.rate_limiter.time.monotonic")
+    monotonic.return_value = 100.0
+    token_bucket.updated_at = 100.0
+    token_bucket.tokens = 0
+
+    monotonic.return_value = 100.2
+    assert token_bucket.reserve() == 0
+
+    # Refills are capped at the burst size
+    monotonic.return_value = 200.0
+    assert token_bucket.reserve() == 0
+    assert token_bucket.tokens == pytest.approx(1)
+
+
+def test_rate_adapts_to_rate_limiting(token_bucket):
+    token_bucket.on_rate_limited()
+    assert token_bucket.rate == 5
+
+    for _ in range(10):
+        token_bucket.on_rate_limited()
+    assert token_bucket.rate == 1
+
+    for _ in range(20):
+        token_bucket.on_success()
+    assert token_bucket.rate == 10
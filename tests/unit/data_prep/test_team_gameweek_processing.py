@@ -0,0 +1,141 @@
+import pandas as pd
+from src.data_prep.player_store import PLAYER_STAT_COLUMNS, build_player_stat_tensor
+from src.data_prep.team_gameweek_processing import (
+    get_player_gameweek_totals,
+    get_player_gameweek_totals_batch,
+    get_season_gameweek_overview,
+    get_season_gameweek_overview_batch,
+)
+
+
+def test_get_player_gameweek_totals_double_gameweek():
+    # Player 1 has two fixtures in gameweek 2
+    player_data = pd.DataFrame(
+        {
+            "element": [1, 1, 1, 2, 2],
+            "GW": [1, 2, 2, 1, 2],
+            "team": ["Arsenal", "Arsenal", "Arsenal", "Spurs", "Spurs"],
+            "position": ["MID"] * 5,
+            **{column: [1, 2, 3, 10, 20] for column in PLAYER_STAT_COLUMNS},
+        }
+    )
+    team_gw_picks = pd.DataFrame(
+        {
+            "element": [1, 2, 1, 2, 3],
+            "position": [1, 12, 1, 12, 2],
+            "multiplier": [1, 0, 1, 1, 1],
+            "is_captain": [False] * 5,
+            "is_vice_captain": [False] * 5,
+            "GW": [1, 1, 2, 2, 2],
+            "bboost": [0, 0, 1, 1, 1],
+        }
+    )
+    rival_teams = {"Arsenal": ["Spurs"]}
+
+    player_gameweek_totals = get_player_gameweek_totals(
+        player_data=build_player_stat_tensor(player_data),
+        team_gw_picks=team_gw_picks,
+        favourite_team="Arsenal",
+        rival_teams=rival_teams,
+    )
+
+    # Starters are player 1 in gameweek 1 and all picks in the bench boost gameweek 2
+    assert player_gameweek_totals["goals_scored"] == 1 + 2 + 3 + 20
+    assert player_gameweek_totals["total_players_starters"] == 4
+    assert player_gameweek_totals["total_players_all"] == 5
+    assert player_gameweek_totals["rival_team_player"] == 2
+    assert player_gameweek_totals["rival_team_player_categorical"] == "Picked Rivals"
+
+    # DataFrames of player data give the same result
+    assert player_gameweek_totals == get_player_gameweek_totals(
+        player_data=player_data,
+        team_gw_picks=team_gw_picks,
+        favourite_team="Arsenal",
+        rival_teams=rival_teams,
+    )
+
+
+def test_get_player_gameweek_totals_batch_matches_single_team():
+    player_data = pd.DataFrame(
+        {
+            "element": [1, 1, 2, 3],
+            "GW": [1, 1, 1, 1],
+            "team": ["Arsenal", "Arsenal", "Spurs", "Chelsea"],
+            "position": ["MID"] * 4,
+            **{column: [1, 2, 3, 4] for column in PLAYER_STAT_COLUMNS},
+        }
+    )
+    team_gw_picks = pd.DataFrame(
+        {
+            "team_index": [0, 0, 1, 1, 2],
+            "element": [1, 2, 2, 3, 1],
+            "position": [1, 12, 1, 2, 1],
+            "multiplier": [1, 0, 1, 1, 1],
+            "is_captain": [False] * 5,
+            "is_vice_captain": [False] * 5,
+            "GW": [1, 1, 1, 1, 1],
+            "bboost": [0] * 5,
+        }
+    )
+    # The last team has no rivals listed, so it is left out like a failed single team
+    favourite_teams = ["Arsenal", "Not Specified", "Unknown"]
+    rival_teams = {"Arsenal": ["Spurs"]}
+
+    player_gameweek_totals = get_player_gameweek_totals_batch(
+        player_data=player_data,
+        team_gw_picks=team_gw_picks,
+        favourite_teams=favourite_teams,
+        rival_teams=rival_teams,
+    )
+
+    assert list(player_gameweek_totals.index) == [0, 1]
+    for team_index in [0, 1]:
+        assert player_gameweek_totals.loc[team_index].to_dict() == (
+            get_player_gameweek_totals(
+                player_data=player_data,
+                team_gw_picks=team_gw_picks[team_gw_picks["team_index"] == team_index],
+                favourite_team=favourite_teams[team_index],
+                rival_teams=rival_teams,
+            )
+        )
+
+
+def test_get_season_gameweek_overview_batch_matches_single_team():
+    columns = [
+        "event",
+        "points_on_bench",
+        "event_transfers",
+        "event_transfers_cost",
+        "bank",
+        "value",
+        "total_points",
+    ]
+    team_history_data = [
+        {
+            "current": [
+                dict(zip(columns, [1, 4, 0, 0, 5, 1000, 50])),
+                dict(zip(columns, [2, 7, 2, 4, 2, 1005, 110])),
+                dict(zip(columns, [3, 1, 1, 0, 0, 1010, 170])),
+            ]
+        },
+        # Teams without points are left out like a failed single team
+        {"current": [dict(zip(columns, [2, 0, 0, 0, 0, 1000, 0]))]},
+    ]
+    team_history = pd.DataFrame(
+        [
+            {**gameweek, "team_index": team_index}
+            for team_index, history in enumerate(team_history_data)
+            for gameweek in history["current"]
+        ]
+    )
+
+    current_season_overview_output = get_season_gameweek_overview_batch(
+        team_history=team_history, current_gameweek=2
+    )
+
+    assert list(current_season_overview_output.index) == [0]
+    assert current_season_overview_output.loc[0].to_dict() == (
+        get_season_gameweek_overview(
+            team_history_data=team_history_data[0], current_gameweek=2
+        )
+    )
@@ -0,0 +1,37 @@
+import math
+from src.data_prep.team_summary_processing import (
+    process_team_history,
+    process_team_history_batch,
+)
+
+
+def test_process_team_history_batch_matches_single_team():
+    team_past_data = [
+        [
+            {"season_name": "2019/20", "rank": 5000, "total_points": 2100},
+            {"season_name": "2022/23", "rank": 1000, "total_points": 2300},
+            {"season_name": "2020/21", "rank": 3000, "total_points": 2000},
+        ],
+        [],
+        [{"season_name": "2023/24", "rank": 200, "total_points": 2500}],
+    ]
+
+    team_summary_history_data = process_team_history_batch(team_past_data)
+
+    assert team_summary_history_data[0] == process_team_history(
+        {"past": team_past_data[0]}
+    )
+    assert team_summary_history_data[0]["career_break_history"] == 3.0
+    assert team_summary_history_data[1] == process_team_history({"past": []})
+
+    # A single season has no career break or scores
+    assert math.isnan(team_summary_history_data[2].pop("career_break_history"))
+    assert team_summary_history_data[2] == {
+        "min_rank_history": 200,
+        "max_rank_history": 200,
+        "max_total_points_history": 2500,
+        "earliest_season_year_history": 2023,
+        "seasons_played_in": 1,
+        "yoyo_score": None,
+        "rising_score": None,
+    }
@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from src.profiling.create_lookup_tables import (
+    COLUMN_DATA_TYPES,
+    LOOKUP_TABLE_CATEGORICAL_COLUMNS,
+    LOOKUP_TABLE_NUMERIC_COLUMNS,
+    create_distribution_table_numeric,
+    create_lookup_table_numeric,
+    create_lookup_tables_aggregated,
+    create_lookup_tables_from_sketch,
+    create_lookup_tables_numeric,
+    create_lookup_tables_numeric_partitioned,
+    merge_profile_sketches,
+    update_profile_sketch,
+)
+
+
+def test_create_lookup_tables_numeric_matches_distribution_tables():
+    df = pd.DataFrame(
+        {
+            "points": [10, 50, 20, 20, 90, 50, 50, 5, np.nan, 70],
+            "rank": [3.5, 1.25, 2.0, np.nan, 2.0, 9.75, 4.0, 4.0, 0.5, 1.25],
+            "empty": [np.nan] * 10,
+        }
+    )
+
+    lookup_tables = create_lookup_tables_numeric(
+        df=df, column_names=["points", "rank", "empty"]
+    )
+
+    # Columns without values have no lookup table
+    assert list(lookup_tables) == ["points", "rank"]
+    for column_name, lookup_table in lookup_tables.items():
+        distribution_table = create_distribution_table_numeric(df, column_name)
+        pd.testing.assert_frame_equal(
+            lookup_table,
+            create_lookup_table_numeric(distribution_table, column_name),
+        )
+
+
+def test_create_lookup_tables_numeric_partitioned_by_many_columns():
+    df = pd.DataFrame(
+        {
+            "points": [10, 50, 20, 20, 90, 50, np.nan, 5, 30, 70],
+            "team": [2, 1, 2, np.nan, 1, 2, 1, 2, 1, 1],
+            "region": ["b", "a", "b", "a", "a", "a", "b", "b", "a", "a"],
+        }
+    )
+
+    lookup_table = create_lookup_tables_numeric_partitioned(
+        df=df, column_name="points", partition_columns=["team", "region"]
+    )
+
+    # Partitions are in order of first appearance, without missing partition values
+    expected_tables = [
+        create_lookup_tables_numeric(
+            df=df[(df["team"] == team) & (df["region"] == region)],
+            column_names=["points"],
+        )["points"].assign(column_name=f"points_{team}_{region}")
+        for team, region in [(2.0, "b"), (1.0, "a"), (2.0, "a")]
+    ]
+    pd.testing.assert_frame_equal(
+        lookup_table, pd.concat(expected_tables, ignore_index=True)
+    )
+
+
+def test_create_lookup_tables_from_sketch_matches_aggregated():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({column_name: [np.nan] * 60 for column_name in COLUMN_DATA_TYPES})
+    df["total_points_latest"] = rng.integers(0, 2500, size=60).astype(float)
+    df["value_latest"] = rng.normal(1000, 20, size=60).round(1)
+    df["favourite_team"] = rng.choice([1.0, 2.0, np.nan], size=60)
+    df["rival_team_player"] = rng.integers(0, 3, size=60).astype(float)
+    df["kit"] = rng.choice([True, False], size=60)
+
+    # Split the teams between two workers, adding each team to a sketch in turn
+    profile_sketch = {}
+    other_profile_sketch = {}
+    for team_data in df.iloc[:30].to_dict("records"):
+        update_profile_sketch(profile_sketch, team_data, impute_nulls={})
+    for team_data in df.iloc[30:].to_dict("records"):
+        update_profile_sketch(other_profile_sketch, team_data, impute_nulls={})
+    merge_profile_sketches(profile_sketch, other_profile_sketch)
+
+    lookup_table_numeric, lookup_table_categorical = create_lookup_tables_from_sketch(
+        profile_sketch
+    )
+    expected_numeric, expected_categorical = create_lookup_tables_aggregated(
+        df=df, impute_nulls={}
+    )
+
+    # Sketches are exact while they hold no more than k values
+    pd.testing.assert_frame_equal(
+        lookup_table_numeric.reset_index(drop=True),
+        expected_numeric.reset_index(drop=True),
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        lookup_table_categorical.reset_index(drop=True),
+        expected_categorical.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_profile_sketch_is_reproducible_with_seed():
+    rng = np.random.default_rng(0)
+    teams = [
+        {"total_points_latest": value}
+        for value in rng.integers(0, 2500, size=200).astype(float)
+    ]
+
+    def create_lookup_table(seed):
+        profile_sketch = {}
+        other_profile_sketch = {}
+        for team_data in teams[:100]:
+            update_profile_sketch(
+                profile_sketch, team_data, impute_nulls={}, k=20, seed=seed
+            )
+        for team_data in teams[100:]:
+            update_profile_sketch(
+                other_profile_sketch, team_data, impute_nulls={}, k=20, seed=seed + 1
+            )
+        merge_profile_sketches(profile_sketch, other_profile_sketch, seed=seed)
+        return create_lookup_tables_from_sketch(profile_sketch)[0]
+
+    # Sketches compacting more than k values give the same tables for the same seed
+    pd.testing.assert_frame_equal(create_lookup_table(4), create_lookup_table(4))
+
+
+def test_create_lookup_tables_from_empty_sketch():
+    lookup_table_numeric, lookup_table_categorical = create_lookup_tables_from_sketch(
+        {}
+    )
+
+    assert len(lookup_table_numeric) == 0
+    assert list(lookup_table_numeric.columns) == LOOKUP_TABLE_NUMERIC_COLUMNS
+    assert len(lookup_table_categorical) == 0
+    assert list(lookup_table_categorical.columns) == LOOKUP_TABLE_CATEGORICAL_COLUMNS
@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+from src.profiling.get_categorical_medals import (
+    CategoricalLookup,
+    team_medal_categorical,
+)
+
+
+@pytest.mark.parametrize(
+    "feature_name, value, expected",
+    [
+        ("kit", True, (75, 2.0, 1.0)),
+        ("kit", "False", (25, 1.0, 2.0)),
+        # Values missing from the training data get the column's lowest rank
+        ("favourite_team", "Fulham", (1, 2.0, 1.0)),
+    ],
+)
+def test_categorical_lookup_matches_lookup_table(feature_name, value, expected):
+    lookup_table_categorical = pd.DataFrame(
+        {
+            "column_name": ["kit", "kit", "favourite_team", "favourite_team"],
+            "value": ["True", "False", "Arsenal", "Chelsea"],
+            "percentage_share": [0.75, 0.25, 0.6, 0.4],
+            "rank_ascending": [2.0, 1.0, 2.0, 1.0],
+            "rank_descending": [1.0, 2.0, 1.0, 2.0],
+        }
+    )
+
+    assert (
+        team_medal_categorical(lookup_table_categorical, feature_name, value)
+        == expected
+    )
+    assert (
+        team_medal_categorical(
+            CategoricalLookup(lookup_table_categorical), feature_name, value
+        )
+        == expected
+    )
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+from src.profiling.get_medals_all_combined import get_all_medals
+from src.profiling.get_medals_batch import get_awarded_medals, get_medal_tiers_batch
+
+
+def test_get_medal_tiers_batch_matches_get_all_medals():
+    def make_medal(**medal_details):
+        return {
+            "gold_threshold": 10,
+            "silver_threshold": 20,
+            "bronze_threshold": 30,
+            "text": "<percentage>",
+            "image_path": "image.png",
+            "medal_background": "background",
+            **medal_details,
+        }
+
+    medal_details_numeric = {
+        "Points": make_medal(feature_name="points", objective="maximise"),
+        "Bench": make_medal(feature_name="bench", objective="minimise"),
+    }
+    medal_details_categorical = {"Region": make_medal(feature_name="region")}
+    medal_details_binary = {"Kit": make_medal(feature_name="kit", gold_values=True)}
+    medal_details_special = {"Harry Kane Award": make_medal()}
+
+    percentages = np.arange(100, 0, -5)
+    lookup_table_numeric = pd.DataFrame(
+        {
+            "column_name": ["points"] * 20 + ["bench"] * 20,
+            "percentage": np.concatenate([percentages, percentages]),
+            "interpolated_value_above": np.concatenate(
+                [np.linspace(0, 100, 20), np.linspace(0, 10, 20)]
+            ),
+            "interpolated_value_below": np.concatenate(
+                [np.linspace(100, 0, 20), np.linspace(10, 0, 20)]
+            ),
+        }
+    )
+    lookup_table_categorical = pd.DataFrame(
+        {
+            "column_name": ["region", "region", "kit", "kit"],
+            "value": ["England", "Wales", "True", "False"],
+            "percentage_share": [0.85, 0.15, 0.3, 0.7],
+            "rank_ascending": [2.0, 1.0, 1.0, 2.0],
+            "rank_descending": [1.0, 2.0, 2.0, 1.0],
+        }
+    )
+    teams = [
+        {"points": 99.0, "bench": 9.0, "region": "England", "kit": False},
+        {"points": 20.0, "bench": 0.5, "region": "Wales", "kit": True},
+        {"points": None, "bench": np.nan, "region": "Chile", "kit": False},
+    ]
+
+    medal_tiers = get_medal_tiers_batch(
+        medal_details_numeric=medal_details_numeric,
+        lookup_table_numeric=lookup_table_numeric,
+        medal_details_categorical=medal_details_categorical,
+        lookup_table_categorical=lookup_table_categorical,
+        medal_details_binary=medal_details_binary,
+        team_features=pd.DataFrame(teams, dtype=object),
+    )
+
+    assert medal_tiers.to_dict(orient="records") == [
+        {
+            "Harry Kane Award": None,
+            "Points": "Gold",
+            "Bench": "No Medal",
+            "Region": "No Medal",
+            "Kit": "No Medal",
+        },
+        {
+            "Harry Kane Award": None,
+            "Points": "No Medal",
+            "Bench": "Gold",
+            "Region": "Silver",
+            "Kit": "Gold",
+        },
+        {
+            "Harry Kane Award": None,
+            "Points": None,
+            "Bench": "No Medal",
+            "Region": "Gold",
+            "Kit": "No Medal",
+        },
+    ]
+
+    # The awarded medals are the same as scoring each team on its own
+    awarded_medals = get_awarded_medals(medal_tiers)
+    for team_index, team_data in enumerate(teams):
+        medals = get_all_medals(
+            medal_details_numeric=medal_details_numeric,
+            lookup_table_numeric=lookup_table_numeric,
+            medal_details_categorical=medal_details_categorical,
+            lookup_table_categorical=lookup_table_categorical,
+            medal_details_binary=medal_details_binary,
+            medal_details_special=medal_details_special,
+            team_data=team_data,
+        )
+        team_medals = awarded_medals[awarded_medals["team_index"] == team_index]
+        assert sorted(zip(medals["Medal Name"], medals["Medal"].astype(str))) == sorted(
+            zip(team_medals["Medal Name"], team_medals["Medal"])
+        )
@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 from src.profiling.get_numeric_medals import (
+    NumericLookup,
     get_feature_partition,
     calculate_percentage,
     determine_medal,
@@ -53,6 +54,18 @@ def test_calculate_percentage(
         == expected
     )
 
+    # The compiled lookup table gives the same percentage
+    assert (
+        calculate_percentage(
+            NumericLookup(lookup_table_numeric),
+            feature_name,
+            value,
+            objective,
+            partition_value,
+        )
+        == expected
+    )
+
 
 @pytest.mark.parametrize(
     "percentage, medal_details, expected_medal",
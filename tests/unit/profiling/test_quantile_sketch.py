@@ -0,0 +1,26 @@
+import numpy as np
+from src.profiling.quantile_sketch import KLLSketch
+
+
+def test_kll_sketch_merge_keeps_count_and_bounds_rank_error():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=20000)
+
+    sketch = KLLSketch(k=200, seed=0)
+    other_sketch = KLLSketch(k=200, seed=1)
+    sketch.update_many(values[:10000])
+    for value in values[10000:]:
+        other_sketch.update(value)
+    other_sketch.update(np.nan)
+    sketch.merge(other_sketch)
+
+    sketch_values, weights = sketch.get_weighted_values()
+
+    # Memory is bounded while the weights still account for every value
+    assert sketch.size < 1000
+    assert weights.sum() == sketch.count == len(values)
+
+    # The rank of each sketch quantile is close to its true rank
+    quantiles = np.cumsum(weights) / weights.sum()
+    true_quantiles = np.searchsorted(np.sort(values), sketch_values, side="right")
+    assert np.max(np.abs(true_quantiles / len(values) - quantiles)) < 0.03